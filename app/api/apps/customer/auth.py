@@ -1,12 +1,15 @@
 """Customer authentication endpoints"""
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, EmailStr
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, exists
+from sqlalchemy.orm import undefer
 
 from app.core.deps import get_session
 from app.core.security import hash_password, verify_password, create_access_token
 from app.models.user import User, UserRole
+from app.schemas.auth import NewPassword
 
 router = APIRouter()
 
@@ -16,7 +19,7 @@ class RegisterRequest(BaseModel):
     phone: str | None = None
     first_name: str
     last_name: str
-    password: str
+    password: NewPassword
 
 
 class LoginRequest(BaseModel):
@@ -44,15 +47,9 @@ async def register_customer(
             detail="Email or phone is required"
         )
 
-    # Check if user already exists
-    query = select(User)
-    if data.email:
-        query = query.where(User.email == data.email)
-    else:
-        query = query.where(User.phone == data.phone)
-
-    existing = await session.execute(query)
-    if existing.scalar_one_or_none():
+    # Check if user already exists (EXISTS stops at the first match)
+    taken = User.email == data.email if data.email else User.phone == data.phone
+    if await session.scalar(select(exists().where(taken))):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User already exists"
@@ -64,13 +61,12 @@ async def register_customer(
         phone=data.phone,
         first_name=data.first_name,
         last_name=data.last_name,
-        hashed_password=hash_password(data.password),
+        hashed_password=await run_in_threadpool(hash_password, data.password),
         role=UserRole.customer,
         is_active=True
     )
     session.add(user)
     await session.commit()
-    await session.refresh(user)
 
     access_token = create_access_token(user.id)
     return TokenResponse(
@@ -93,7 +89,11 @@ async def login_customer(
         )
 
     # Find user
-    query = select(User).where(User.role == UserRole.customer)
+    query = (
+        select(User)
+        .options(undefer(User.hashed_password))
+        .where(User.role == UserRole.customer)
+    )
     if data.email:
         query = query.where(User.email == data.email)
     else:
@@ -102,7 +102,7 @@ async def login_customer(
     result = await session.execute(query)
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(data.password, user.hashed_password):
+    if not user or not await run_in_threadpool(verify_password, data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials"
@@ -1,10 +1,16 @@
 """Customer - browse menu items"""
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import select, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
+from redis.asyncio import Redis
+import orjson
 
+from app.config import settings
+from app.core.cache import get_redis, menu_key, cache_get, cache_set
 from app.core.deps import get_session, get_current_customer
+from app.core.http_cache import etag_json_response
+from app.core.responses import prerendered
 from app.models.menu import MenuItem
 from app.models.user import User
 
@@ -25,27 +31,49 @@ class MenuItemResponse(BaseModel):
         from_attributes = True
 
 
-@router.get("/restaurant/{restaurant_id}", response_model=list[MenuItemResponse])
+# Repeat reads are answered 304 via ETag
+@router.get("/restaurant/{restaurant_id}", **prerendered(list[MenuItemResponse]))
 async def get_restaurant_menu(
+    request: Request,
     restaurant_id: int,
     session: AsyncSession = Depends(get_session),
+    redis: Redis | None = Depends(get_redis),
     user: User = Depends(get_current_customer),
     category: str | None = Query(None, description="Filter by category"),
     available_only: bool = Query(True, description="Show only available items")
 ):
     """Get menu items for a specific restaurant"""
-    query = select(MenuItem).where(MenuItem.restaurant_id == restaurant_id)
+    key = menu_key(restaurant_id, category, available_only)
+    cached = await cache_get(redis, key)
+    if cached is not None:
+        return etag_json_response(request, cached.encode())
+
+    # Built once per shape via lambda_stmt; only the bound values change per request
+    query = lambda_stmt(lambda: select(
+        MenuItem.id,
+        MenuItem.restaurant_id,
+        MenuItem.name,
+        MenuItem.description,
+        MenuItem.price,
+        MenuItem.category,
+        MenuItem.is_available,
+        MenuItem.image_url,
+    ).where(MenuItem.restaurant_id == restaurant_id))
 
     if available_only:
-        query = query.where(MenuItem.is_available == True)
+        query += lambda s: s.where(MenuItem.is_available == True)
 
     if category:
-        query = query.where(MenuItem.category == category)
+        query += lambda s: s.where(MenuItem.category == category)
 
     result = await session.execute(query)
-    items = result.scalars().all()
 
-    return [MenuItemResponse.model_validate(item) for item in items]
+    body = orjson.dumps([
+        {**row, "price": float(row["price"])} for row in result.mappings()
+    ])
+    await cache_set(redis, key, body.decode(), settings.MENU_CACHE_TTL_SECONDS)
+
+    return etag_json_response(request, body)
 
 
 @router.get("/item/{item_id}", response_model=MenuItemResponse)
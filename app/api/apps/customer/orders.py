@@ -1,14 +1,24 @@
 """Customer - order placement and tracking"""
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import select, insert, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from redis.asyncio import Redis
 
+from app.core.cache import get_redis, analytics_key, cache_delete
 from app.core.deps import get_session, get_current_customer
+from app.core.pagination import Page, encode_cursor, decode_cursor
+from app.core.responses import prerendered
 from app.models.order import Order, OrderItem, OrderType, OrderStatus
 from app.models.menu import MenuItem
+from app.models.restaurant import Restaurant
 from app.models.user import User
 from app.services.pricing_service import Quote
+from app.utils.distance import haversine_km
+from app.utils.money import to_cents
 
 router = APIRouter()
 
@@ -34,8 +44,8 @@ class OrderCreateRequest(BaseModel):
 class OrderResponse(BaseModel):
     id: int
     restaurant_id: int
-    order_type: str
-    status: str
+    order_type: OrderType
+    status: OrderStatus
     customer_name: str
     customer_phone: str
     customer_address: str | None
@@ -50,10 +60,23 @@ class OrderResponse(BaseModel):
         from_attributes = True
 
 
+class OrderItemResponse(BaseModel):
+    menu_item_id: int
+    name: str
+    quantity: int
+    unit_price: float
+    line_total: float
+
+
+class OrderDetailResponse(OrderResponse):
+    items: list[OrderItemResponse]
+
+
 @router.post("/", response_model=dict, status_code=201)
 async def create_order(
     data: OrderCreateRequest,
     session: AsyncSession = Depends(get_session),
+    redis: Redis | None = Depends(get_redis),
     user: User = Depends(get_current_customer)
 ):
     """Place a new order"""
@@ -65,113 +88,171 @@ async def create_order(
     if len(menu) != len(ids):
         raise HTTPException(status_code=400, detail="Some menu items not found")
 
-    subtotal = sum(float(menu[i.menu_item_id].price) * i.quantity for i in data.items)
+    # Convert each price to cents once; the whole quote is integer arithmetic
+    prices = {mid: to_cents(m.price) for mid, m in menu.items()}
+    subtotal = sum(prices[i.menu_item_id] * i.quantity for i in data.items)
     distance_km = None
 
     if data.order_type == OrderType.delivery:
-        from app.models.restaurant import Restaurant
         r = await session.get(Restaurant, data.restaurant_id)
         if r and r.lat and r.lon and data.customer_lat and data.customer_lon:
-            from app.utils.distance import haversine_km
+            # Scalar math-based haversine, computed inline (sub-microsecond)
             distance_km = haversine_km(r.lat, r.lon, data.customer_lat, data.customer_lon)
 
     q = Quote(subtotal=subtotal, distance_km=distance_km, order_type=data.order_type.value)
 
-    order = Order(
-        customer_id=user.id,
-        restaurant_id=data.restaurant_id,
-        order_type=data.order_type,
-        status=OrderStatus.created,
-        customer_name=data.customer_name,
-        customer_phone=data.customer_phone,
-        customer_address=data.customer_address,
-        customer_lat=data.customer_lat,
-        customer_lon=data.customer_lon,
-        delivery_note=data.delivery_note,
-        subtotal=q.subtotal,
-        service_fee=q.service_fee,
-        delivery_fee=q.delivery_fee,
-        tip=data.tip,
-        total=q.total + data.tip,
-        distance_km=distance_km,
+    tip = to_cents(data.tip)
+    total = q.total + tip
+
+    # INSERT ... RETURNING id, then one executemany for the items: no intermediate flush
+    order_id = await session.scalar(
+        insert(Order)
+        .values(
+            customer_id=user.id,
+            restaurant_id=data.restaurant_id,
+            order_type=data.order_type,
+            status=OrderStatus.created,
+            customer_name=data.customer_name,
+            customer_phone=data.customer_phone,
+            customer_address=data.customer_address,
+            customer_lat=data.customer_lat,
+            customer_lon=data.customer_lon,
+            delivery_note=data.delivery_note,
+            subtotal=q.subtotal,
+            service_fee=q.service_fee,
+            delivery_fee=q.delivery_fee,
+            tip=tip,
+            total=total,
+            distance_km=distance_km,
+        )
+        .returning(Order.id)
+    )
+
+    await session.execute(
+        insert(OrderItem),
+        [
+            {
+                "order_id": order_id,
+                "menu_item_id": i.menu_item_id,
+                "name": menu[i.menu_item_id].name,
+                "quantity": i.quantity,
+                "unit_price": menu[i.menu_item_id].price,
+                "line_total": menu[i.menu_item_id].price * i.quantity,
+            }
+            for i in data.items
+        ]
     )
-    session.add(order)
-    await session.flush()
-
-    for i in data.items:
-        session.add(OrderItem(
-            order_id=order.id,
-            menu_item_id=i.menu_item_id,
-            name=menu[i.menu_item_id].name,
-            quantity=i.quantity,
-            unit_price=menu[i.menu_item_id].price,
-            line_total=float(menu[i.menu_item_id].price) * i.quantity
-        ))
 
     await session.commit()
+    await cache_delete(redis, analytics_key(data.restaurant_id))
 
-    return {"order_id": order.id, "status": order.status.value, "total": float(order.total)}
+    return {"order_id": order_id, "status": OrderStatus.created.value, "total": total / 100}
 
 
-@router.get("/", response_model=list[OrderResponse])
+@router.get("/", **prerendered(Page[OrderResponse]))
 async def list_my_orders(
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_current_customer)
+    user: User = Depends(get_current_customer),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None, description="next_cursor from the previous page")
 ):
-    """Get all orders for the current customer"""
-    result = await session.execute(
-        select(Order)
+    """Get the current customer's orders, newest first (keyset-paginated)"""
+    query = (
+        select(
+            Order.id,
+            Order.restaurant_id,
+            Order.order_type,
+            Order.status,
+            Order.customer_name,
+            Order.customer_phone,
+            Order.customer_address,
+            Order.subtotal,
+            Order.service_fee,
+            Order.delivery_fee,
+            Order.tip,
+            Order.total,
+            Order.created_at,
+        )
         .where(Order.customer_id == user.id)
-        .order_by(Order.created_at.desc())
     )
-    orders = result.scalars().all()
-
-    return [
-        OrderResponse(
-            id=o.id,
-            restaurant_id=o.restaurant_id,
-            order_type=o.order_type.value,
-            status=o.status.value,
-            customer_name=o.customer_name,
-            customer_phone=o.customer_phone,
-            customer_address=o.customer_address,
-            subtotal=float(o.subtotal),
-            service_fee=float(o.service_fee),
-            delivery_fee=float(o.delivery_fee),
-            tip=float(o.tip),
-            total=float(o.total),
-            created_at=o.created_at.isoformat()
-        )
-        for o in orders
-    ]
-
-
-@router.get("/{order_id}", response_model=OrderResponse)
+    # (created_at, id) is a total order, so orders sharing a timestamp are
+    # neither skipped nor repeated across pages
+    if cursor:
+        c_ts, c_id = decode_cursor(cursor, datetime, int)
+        query = query.where(tuple_(Order.created_at, Order.id) < tuple_(c_ts, c_id))
+    # One extra row tells us whether another page exists, without a COUNT(*)
+    query = query.order_by(Order.created_at.desc(), Order.id.desc()).limit(limit + 1)
+
+    # Range scan on ix_orders_customer_created_id (customer_id, created_at DESC, id DESC)
+    result = await session.execute(query)
+    orders = result.all()
+    has_next = len(orders) > limit
+    orders = orders[:limit]
+
+    # orjson encodes the enums and created_at natively
+    return ORJSONResponse({
+        "items": [{
+            "id": o.id,
+            "restaurant_id": o.restaurant_id,
+            "order_type": o.order_type,
+            "status": o.status,
+            "customer_name": o.customer_name,
+            "customer_phone": o.customer_phone,
+            "customer_address": o.customer_address,
+            "subtotal": o.subtotal / 100,
+            "service_fee": o.service_fee / 100,
+            "delivery_fee": o.delivery_fee / 100,
+            "tip": o.tip / 100,
+            "total": o.total / 100,
+            "created_at": o.created_at
+        } for o in orders],
+        "has_next": has_next,
+        "next_cursor": encode_cursor(orders[-1].created_at, orders[-1].id) if has_next else None
+    })
+
+
+@router.get("/{order_id}", response_model=OrderDetailResponse)
 async def get_order_details(
     order_id: int,
     session: AsyncSession = Depends(get_session),
     user: User = Depends(get_current_customer)
 ):
-    """Get details of a specific order"""
-    order = await session.get(Order, order_id)
+    """Get details of a specific order, including its line items"""
+    # Items come from one extra IN query rather than a lazy load per access
+    result = await session.execute(
+        select(Order)
+        .options(selectinload(Order.items))
+        .where(Order.id == order_id, Order.customer_id == user.id)
+    )
+    order = result.scalar_one_or_none()
 
-    if not order or order.customer_id != user.id:
+    if not order:
         raise HTTPException(status_code=404, detail="Order not found")
 
-    return OrderResponse(
+    return OrderDetailResponse(
         id=order.id,
         restaurant_id=order.restaurant_id,
-        order_type=order.order_type.value,
-        status=order.status.value,
+        order_type=order.order_type,
+        status=order.status,
         customer_name=order.customer_name,
         customer_phone=order.customer_phone,
         customer_address=order.customer_address,
-        subtotal=float(order.subtotal),
-        service_fee=float(order.service_fee),
-        delivery_fee=float(order.delivery_fee),
-        tip=float(order.tip),
-        total=float(order.total),
-        created_at=order.created_at.isoformat()
+        subtotal=order.subtotal / 100,
+        service_fee=order.service_fee / 100,
+        delivery_fee=order.delivery_fee / 100,
+        tip=order.tip / 100,
+        total=order.total / 100,
+        created_at=order.created_at.isoformat(),
+        items=[
+            OrderItemResponse(
+                menu_item_id=i.menu_item_id,
+                name=i.name,
+                quantity=i.quantity,
+                unit_price=float(i.unit_price),
+                line_total=float(i.line_total)
+            )
+            for i in order.items
+        ]
     )
 
 
@@ -179,6 +260,7 @@ async def get_order_details(
 async def cancel_order(
     order_id: int,
     session: AsyncSession = Depends(get_session),
+    redis: Redis | None = Depends(get_redis),
     user: User = Depends(get_current_customer)
 ):
     """Cancel an order (if allowed)"""
@@ -192,6 +274,7 @@ async def cancel_order(
 
     order.status = OrderStatus.cancelled
     await session.commit()
+    await cache_delete(redis, analytics_key(order.restaurant_id))
 
     return {"message": "Order cancelled successfully", "order_id": order.id}
 
@@ -2,7 +2,9 @@
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel, EmailStr
 from datetime import date
+from redis.asyncio import Redis
 
+from app.core.cache import get_redis, user_key, cache_delete
 from app.core.deps import get_session, get_current_customer
 from app.models.user import User
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -50,6 +52,7 @@ async def get_profile(
 async def update_profile(
     data: ProfileUpdateRequest,
     session: AsyncSession = Depends(get_session),
+    redis: Redis | None = Depends(get_redis),
     user: User = Depends(get_current_customer)
 ):
     """Update customer profile"""
@@ -63,7 +66,7 @@ async def update_profile(
         user.phone = data.phone
 
     await session.commit()
-    await session.refresh(user)
+    await cache_delete(redis, user_key(user.id))
 
     return ProfileResponse(
         id=user.id,
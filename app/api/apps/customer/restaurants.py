@@ -1,12 +1,17 @@
 """Customer - browse and search restaurants"""
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from sqlalchemy import select
+import numpy as np
+from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.deps import get_session, get_current_customer
+from app.core.http_cache import etag_json_response
+from app.core.responses import prerendered
 from app.models.restaurant import Restaurant
 from app.models.user import User
+from app.utils.distance import bounding_box, haversine_km_vec
 
 router = APIRouter()
 
@@ -26,32 +31,112 @@ class RestaurantListItem(BaseModel):
         from_attributes = True
 
 
-@router.get("/", response_model=list[RestaurantListItem])
+class NearbyRestaurantItem(RestaurantListItem):
+    distance_km: float
+
+
+# Columns backing RestaurantListItem; selected directly to skip ORM hydration
+_LIST_COLUMNS = (
+    Restaurant.id,
+    Restaurant.name,
+    Restaurant.address,
+    Restaurant.phone,
+    Restaurant.cuisine_type,
+    Restaurant.lat,
+    Restaurant.lon,
+    Restaurant.rating,
+    Restaurant.is_active,
+)
+
+
+def _list_item(row) -> dict:
+    """JSON-ready dict for a RestaurantListItem row (rating is NUMERIC -> float)"""
+    item = dict(row)
+    if item["rating"] is not None:
+        item["rating"] = float(item["rating"])
+    return item
+
+
+@router.get("/", **prerendered(list[RestaurantListItem]))
 async def list_restaurants(
     session: AsyncSession = Depends(get_session),
     user: User = Depends(get_current_customer),
     search: str | None = Query(None, description="Search by name or cuisine"),
-    limit: int = Query(20, le=100),
+    limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0)
 ):
     """List all active restaurants available for ordering"""
-    query = select(Restaurant).where(Restaurant.is_active == True)
+    query = select(*_LIST_COLUMNS).where(Restaurant.is_active == True)
 
     if search:
+        # pg_trgm word-similarity match, served by the GIN trigram indexes
         query = query.where(
-            (Restaurant.name.ilike(f"%{search}%")) |
-            (Restaurant.cuisine_type.ilike(f"%{search}%"))
+            Restaurant.name.op("%>")(search) |
+            Restaurant.cuisine_type.op("%>")(search)
+        ).order_by(
+            func.greatest(
+                func.word_similarity(search, Restaurant.name),
+                func.coalesce(func.word_similarity(search, Restaurant.cuisine_type), 0)
+            ).desc()
         )
 
     query = query.limit(limit).offset(offset)
     result = await session.execute(query)
-    restaurants = result.scalars().all()
 
-    return [RestaurantListItem.model_validate(r) for r in restaurants]
+    return ORJSONResponse([_list_item(row) for row in result.mappings()])
+
+
+@router.get("/nearby", response_model=list[NearbyRestaurantItem])
+async def list_nearby_restaurants(
+    lat: float = Query(..., ge=-90, le=90),
+    lon: float = Query(..., ge=-180, le=180),
+    radius_km: float = Query(5.0, gt=0, le=50),
+    limit: int = Query(20, ge=1, le=100),
+    session: AsyncSession = Depends(get_session),
+    user: User = Depends(get_current_customer)
+):
+    """List active restaurants within radius_km of a point, nearest first"""
+    # Only candidates inside the radius' bounding box (ix_restaurants_active_lat_lon)
+    # reach the exact haversine pass below
+    min_lat, max_lat, min_lon, max_lon = bounding_box(lat, lon, radius_km)
+    query = (
+        select(Restaurant.id, Restaurant.lat, Restaurant.lon)
+        .where(Restaurant.is_active == True)
+        .where(Restaurant.lat.between(min_lat, max_lat), Restaurant.lon.is_not(None))
+    )
+    if min_lon is not None:
+        query = query.where(Restaurant.lon.between(min_lon, max_lon))
+    result = await session.execute(query)
+    rows = result.all()
+    if not rows:
+        return []
+
+    ids = np.fromiter((r[0] for r in rows), dtype=np.int64, count=len(rows))
+    coords = np.array([(r[1], r[2]) for r in rows], dtype=np.float64)
+    distances = haversine_km_vec(lat, lon, coords[:, 0], coords[:, 1])
+
+    in_range = np.flatnonzero(distances < radius_km)
+    nearest = in_range[np.argsort(distances[in_range])][:limit]
+    if nearest.size == 0:
+        return []
+
+    distance_by_id = {int(ids[i]): float(distances[i]) for i in nearest}
+    result = await session.execute(
+        select(*_LIST_COLUMNS).where(Restaurant.id.in_(distance_by_id))
+    )
+    rows = sorted(result.mappings(), key=lambda r: distance_by_id[r["id"]])
+
+    return [
+        NearbyRestaurantItem.model_construct(
+            **row, distance_km=round(distance_by_id[row["id"]], 2)
+        )
+        for row in rows
+    ]
 
 
-@router.get("/{restaurant_id}", response_model=RestaurantListItem)
+@router.get("/{restaurant_id}", **prerendered(RestaurantListItem))
 async def get_restaurant_details(
+    request: Request,
     restaurant_id: int,
     session: AsyncSession = Depends(get_session),
     user: User = Depends(get_current_customer)
@@ -62,5 +147,6 @@ async def get_restaurant_details(
         from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="Restaurant not found")
 
-    return RestaurantListItem.model_validate(restaurant)
+    body = RestaurantListItem.model_validate(restaurant).model_dump_json().encode()
+    return etag_json_response(request, body)
 
@@ -1,12 +1,14 @@
 """Restaurant analytics and statistics"""
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
+from redis.asyncio import Redis
 
-from app.core.deps import get_session, get_current_restaurant_owner
+from app.config import settings
+from app.core.cache import get_redis, analytics_key, cache_get, cache_set
+from app.core.deps import get_session, get_current_restaurant_owner, assert_restaurant_owner
 from app.models.user import User
-from app.models.restaurant import Restaurant
 from app.models.order import Order, OrderStatus
 
 router = APIRouter()
@@ -24,53 +26,44 @@ class AnalyticsSummary(BaseModel):
 async def get_restaurant_analytics(
     restaurant_id: int,
     session: AsyncSession = Depends(get_session),
+    redis: Redis | None = Depends(get_redis),
     user: User = Depends(get_current_restaurant_owner)
 ):
     """Get analytics for a restaurant"""
-    # Verify ownership
-    restaurant = await session.get(Restaurant, restaurant_id)
-    if not restaurant or restaurant.owner_id != user.id:
-        raise HTTPException(status_code=404, detail="Restaurant not found")
+    await assert_restaurant_owner(session, restaurant_id, user.id)
 
-    # Total orders
-    total_orders_result = await session.execute(
-        select(func.count(Order.id))
-        .where(Order.restaurant_id == restaurant_id)
-    )
-    total_orders = total_orders_result.scalar() or 0
-
-    # Completed orders
-    completed_orders_result = await session.execute(
-        select(func.count(Order.id))
-        .where(Order.restaurant_id == restaurant_id)
-        .where(Order.status == OrderStatus.delivered)
-    )
-    completed_orders = completed_orders_result.scalar() or 0
+    key = analytics_key(restaurant_id)
+    cached = await cache_get(redis, key)
+    if cached:
+        return AnalyticsSummary.model_validate_json(cached)
 
-    # Cancelled orders
-    cancelled_orders_result = await session.execute(
-        select(func.count(Order.id))
+    # Total, completed and cancelled counts plus delivered revenue in one scan
+    # (backed by idx_orders_restaurant_status_created)
+    delivered = Order.status == OrderStatus.delivered
+    result = await session.execute(
+        select(
+            func.count(),
+            func.count().filter(delivered),
+            func.count().filter(Order.status == OrderStatus.cancelled),
+            func.coalesce(func.sum(Order.total).filter(delivered), 0),
+        )
+        .select_from(Order)
         .where(Order.restaurant_id == restaurant_id)
-        .where(Order.status == OrderStatus.cancelled)
     )
-    cancelled_orders = cancelled_orders_result.scalar() or 0
-
-    # Total revenue
-    revenue_result = await session.execute(
-        select(func.sum(Order.total))
-        .where(Order.restaurant_id == restaurant_id)
-        .where(Order.status == OrderStatus.delivered)
-    )
-    total_revenue = float(revenue_result.scalar() or 0)
+    total_orders, completed_orders, cancelled_orders, total_revenue = result.one()
+    total_revenue = total_revenue / 100
 
     # Average order value
     average_order_value = total_revenue / completed_orders if completed_orders > 0 else 0
 
-    return AnalyticsSummary(
+    summary = AnalyticsSummary(
         total_orders=total_orders,
         completed_orders=completed_orders,
         cancelled_orders=cancelled_orders,
         total_revenue=total_revenue,
         average_order_value=average_order_value
     )
+    await cache_set(redis, key, summary.model_dump_json(), settings.ANALYTICS_CACHE_TTL_SECONDS)
+
+    return summary
 
@@ -1,11 +1,13 @@
 """Restaurant business hours management"""
 from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import time
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.deps import get_session, get_current_restaurant_owner
+from app.core.deps import get_session, get_current_restaurant_owner, assert_restaurant_owner
 from app.models.user import User
 from app.models.restaurant import Restaurant, BusinessHour
 
@@ -15,10 +17,9 @@ router = APIRouter()
 class BusinessHourResponse(BaseModel):
     id: int
     restaurant_id: int
-    day_of_week: int
-    open_time: time
+    day_of_week: int = Field(validation_alias="weekday")
+    open_time: time  # stored as "HH:MM"
     close_time: time
-    is_closed: bool
 
     class Config:
         from_attributes = True
@@ -28,7 +29,32 @@ class BusinessHourRequest(BaseModel):
     day_of_week: int  # 0=Monday, 6=Sunday
     open_time: time
     close_time: time
-    is_closed: bool = False
+
+
+def _hour_values(data: BusinessHourRequest) -> dict:
+    """Column values for a request (times are stored as "HH:MM" strings)"""
+    return {
+        "weekday": data.day_of_week,
+        "open_time": data.open_time.strftime("%H:%M"),
+        "close_time": data.close_time.strftime("%H:%M"),
+    }
+
+
+async def _get_owned_hour(session: AsyncSession, hour_id: int, user_id: int) -> BusinessHour:
+    """Fetch a business hour together with its restaurant's owner_id in one query"""
+    result = await session.execute(
+        select(BusinessHour, Restaurant.owner_id)
+        .join(Restaurant, Restaurant.id == BusinessHour.restaurant_id)
+        .where(BusinessHour.id == hour_id)
+    )
+    row = result.first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Business hour not found")
+
+    hour, owner_id = row
+    if owner_id != user_id:
+        raise HTTPException(status_code=403, detail="Not authorized")
+    return hour
 
 
 @router.get("/restaurant/{restaurant_id}", response_model=list[BusinessHourResponse])
@@ -38,15 +64,12 @@ async def get_business_hours(
     user: User = Depends(get_current_restaurant_owner)
 ):
     """Get business hours for a restaurant"""
-    # Verify ownership
-    restaurant = await session.get(Restaurant, restaurant_id)
-    if not restaurant or restaurant.owner_id != user.id:
-        raise HTTPException(status_code=404, detail="Restaurant not found")
+    await assert_restaurant_owner(session, restaurant_id, user.id)
 
     result = await session.execute(
         select(BusinessHour)
         .where(BusinessHour.restaurant_id == restaurant_id)
-        .order_by(BusinessHour.day_of_week)
+        .order_by(BusinessHour.weekday)
     )
     hours = result.scalars().all()
 
@@ -61,30 +84,20 @@ async def create_business_hour(
     user: User = Depends(get_current_restaurant_owner)
 ):
     """Create business hours for a specific day"""
-    # Verify ownership
-    restaurant = await session.get(Restaurant, restaurant_id)
-    if not restaurant or restaurant.owner_id != user.id:
-        raise HTTPException(status_code=403, detail="Not authorized")
-
-    # Check if hours already exist for this day
-    existing = await session.execute(
-        select(BusinessHour)
-        .where(BusinessHour.restaurant_id == restaurant_id)
-        .where(BusinessHour.day_of_week == data.day_of_week)
+    await assert_restaurant_owner(session, restaurant_id, user.id, 403, "Not authorized")
+
+    # Single atomic round-trip: the (restaurant_id, weekday) unique constraint
+    # rejects duplicates instead of a separate existence SELECT
+    business_hour = await session.scalar(
+        pg_insert(BusinessHour)
+        .values(restaurant_id=restaurant_id, **_hour_values(data))
+        .on_conflict_do_nothing(constraint="uq_business_hours_restaurant_weekday")
+        .returning(BusinessHour)
     )
-    if existing.scalar_one_or_none():
+    if business_hour is None:
         raise HTTPException(status_code=400, detail="Business hours already exist for this day")
 
-    business_hour = BusinessHour(
-        restaurant_id=restaurant_id,
-        day_of_week=data.day_of_week,
-        open_time=data.open_time,
-        close_time=data.close_time,
-        is_closed=data.is_closed
-    )
-    session.add(business_hour)
     await session.commit()
-    await session.refresh(business_hour)
 
     return BusinessHourResponse.model_validate(business_hour)
 
@@ -97,22 +110,16 @@ async def update_business_hour(
     user: User = Depends(get_current_restaurant_owner)
 ):
     """Update business hours"""
-    hour = await session.get(BusinessHour, hour_id)
-    if not hour:
-        raise HTTPException(status_code=404, detail="Business hour not found")
-
-    # Verify ownership
-    restaurant = await session.get(Restaurant, hour.restaurant_id)
-    if not restaurant or restaurant.owner_id != user.id:
-        raise HTTPException(status_code=403, detail="Not authorized")
+    hour = await _get_owned_hour(session, hour_id, user.id)
 
-    hour.day_of_week = data.day_of_week
-    hour.open_time = data.open_time
-    hour.close_time = data.close_time
-    hour.is_closed = data.is_closed
+    for key, value in _hour_values(data).items():
+        setattr(hour, key, value)
 
-    await session.commit()
-    await session.refresh(hour)
+    try:
+        await session.commit()
+    except IntegrityError:  # moved onto a day that already has hours
+        await session.rollback()
+        raise HTTPException(status_code=400, detail="Business hours already exist for this day")
 
     return BusinessHourResponse.model_validate(hour)
 
@@ -124,14 +131,7 @@ async def delete_business_hour(
     user: User = Depends(get_current_restaurant_owner)
 ):
     """Delete business hours"""
-    hour = await session.get(BusinessHour, hour_id)
-    if not hour:
-        raise HTTPException(status_code=404, detail="Business hour not found")
-
-    # Verify ownership
-    restaurant = await session.get(Restaurant, hour.restaurant_id)
-    if not restaurant or restaurant.owner_id != user.id:
-        raise HTTPException(status_code=403, detail="Not authorized")
+    hour = await _get_owned_hour(session, hour_id, user.id)
 
     await session.delete(hour)
     await session.commit()
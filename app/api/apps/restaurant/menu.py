@@ -1,10 +1,15 @@
 """Restaurant menu management"""
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import select, update, true
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from redis.asyncio import Redis
 
-from app.core.deps import get_session, get_current_restaurant_owner
+from app.core.cache import get_redis, menu_pattern, cache_delete_pattern
+from app.core.deps import get_session, get_current_restaurant_owner, assert_restaurant_owner
+from app.core.http_cache import etag_json_response
+from app.core.responses import prerendered
 from app.models.user import User
 from app.models.restaurant import Restaurant
 from app.models.menu import MenuItem
@@ -26,6 +31,9 @@ class MenuItemResponse(BaseModel):
         from_attributes = True
 
 
+_menu_item_list = TypeAdapter(list[MenuItemResponse])
+
+
 class MenuItemCreateRequest(BaseModel):
     restaurant_id: int
     name: str
@@ -45,37 +53,85 @@ class MenuItemUpdateRequest(BaseModel):
     image_url: str | None = None
 
 
-@router.get("/restaurant/{restaurant_id}", response_model=list[MenuItemResponse])
+async def _get_owned_item(
+    session: AsyncSession, item_id: int, user_id: int, hide_foreign: bool = False
+) -> MenuItem:
+    """
+    Fetch a menu item together with its restaurant's owner_id in one query
+
+    hide_foreign reports another owner's item as 404 instead of 403
+    """
+    result = await session.execute(
+        select(MenuItem, Restaurant.owner_id)
+        .join(Restaurant, Restaurant.id == MenuItem.restaurant_id)
+        .where(MenuItem.id == item_id)
+    )
+    row = result.first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Menu item not found")
+
+    item, owner_id = row
+    if owner_id != user_id:
+        if hide_foreign:
+            raise HTTPException(status_code=404, detail="Menu item not found")
+        raise HTTPException(status_code=403, detail="Not authorized")
+    return item
+
+
+@router.get("/restaurant/{restaurant_id}", **prerendered(list[MenuItemResponse]))
 async def get_menu_items(
+    request: Request,
     restaurant_id: int,
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_current_restaurant_owner)
+    user: User = Depends(get_current_restaurant_owner),
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0)
 ):
-    """Get all menu items for a restaurant"""
-    # Verify ownership
-    restaurant = await session.get(Restaurant, restaurant_id)
-    if not restaurant or restaurant.owner_id != user.id:
-        raise HTTPException(status_code=404, detail="Restaurant not found")
+    """Get a page of menu items for a restaurant"""
+    # Ownership check and item fetch in one query: the page of items is a
+    # LATERAL subquery outer-joined to the restaurant, so a restaurant with no
+    # menu yet (or an offset past the end) still yields its owner row
+    page = (
+        select(MenuItem)
+        .where(MenuItem.restaurant_id == Restaurant.id)
+        .order_by(MenuItem.id)
+        .limit(limit)
+        .offset(offset)
+        .lateral("page")
+    )
+    page_item = aliased(MenuItem, page)
 
     result = await session.execute(
-        select(MenuItem).where(MenuItem.restaurant_id == restaurant_id)
+        select(Restaurant.owner_id, page_item)
+        .outerjoin(page, true())
+        .where(Restaurant.id == restaurant_id)
+        .order_by(page_item.id)
     )
-    items = result.scalars().all()
+    rows = result.all()
+    if not rows or rows[0].owner_id != user.id:
+        raise HTTPException(status_code=404, detail="Restaurant not found")
 
-    return [MenuItemResponse.model_validate(item) for item in items]
+    # Validated from attributes and encoded in one pydantic-core pass: no
+    # intermediate model objects, and no re-validation by response_model
+    items = [item for _, item in rows if item is not None]
+    return etag_json_response(
+        request,
+        _menu_item_list.dump_json(_menu_item_list.validate_python(items, from_attributes=True))
+    )
 
 
 @router.post("/", response_model=MenuItemResponse, status_code=201)
 async def create_menu_item(
     data: MenuItemCreateRequest,
     session: AsyncSession = Depends(get_session),
+    redis: Redis | None = Depends(get_redis),
     user: User = Depends(get_current_restaurant_owner)
 ):
     """Create a new menu item"""
-    # Verify ownership
-    restaurant = await session.get(Restaurant, data.restaurant_id)
-    if not restaurant or restaurant.owner_id != user.id:
-        raise HTTPException(status_code=403, detail="Not authorized to modify this restaurant")
+    await assert_restaurant_owner(
+        session, data.restaurant_id, user.id,
+        status_code=403, detail="Not authorized to modify this restaurant"
+    )
 
     menu_item = MenuItem(
         restaurant_id=data.restaurant_id,
@@ -88,7 +144,7 @@ async def create_menu_item(
     )
     session.add(menu_item)
     await session.commit()
-    await session.refresh(menu_item)
+    await cache_delete_pattern(redis, menu_pattern(data.restaurant_id))
 
     return MenuItemResponse.model_validate(menu_item)
 
@@ -100,14 +156,7 @@ async def get_menu_item(
     user: User = Depends(get_current_restaurant_owner)
 ):
     """Get menu item details"""
-    item = await session.get(MenuItem, item_id)
-    if not item:
-        raise HTTPException(status_code=404, detail="Menu item not found")
-
-    # Verify ownership
-    restaurant = await session.get(Restaurant, item.restaurant_id)
-    if not restaurant or restaurant.owner_id != user.id:
-        raise HTTPException(status_code=404, detail="Menu item not found")
+    item = await _get_owned_item(session, item_id, user.id, hide_foreign=True)
 
     return MenuItemResponse.model_validate(item)
 
@@ -117,33 +166,32 @@ async def update_menu_item(
     item_id: int,
     data: MenuItemUpdateRequest,
     session: AsyncSession = Depends(get_session),
+    redis: Redis | None = Depends(get_redis),
     user: User = Depends(get_current_restaurant_owner)
 ):
     """Update menu item"""
-    item = await session.get(MenuItem, item_id)
-    if not item:
-        raise HTTPException(status_code=404, detail="Menu item not found")
-
-    # Verify ownership
-    restaurant = await session.get(Restaurant, item.restaurant_id)
-    if not restaurant or restaurant.owner_id != user.id:
-        raise HTTPException(status_code=403, detail="Not authorized")
-
-    if data.name is not None:
-        item.name = data.name
-    if data.description is not None:
-        item.description = data.description
-    if data.price is not None:
-        item.price = data.price
-    if data.category is not None:
-        item.category = data.category
-    if data.is_available is not None:
-        item.is_available = data.is_available
-    if data.image_url is not None:
-        item.image_url = data.image_url
+    # Fields sent as null are left unchanged
+    changes = data.model_dump(exclude_unset=True, exclude_none=True)
+    if not changes:
+        return MenuItemResponse.model_validate(await _get_owned_item(session, item_id, user.id))
+
+    # Ownership check and write in one UPDATE ... RETURNING
+    item = await session.scalar(
+        update(MenuItem)
+        .where(
+            MenuItem.id == item_id,
+            MenuItem.restaurant_id.in_(
+                select(Restaurant.id).where(Restaurant.owner_id == user.id)
+            )
+        )
+        .values(**changes)
+        .returning(MenuItem)
+    )
+    if item is None:
+        await _get_owned_item(session, item_id, user.id)  # raises 404 / 403
 
     await session.commit()
-    await session.refresh(item)
+    await cache_delete_pattern(redis, menu_pattern(item.restaurant_id))
 
     return MenuItemResponse.model_validate(item)
 
@@ -152,20 +200,15 @@ async def update_menu_item(
 async def delete_menu_item(
     item_id: int,
     session: AsyncSession = Depends(get_session),
+    redis: Redis | None = Depends(get_redis),
     user: User = Depends(get_current_restaurant_owner)
 ):
     """Delete menu item"""
-    item = await session.get(MenuItem, item_id)
-    if not item:
-        raise HTTPException(status_code=404, detail="Menu item not found")
-
-    # Verify ownership
-    restaurant = await session.get(Restaurant, item.restaurant_id)
-    if not restaurant or restaurant.owner_id != user.id:
-        raise HTTPException(status_code=403, detail="Not authorized")
+    item = await _get_owned_item(session, item_id, user.id)
 
     await session.delete(item)
     await session.commit()
+    await cache_delete_pattern(redis, menu_pattern(item.restaurant_id))
 
     return None
 
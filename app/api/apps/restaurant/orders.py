@@ -1,13 +1,20 @@
 """Restaurant order management"""
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response
+from datetime import datetime
+from pydantic import BaseModel, TypeAdapter, field_serializer
+from sqlalchemy import select, update, true, ColumnElement
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from redis.asyncio import Redis
 
+from app.core.cache import get_redis, analytics_key, cache_delete
 from app.core.deps import get_session, get_current_restaurant_owner
+from app.core.responses import prerendered
 from app.models.user import User
 from app.models.restaurant import Restaurant
-from app.models.order import Order, OrderStatus
+from app.models.order import Order, OrderType, OrderStatus
 
 router = APIRouter()
 
@@ -17,53 +24,129 @@ class OrderResponse(BaseModel):
     customer_name: str
     customer_phone: str
     customer_address: str | None
-    order_type: str
-    status: str
-    subtotal: float
-    total: float
-    created_at: str
+    order_type: OrderType
+    status: OrderStatus
+    subtotal: int  # cents, as stored on Order
+    total: int
+    created_at: datetime
 
     class Config:
         from_attributes = True
 
+    # Converted on the way out only, so validating the model again (e.g. by
+    # response_model) never rescales; python-mode dumps keep the cents
+    @field_serializer("subtotal", "total", when_used="json")
+    def _to_major_units(self, v: int) -> float:
+        return v / 100
+
+    @field_serializer("created_at")
+    def _created_at_iso(self, v: datetime) -> str:
+        return v.isoformat()
+
+
+async def _get_owned_order(
+    session: AsyncSession, order_id: int, user_id: int, hide_foreign: bool = False
+) -> Order:
+    """
+    Fetch an order together with its restaurant's owner_id in one query
+
+    hide_foreign reports another restaurant's order as 404 instead of 403
+    """
+    result = await session.execute(
+        select(Order, Restaurant.owner_id)
+        .join(Restaurant, Restaurant.id == Order.restaurant_id)
+        .where(Order.id == order_id)
+    )
+    row = result.first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Order not found")
+
+    order, owner_id = row
+    if owner_id != user_id:
+        if hide_foreign:
+            raise HTTPException(status_code=404, detail="Order not found")
+        raise HTTPException(status_code=403, detail="Not authorized")
+    return order
+
+
+async def _transition_order(
+    session: AsyncSession,
+    order_id: int,
+    user_id: int,
+    allowed_from: ColumnElement[bool],
+    new_status: OrderStatus,
+    invalid_detail: str,
+) -> int:
+    """
+    Move an order to new_status with a single guarded UPDATE ... RETURNING
+
+    Ownership and the allowed current status are part of the WHERE clause, so
+    the check and the write are atomic. Returns the order's restaurant_id.
+    """
+    result = await session.execute(
+        update(Order)
+        .where(
+            Order.id == order_id,
+            Order.restaurant_id.in_(
+                select(Restaurant.id).where(Restaurant.owner_id == user_id)
+            ),
+            allowed_from,
+        )
+        .values(status=new_status)
+        .returning(Order.restaurant_id)
+        .execution_options(synchronize_session=False)
+    )
+    restaurant_id = result.scalar_one_or_none()
+    if restaurant_id is None:
+        # Only on failure: find out whether the order is missing, foreign,
+        # or just in the wrong state
+        await _get_owned_order(session, order_id, user_id)
+        raise HTTPException(status_code=400, detail=invalid_detail)
+    return restaurant_id
+
+
+_order_list = TypeAdapter(list[OrderResponse])
+
 
-@router.get("/restaurant/{restaurant_id}", response_model=list[OrderResponse])
+def _render_orders(orders) -> bytes:
+    # from_attributes validation and JSON encoding both run in pydantic-core
+    return _order_list.dump_json(_order_list.validate_python(orders, from_attributes=True))
+
+
+@router.get("/restaurant/{restaurant_id}", **prerendered(list[OrderResponse]))
 async def get_restaurant_orders(
     restaurant_id: int,
     session: AsyncSession = Depends(get_session),
     user: User = Depends(get_current_restaurant_owner),
-    status: OrderStatus | None = None
+    status: OrderStatus | None = None,
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0)
 ):
-    """Get all orders for a restaurant"""
-    # Verify ownership
-    restaurant = await session.get(Restaurant, restaurant_id)
-    if not restaurant or restaurant.owner_id != user.id:
+    """Get a page of orders for a restaurant, newest first"""
+    # Ownership check and order fetch in one query: the page of orders is a
+    # LATERAL subquery outer-joined to the restaurant, so a restaurant with no
+    # orders (or an offset past the end) still yields its owner row
+    page = select(Order).where(Order.restaurant_id == Restaurant.id)
+    if status:
+        page = page.where(Order.status == status)
+    page = page.order_by(Order.created_at.desc()).limit(limit).offset(offset).lateral("page")
+    page_order = aliased(Order, page)
+
+    result = await session.execute(
+        select(Restaurant.owner_id, page_order)
+        .outerjoin(page, true())
+        .where(Restaurant.id == restaurant_id)
+        .order_by(page_order.created_at.desc())
+    )
+    rows = result.all()
+    if not rows or rows[0].owner_id != user.id:
         raise HTTPException(status_code=404, detail="Restaurant not found")
 
-    query = select(Order).where(Order.restaurant_id == restaurant_id)
+    orders = [order for _, order in rows if order is not None]
 
-    if status:
-        query = query.where(Order.status == status)
-
-    query = query.order_by(Order.created_at.desc())
-
-    result = await session.execute(query)
-    orders = result.scalars().all()
-
-    return [
-        OrderResponse(
-            id=o.id,
-            customer_name=o.customer_name,
-            customer_phone=o.customer_phone,
-            customer_address=o.customer_address,
-            order_type=o.order_type.value,
-            status=o.status.value,
-            subtotal=float(o.subtotal),
-            total=float(o.total),
-            created_at=o.created_at.isoformat()
-        )
-        for o in orders
-    ]
+    # Render in the threadpool so a large page doesn't stall the event loop
+    body = await run_in_threadpool(_render_orders, orders)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/{order_id}", response_model=OrderResponse)
@@ -73,26 +156,10 @@ async def get_order_details(
     user: User = Depends(get_current_restaurant_owner)
 ):
     """Get order details"""
-    order = await session.get(Order, order_id)
-    if not order:
-        raise HTTPException(status_code=404, detail="Order not found")
-
-    # Verify ownership
-    restaurant = await session.get(Restaurant, order.restaurant_id)
-    if not restaurant or restaurant.owner_id != user.id:
-        raise HTTPException(status_code=404, detail="Order not found")
+    order = await _get_owned_order(session, order_id, user.id, hide_foreign=True)
 
-    return OrderResponse(
-        id=order.id,
-        customer_name=order.customer_name,
-        customer_phone=order.customer_phone,
-        customer_address=order.customer_address,
-        order_type=order.order_type.value,
-        status=order.status.value,
-        subtotal=float(order.subtotal),
-        total=float(order.total),
-        created_at=order.created_at.isoformat()
-    )
+    # Returned as-is: response_model validates it from attributes once
+    return order
 
 
 @router.post("/{order_id}/confirm")
@@ -102,22 +169,14 @@ async def confirm_order(
     user: User = Depends(get_current_restaurant_owner)
 ):
     """Confirm an order"""
-    order = await session.get(Order, order_id)
-    if not order:
-        raise HTTPException(status_code=404, detail="Order not found")
-
-    # Verify ownership
-    restaurant = await session.get(Restaurant, order.restaurant_id)
-    if not restaurant or restaurant.owner_id != user.id:
-        raise HTTPException(status_code=403, detail="Not authorized")
-
-    if order.status != OrderStatus.created:
-        raise HTTPException(status_code=400, detail="Order cannot be confirmed")
-
-    order.status = OrderStatus.confirmed
+    await _transition_order(
+        session, order_id, user.id,
+        Order.status == OrderStatus.created, OrderStatus.confirmed,
+        "Order cannot be confirmed"
+    )
     await session.commit()
 
-    return {"message": "Order confirmed", "order_id": order.id}
+    return {"message": "Order confirmed", "order_id": order_id}
 
 
 @router.post("/{order_id}/preparing")
@@ -127,22 +186,14 @@ async def mark_preparing(
     user: User = Depends(get_current_restaurant_owner)
 ):
     """Mark order as being prepared"""
-    order = await session.get(Order, order_id)
-    if not order:
-        raise HTTPException(status_code=404, detail="Order not found")
-
-    # Verify ownership
-    restaurant = await session.get(Restaurant, order.restaurant_id)
-    if not restaurant or restaurant.owner_id != user.id:
-        raise HTTPException(status_code=403, detail="Not authorized")
-
-    if order.status != OrderStatus.confirmed:
-        raise HTTPException(status_code=400, detail="Order must be confirmed first")
-
-    order.status = OrderStatus.preparing
+    await _transition_order(
+        session, order_id, user.id,
+        Order.status == OrderStatus.confirmed, OrderStatus.preparing,
+        "Order must be confirmed first"
+    )
     await session.commit()
 
-    return {"message": "Order is being prepared", "order_id": order.id}
+    return {"message": "Order is being prepared", "order_id": order_id}
 
 
 @router.post("/{order_id}/ready")
@@ -152,22 +203,14 @@ async def mark_ready(
     user: User = Depends(get_current_restaurant_owner)
 ):
     """Mark order as ready for pickup/delivery"""
-    order = await session.get(Order, order_id)
-    if not order:
-        raise HTTPException(status_code=404, detail="Order not found")
-
-    # Verify ownership
-    restaurant = await session.get(Restaurant, order.restaurant_id)
-    if not restaurant or restaurant.owner_id != user.id:
-        raise HTTPException(status_code=403, detail="Not authorized")
-
-    if order.status != OrderStatus.preparing:
-        raise HTTPException(status_code=400, detail="Order must be preparing first")
-
-    order.status = OrderStatus.ready
+    await _transition_order(
+        session, order_id, user.id,
+        Order.status == OrderStatus.preparing, OrderStatus.ready,
+        "Order must be preparing first"
+    )
     await session.commit()
 
-    return {"message": "Order is ready", "order_id": order.id}
+    return {"message": "Order is ready", "order_id": order_id}
 
 
 @router.post("/{order_id}/cancel")
@@ -175,23 +218,16 @@ async def cancel_order(
     order_id: int,
     reason: str | None = None,
     session: AsyncSession = Depends(get_session),
+    redis: Redis | None = Depends(get_redis),
     user: User = Depends(get_current_restaurant_owner)
 ):
     """Cancel an order"""
-    order = await session.get(Order, order_id)
-    if not order:
-        raise HTTPException(status_code=404, detail="Order not found")
-
-    # Verify ownership
-    restaurant = await session.get(Restaurant, order.restaurant_id)
-    if not restaurant or restaurant.owner_id != user.id:
-        raise HTTPException(status_code=403, detail="Not authorized")
-
-    if order.status in [OrderStatus.delivered, OrderStatus.cancelled]:
-        raise HTTPException(status_code=400, detail="Order cannot be cancelled")
-
-    order.status = OrderStatus.cancelled
+    restaurant_id = await _transition_order(
+        session, order_id, user.id,
+        Order.status.not_in([OrderStatus.delivered, OrderStatus.cancelled]), OrderStatus.cancelled,
+        "Order cannot be cancelled"
+    )
     await session.commit()
+    await cache_delete(redis, analytics_key(restaurant_id))
 
-    return {"message": "Order cancelled", "order_id": order.id}
-
+    return {"message": "Order cancelled", "order_id": order_id}
@@ -1,10 +1,12 @@
 """Restaurant profile management"""
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.deps import get_session, get_current_restaurant_owner
+from app.core.http_cache import etag_json_response
+from app.core.responses import prerendered
 from app.models.user import User
 from app.models.restaurant import Restaurant
 
@@ -55,11 +57,17 @@ class RestaurantUpdateRequest(BaseModel):
 @router.get("/", response_model=list[RestaurantResponse])
 async def get_my_restaurants(
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_current_restaurant_owner)
+    user: User = Depends(get_current_restaurant_owner),
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0)
 ):
-    """Get all restaurants owned by the current user"""
+    """Get the restaurants owned by the current user"""
     result = await session.execute(
-        select(Restaurant).where(Restaurant.owner_id == user.id)
+        select(Restaurant)
+        .where(Restaurant.owner_id == user.id)
+        .order_by(Restaurant.id)
+        .limit(limit)
+        .offset(offset)
     )
     restaurants = result.scalars().all()
 
@@ -87,13 +95,13 @@ async def create_restaurant(
     )
     session.add(restaurant)
     await session.commit()
-    await session.refresh(restaurant)
 
     return RestaurantResponse.model_validate(restaurant)
 
 
-@router.get("/{restaurant_id}", response_model=RestaurantResponse)
+@router.get("/{restaurant_id}", **prerendered(RestaurantResponse))
 async def get_restaurant(
+    request: Request,
     restaurant_id: int,
     session: AsyncSession = Depends(get_session),
     user: User = Depends(get_current_restaurant_owner)
@@ -104,7 +112,8 @@ async def get_restaurant(
     if not restaurant or restaurant.owner_id != user.id:
         raise HTTPException(status_code=404, detail="Restaurant not found")
 
-    return RestaurantResponse.model_validate(restaurant)
+    body = RestaurantResponse.model_validate(restaurant).model_dump_json().encode()
+    return etag_json_response(request, body)
 
 
 @router.patch("/{restaurant_id}", response_model=RestaurantResponse)
@@ -115,32 +124,21 @@ async def update_restaurant(
     user: User = Depends(get_current_restaurant_owner)
 ):
     """Update restaurant details"""
-    restaurant = await session.get(Restaurant, restaurant_id)
-
-    if not restaurant or restaurant.owner_id != user.id:
+    # Fields sent as null are left unchanged
+    changes = data.model_dump(exclude_unset=True, exclude_none=True)
+    owned = (Restaurant.id == restaurant_id, Restaurant.owner_id == user.id)
+
+    if changes:
+        restaurant = await session.scalar(
+            update(Restaurant).where(*owned).values(**changes).returning(Restaurant)
+        )
+    else:
+        restaurant = await session.scalar(select(Restaurant).where(*owned))
+
+    if restaurant is None:
         raise HTTPException(status_code=404, detail="Restaurant not found")
 
-    if data.name is not None:
-        restaurant.name = data.name
-    if data.address is not None:
-        restaurant.address = data.address
-    if data.phone is not None:
-        restaurant.phone = data.phone
-    if data.email is not None:
-        restaurant.email = data.email
-    if data.cuisine_type is not None:
-        restaurant.cuisine_type = data.cuisine_type
-    if data.description is not None:
-        restaurant.description = data.description
-    if data.lat is not None:
-        restaurant.lat = data.lat
-    if data.lon is not None:
-        restaurant.lon = data.lon
-    if data.is_active is not None:
-        restaurant.is_active = data.is_active
-
     await session.commit()
-    await session.refresh(restaurant)
 
     return RestaurantResponse.model_validate(restaurant)
 
@@ -1,13 +1,16 @@
 """Rider/Driver delivery management"""
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 from datetime import datetime
-from sqlalchemy import select
+from sqlalchemy import select, insert, update, literal, exists, func, cast, lambda_stmt, BigInteger
 from sqlalchemy.ext.asyncio import AsyncSession
+from redis.asyncio import Redis
 
-from app.core.deps import get_session, get_current_driver
+from app.config import settings
+from app.core.cache import get_redis, analytics_key, cache_delete
+from app.core.deps import get_session, get_current_driver, get_current_driver_profile
 from app.models.user import User
-from app.models.driver import Driver, Delivery
+from app.models.driver import Driver, Delivery, Shift
 from app.models.order import Order, OrderStatus
 
 router = APIRouter()
@@ -17,10 +20,10 @@ class DeliveryResponse(BaseModel):
     id: int
     order_id: int
     driver_id: int
-    status: str
-    pickup_time: datetime | None
-    delivery_time: datetime | None
-    driver_earning: float | None
+    assigned_at: datetime
+    picked_at: datetime | None
+    delivered_at: datetime | None
+    distance_km: float
 
     class Config:
         from_attributes = True
@@ -38,21 +41,35 @@ class OrderDetailsResponse(BaseModel):
     total: float
 
 
+async def _get_own_delivery(session: AsyncSession, delivery_id: int, driver_id: int) -> Delivery:
+    """Fetch one of the driver's deliveries; used to explain a rejected status update"""
+    delivery = await session.scalar(lambda_stmt(
+        lambda: select(Delivery).where(Delivery.id == delivery_id, Delivery.driver_id == driver_id)
+    ))
+    if delivery is None:
+        raise HTTPException(status_code=404, detail="Delivery not found")
+    return delivery
+
+
 @router.get("/available", response_model=list[dict])
 async def get_available_deliveries(
     session: AsyncSession = Depends(get_session),
     user: User = Depends(get_current_driver)
 ):
     """Get available deliveries waiting for assignment"""
-    # Find orders that are ready and not assigned
-    result = await session.execute(
-        select(Order)
+    # Find orders that are ready and not picked up; NOT EXISTS plans as an
+    # anti-join probing the unique deliveries.order_id index.
+    # The hot read queries here use lambda_stmt so the statement is built and
+    # compiled once per call site instead of on every request
+    result = await session.execute(lambda_stmt(
+        lambda: select(Order)
         .where(Order.status == OrderStatus.ready)
-        .where(~Order.id.in_(
-            select(Delivery.order_id).where(Delivery.pickup_time != None)
+        .where(~exists().where(
+            Delivery.order_id == Order.id,
+            Delivery.picked_at.is_not(None)
         ))
         .limit(20)
-    )
+    ))
     orders = result.scalars().all()
 
     return [
@@ -61,7 +78,7 @@ async def get_available_deliveries(
             "restaurant_id": o.restaurant_id,
             "customer_address": o.customer_address,
             "distance_km": o.distance_km,
-            "total": float(o.total)
+            "total": o.total / 100
         }
         for o in orders
     ]
@@ -71,64 +88,76 @@ async def get_available_deliveries(
 async def accept_delivery(
     order_id: int,
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_current_driver)
+    driver: Driver = Depends(get_current_driver_profile)
 ):
-    """Accept a delivery assignment"""
-    # Get driver
-    result = await session.execute(
-        select(Driver).where(Driver.user_id == user.id)
-    )
-    driver = result.scalar_one_or_none()
-
-    if not driver or not driver.is_available:
+    """Accept a delivery assignment (requires an active driver with an open shift)"""
+    if not driver.is_active:
         raise HTTPException(status_code=400, detail="Driver not available")
 
-    # Get order
-    order = await session.get(Order, order_id)
-    if not order or order.status != OrderStatus.ready:
+    # Claim the order and create the delivery in one statement:
+    # WITH claimed AS (UPDATE orders ... RETURNING id) INSERT ... SELECT FROM claimed.
+    # The status and open-shift checks are part of the UPDATE, so two riders
+    # can't both claim it and a rider off shift can't claim it at all.
+    driver_id = driver.id
+    on_shift = exists().where(Shift.driver_id == driver_id, Shift.ends_at.is_(None))
+    claimed = (
+        update(Order)
+        .where(Order.id == order_id, Order.status == OrderStatus.ready, on_shift)
+        .values(status=OrderStatus.assigned)
+        .returning(Order.id, Order.distance_km)
+        .cte("claimed")
+    )
+    delivery_id = await session.scalar(
+        insert(Delivery)
+        .add_cte(claimed)
+        .from_select(
+            ["order_id", "driver_id", "distance_km"],
+            select(claimed.c.id, literal(driver_id), func.coalesce(claimed.c.distance_km, 0))
+        )
+        .returning(Delivery.id)
+    )
+    if delivery_id is None:
+        if not await session.scalar(select(on_shift)):
+            raise HTTPException(status_code=400, detail="Driver not available")
         raise HTTPException(status_code=400, detail="Order not available for pickup")
 
-    # Create delivery
-    delivery = Delivery(
-        order_id=order_id,
-        driver_id=driver.id
-    )
-    session.add(delivery)
-    order.status = OrderStatus.assigned
     await session.commit()
 
-    return {"message": "Delivery accepted", "delivery_id": delivery.id}
+    return {"message": "Delivery accepted", "delivery_id": delivery_id}
 
 
 @router.post("/{delivery_id}/pickup")
 async def mark_picked_up(
     delivery_id: int,
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_current_driver)
+    driver: Driver = Depends(get_current_driver_profile)
 ):
     """Mark delivery as picked up from restaurant"""
-    result = await session.execute(
-        select(Driver).where(Driver.user_id == user.id)
+    # One statement for both tables, timestamped by Postgres:
+    # WITH picked AS (UPDATE deliveries ... RETURNING order_id) UPDATE orders ...
+    picked = (
+        update(Delivery)
+        .where(
+            Delivery.id == delivery_id,
+            Delivery.driver_id == driver.id,
+            Delivery.picked_at.is_(None)
+        )
+        .values(picked_at=func.now())
+        .returning(Delivery.order_id)
+        .cte("picked")
     )
-    driver = result.scalar_one_or_none()
-
-    if not driver:
-        raise HTTPException(status_code=404, detail="Driver profile not found")
-
-    delivery = await session.get(Delivery, delivery_id)
-    if not delivery or delivery.driver_id != driver.id:
-        raise HTTPException(status_code=404, detail="Delivery not found")
-
-    if delivery.pickup_time:
+    order_id = await session.scalar(
+        update(Order)
+        .add_cte(picked)
+        .where(Order.id == picked.c.order_id)
+        .values(status=OrderStatus.picked_up)
+        .returning(Order.id)
+        .execution_options(synchronize_session=False)
+    )
+    if order_id is None:
+        await _get_own_delivery(session, delivery_id, driver.id)
         raise HTTPException(status_code=400, detail="Already marked as picked up")
 
-    delivery.pickup_time = datetime.utcnow()
-
-    # Update order status
-    order = await session.get(Order, delivery.order_id)
-    if order:
-        order.status = OrderStatus.picked_up
-
     await session.commit()
 
     return {"message": "Marked as picked up"}
@@ -138,62 +167,72 @@ async def mark_picked_up(
 async def mark_delivered(
     delivery_id: int,
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_current_driver)
+    redis: Redis | None = Depends(get_redis),
+    driver: Driver = Depends(get_current_driver_profile)
 ):
     """Mark delivery as completed"""
+    # Stamp the delivery and store the earning (cents) from its distance,
+    # guarded on the order's status (UPDATE ... FROM orders), then mark the
+    # order delivered, in one statement. A cancelled order can't be completed
+    done = (
+        update(Delivery)
+        .where(
+            Delivery.id == delivery_id,
+            Delivery.driver_id == driver.id,
+            Delivery.picked_at.is_not(None),
+            Delivery.delivered_at.is_(None),
+            Order.id == Delivery.order_id,
+            Order.status == OrderStatus.picked_up
+        )
+        .values(
+            delivered_at=func.now(),
+            driver_earning=cast(
+                func.round(Delivery.distance_km * (settings.BIKE_PAY_PER_KM * 100)), BigInteger
+            )
+        )
+        .returning(Delivery.order_id, Delivery.driver_earning)
+        .cte("done")
+    )
     result = await session.execute(
-        select(Driver).where(Driver.user_id == user.id)
+        update(Order)
+        .add_cte(done)
+        .where(Order.id == done.c.order_id)
+        .values(status=OrderStatus.delivered)
+        .returning(Order.restaurant_id, done.c.driver_earning)
+        .execution_options(synchronize_session=False)
     )
-    driver = result.scalar_one_or_none()
-
-    if not driver:
-        raise HTTPException(status_code=404, detail="Driver profile not found")
-
-    delivery = await session.get(Delivery, delivery_id)
-    if not delivery or delivery.driver_id != driver.id:
-        raise HTTPException(status_code=404, detail="Delivery not found")
-
-    if not delivery.pickup_time:
-        raise HTTPException(status_code=400, detail="Must mark as picked up first")
-
-    if delivery.delivery_time:
-        raise HTTPException(status_code=400, detail="Already marked as delivered")
-
-    delivery.delivery_time = datetime.utcnow()
-
-    # Update order status
-    order = await session.get(Order, delivery.order_id)
-    if order:
-        order.status = OrderStatus.delivered
-        # Calculate driver earning
-        from app.config import settings
-        if order.distance_km:
-            delivery.driver_earning = order.distance_km * settings.BIKE_PAY_PER_KM
+    row = result.first()
+    if row is None:
+        delivery = await _get_own_delivery(session, delivery_id, driver.id)
+        if not delivery.picked_at:
+            raise HTTPException(status_code=400, detail="Must mark as picked up first")
+        if delivery.delivered_at:
+            raise HTTPException(status_code=400, detail="Already marked as delivered")
+        raise HTTPException(status_code=400, detail="Order is no longer out for delivery")
 
     await session.commit()
+    await cache_delete(redis, analytics_key(row.restaurant_id))
 
-    return {"message": "Delivery completed", "earning": delivery.driver_earning}
+    return {"message": "Delivery completed", "earning": row.driver_earning / 100}
 
 
 @router.get("/active", response_model=list[DeliveryResponse])
 async def get_active_deliveries(
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_current_driver)
+    driver: Driver = Depends(get_current_driver_profile),
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0)
 ):
     """Get current active deliveries for this driver"""
-    result = await session.execute(
-        select(Driver).where(Driver.user_id == user.id)
-    )
-    driver = result.scalar_one_or_none()
-
-    if not driver:
-        raise HTTPException(status_code=404, detail="Driver profile not found")
-
-    deliveries_result = await session.execute(
-        select(Delivery)
-        .where(Delivery.driver_id == driver.id)
-        .where(Delivery.delivery_time == None)
-    )
+    driver_id = driver.id
+    deliveries_result = await session.execute(lambda_stmt(
+        lambda: select(Delivery)
+        .where(Delivery.driver_id == driver_id)
+        .where(Delivery.delivered_at == None)
+        .order_by(Delivery.id)
+        .limit(limit)
+        .offset(offset)
+    ))
     deliveries = deliveries_result.scalars().all()
 
     return [DeliveryResponse.model_validate(d) for d in deliveries]
@@ -202,25 +241,18 @@ async def get_active_deliveries(
 @router.get("/history", response_model=list[DeliveryResponse])
 async def get_delivery_history(
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_current_driver),
+    driver: Driver = Depends(get_current_driver_profile),
     limit: int = 50
 ):
     """Get delivery history"""
-    result = await session.execute(
-        select(Driver).where(Driver.user_id == user.id)
-    )
-    driver = result.scalar_one_or_none()
-
-    if not driver:
-        raise HTTPException(status_code=404, detail="Driver profile not found")
-
-    deliveries_result = await session.execute(
-        select(Delivery)
-        .where(Delivery.driver_id == driver.id)
-        .where(Delivery.delivery_time != None)
-        .order_by(Delivery.delivery_time.desc())
+    driver_id = driver.id
+    deliveries_result = await session.execute(lambda_stmt(
+        lambda: select(Delivery)
+        .where(Delivery.driver_id == driver_id)
+        .where(Delivery.delivered_at != None)
+        .order_by(Delivery.delivered_at.desc())
         .limit(limit)
-    )
+    ))
     deliveries = deliveries_result.scalars().all()
 
     return [DeliveryResponse.model_validate(d) for d in deliveries]
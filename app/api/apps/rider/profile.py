@@ -1,10 +1,12 @@
 """Rider/Driver profile and vehicle management"""
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import select, exists
 from sqlalchemy.ext.asyncio import AsyncSession
+from redis.asyncio import Redis
 
-from app.core.deps import get_session, get_current_driver
+from app.core.cache import get_redis, driver_key, cache_delete
+from app.core.deps import get_session, get_current_driver, get_current_driver_profile
 from app.models.user import User
 from app.models.driver import Driver, VehicleType
 
@@ -60,12 +62,7 @@ async def create_driver_profile(
 ):
     """Create driver profile with vehicle information"""
     # Check if profile already exists
-    result = await session.execute(
-        select(Driver).where(Driver.user_id == user.id)
-    )
-    existing = result.scalar_one_or_none()
-
-    if existing:
+    if await session.scalar(select(exists().where(Driver.user_id == user.id))):
         raise HTTPException(status_code=400, detail="Driver profile already exists")
 
     driver = Driver(
@@ -84,24 +81,18 @@ async def create_driver_profile(
 async def update_driver_profile(
     data: DriverProfileUpdateRequest,
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_current_driver)
+    redis: Redis | None = Depends(get_redis),
+    user: User = Depends(get_current_driver),
+    driver: Driver = Depends(get_current_driver_profile)
 ):
     """Update driver profile"""
-    result = await session.execute(
-        select(Driver).where(Driver.user_id == user.id)
-    )
-    driver = result.scalar_one_or_none()
-
-    if not driver:
-        raise HTTPException(status_code=404, detail="Driver profile not found")
-
     if data.vehicle_type is not None:
         driver.vehicle_type = data.vehicle_type
     if data.license_plate is not None:
         driver.license_plate = data.license_plate
 
     await session.commit()
-    await session.refresh(driver)
+    await cache_delete(redis, driver_key(driver.user_id))
 
     return DriverProfileResponse(
         user_id=user.id,
@@ -120,19 +111,13 @@ async def update_driver_profile(
 async def toggle_availability(
     is_available: bool,
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_current_driver)
+    redis: Redis | None = Depends(get_redis),
+    driver: Driver = Depends(get_current_driver_profile)
 ):
     """Toggle driver availability status"""
-    result = await session.execute(
-        select(Driver).where(Driver.user_id == user.id)
-    )
-    driver = result.scalar_one_or_none()
-
-    if not driver:
-        raise HTTPException(status_code=404, detail="Driver profile not found")
-
     driver.is_available = is_available
     await session.commit()
+    await cache_delete(redis, driver_key(driver.user_id))
 
     return {"message": "Availability updated", "is_available": is_available}
 
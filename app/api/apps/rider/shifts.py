@@ -1,12 +1,14 @@
 """Rider/Driver shift management"""
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import Response
+from pydantic import BaseModel, TypeAdapter
 from datetime import datetime
-from sqlalchemy import select
+from sqlalchemy import select, insert, update, func, lambda_stmt
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.deps import get_session, get_current_driver
-from app.models.user import User
+from app.core.deps import get_session, get_current_driver_profile
+from app.core.responses import prerendered
 from app.models.driver import Driver, Shift
 
 router = APIRouter()
@@ -15,112 +17,80 @@ router = APIRouter()
 class ShiftResponse(BaseModel):
     id: int
     driver_id: int
-    start_time: datetime
-    end_time: datetime | None
-    start_lat: float | None
-    start_lon: float | None
-    end_lat: float | None
-    end_lon: float | None
+    starts_at: datetime
+    ends_at: datetime | None
+    geofence_id: int | None
 
     class Config:
         from_attributes = True
 
 
+_shift_list = TypeAdapter(list[ShiftResponse])
+
+# Accepted so existing clients keep working; Shift has no location columns,
+# so the values are not stored
+_IGNORED_LOCATION = dict(deprecated=True, description="Ignored; shift locations are not stored")
+
+
 @router.post("/start", status_code=201)
 async def start_shift(
-    lat: float | None = None,
-    lon: float | None = None,
+    lat: float | None = Query(None, **_IGNORED_LOCATION),
+    lon: float | None = Query(None, **_IGNORED_LOCATION),
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_current_driver)
+    driver: Driver = Depends(get_current_driver_profile)
 ):
     """Start a new shift"""
-    # Get driver
-    result = await session.execute(
-        select(Driver).where(Driver.user_id == user.id)
-    )
-    driver = result.scalar_one_or_none()
-
-    if not driver:
-        raise HTTPException(status_code=404, detail="Driver profile not found")
-
-    # Check if there's an active shift
-    active_shift = await session.execute(
-        select(Shift)
-        .where(Shift.driver_id == driver.id)
-        .where(Shift.end_time == None)
-    )
-    if active_shift.scalar_one_or_none():
+    # One INSERT; starts_at is stamped by the server default. The partial
+    # unique index on open shifts (uq_shifts_driver_open) rejects a second
+    # concurrent start
+    try:
+        shift_id = await session.scalar(
+            insert(Shift).values(driver_id=driver.id).returning(Shift.id)
+        )
+    except IntegrityError:
+        await session.rollback()
         raise HTTPException(status_code=400, detail="Active shift already exists")
 
-    shift = Shift(
-        driver_id=driver.id,
-        start_time=datetime.utcnow(),
-        start_lat=lat,
-        start_lon=lon
-    )
-    session.add(shift)
-    driver.is_available = True
     await session.commit()
 
-    return {"message": "Shift started", "shift_id": shift.id}
+    return {"message": "Shift started", "shift_id": shift_id}
 
 
 @router.post("/end")
 async def end_shift(
-    lat: float | None = None,
-    lon: float | None = None,
+    lat: float | None = Query(None, **_IGNORED_LOCATION),
+    lon: float | None = Query(None, **_IGNORED_LOCATION),
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_current_driver)
+    driver: Driver = Depends(get_current_driver_profile)
 ):
     """End the current shift"""
-    # Get driver
-    result = await session.execute(
-        select(Driver).where(Driver.user_id == user.id)
-    )
-    driver = result.scalar_one_or_none()
-
-    if not driver:
-        raise HTTPException(status_code=404, detail="Driver profile not found")
-
-    # Find active shift
-    active_shift_result = await session.execute(
-        select(Shift)
-        .where(Shift.driver_id == driver.id)
-        .where(Shift.end_time == None)
+    # Close the open shift in one statement, found through uq_shifts_driver_open
+    shift_id = await session.scalar(
+        update(Shift)
+        .where(Shift.driver_id == driver.id, Shift.ends_at.is_(None))
+        .values(ends_at=func.now())
+        .returning(Shift.id)
     )
-    shift = active_shift_result.scalar_one_or_none()
-
-    if not shift:
+    if shift_id is None:
         raise HTTPException(status_code=404, detail="No active shift found")
 
-    shift.end_time = datetime.utcnow()
-    shift.end_lat = lat
-    shift.end_lon = lon
-    driver.is_available = False
     await session.commit()
 
-    return {"message": "Shift ended", "shift_id": shift.id}
+    return {"message": "Shift ended", "shift_id": shift_id}
 
 
 @router.get("/active", response_model=ShiftResponse | None)
 async def get_active_shift(
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_current_driver)
+    driver: Driver = Depends(get_current_driver_profile)
 ):
     """Get current active shift"""
-    result = await session.execute(
-        select(Driver).where(Driver.user_id == user.id)
-    )
-    driver = result.scalar_one_or_none()
-
-    if not driver:
-        raise HTTPException(status_code=404, detail="Driver profile not found")
-
-    shift_result = await session.execute(
-        select(Shift)
-        .where(Shift.driver_id == driver.id)
-        .where(Shift.end_time == None)
-    )
+    driver_id = driver.id
+    shift_result = await session.execute(lambda_stmt(
+        lambda: select(Shift)
+        .where(Shift.driver_id == driver_id)
+        .where(Shift.ends_at.is_(None))
+    ))
     shift = shift_result.scalar_one_or_none()
 
     if not shift:
@@ -129,28 +99,27 @@ async def get_active_shift(
     return ShiftResponse.model_validate(shift)
 
 
-@router.get("/history", response_model=list[ShiftResponse])
+@router.get("/history", **prerendered(list[ShiftResponse]))
 async def get_shift_history(
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_current_driver),
+    driver: Driver = Depends(get_current_driver_profile),
     limit: int = 20
 ):
     """Get shift history"""
-    result = await session.execute(
-        select(Driver).where(Driver.user_id == user.id)
-    )
-    driver = result.scalar_one_or_none()
-
-    if not driver:
-        raise HTTPException(status_code=404, detail="Driver profile not found")
-
-    shifts_result = await session.execute(
-        select(Shift)
-        .where(Shift.driver_id == driver.id)
-        .order_by(Shift.start_time.desc())
+    # Plain column rows, validated and encoded to JSON in one pydantic-core
+    # pass (no ORM instances, no per-row model objects, no re-validation)
+    driver_id = driver.id
+    shifts_result = await session.execute(lambda_stmt(
+        lambda: select(
+            Shift.id, Shift.driver_id, Shift.starts_at, Shift.ends_at, Shift.geofence_id,
+        )
+        .where(Shift.driver_id == driver_id)
+        .order_by(Shift.starts_at.desc())
         .limit(limit)
-    )
-    shifts = shifts_result.scalars().all()
+    ))
 
-    return [ShiftResponse.model_validate(s) for s in shifts]
+    return Response(
+        content=_shift_list.dump_json(_shift_list.validate_python(shifts_result.all(), from_attributes=True)),
+        media_type="application/json"
+    )
 
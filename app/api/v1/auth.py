@@ -1,6 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, exists, false
+from sqlalchemy.orm import undefer
 
 from app.db.session import get_session
 from app.models.user import User, UserRole
@@ -17,13 +19,15 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 
 @router.post("/signup", response_model=TokenOut, status_code=201)
 async def signup(data: SignupIn, session: AsyncSession = Depends(get_session)):
-    if data.email:
-        res = await session.execute(select(User).where(User.email == data.email))
-        if res.scalar_one_or_none():
+    if data.email or data.phone:
+        # Both uniqueness checks as EXISTS flags in one round trip
+        email_taken, phone_taken = (await session.execute(select(
+            exists().where(User.email == data.email) if data.email else false(),
+            exists().where(User.phone == data.phone) if data.phone else false(),
+        ))).one()
+        if email_taken:
             raise HTTPException(status_code=400, detail="Email already in use")
-    if data.phone:
-        res = await session.execute(select(User).where(User.phone == data.phone))
-        if res.scalar_one_or_none():
+        if phone_taken:
             raise HTTPException(status_code=400, detail="Phone already in use")
 
     user = User(
@@ -33,11 +37,10 @@ async def signup(data: SignupIn, session: AsyncSession = Depends(get_session)):
         last_name=data.last_name,
         date_of_birth=None,  # parse ISO date string if you want to store it
         role=UserRole.customer,
-        hashed_password=hash_password(data.password),
+        hashed_password=await run_in_threadpool(hash_password, data.password),
     )
     session.add(user)
     await session.commit()
-    await session.refresh(user)
 
     access = create_access_token(str(user.id))
     refresh = create_refresh_token(str(user.id))
@@ -46,9 +49,11 @@ async def signup(data: SignupIn, session: AsyncSession = Depends(get_session)):
 
 @router.post("/login", response_model=TokenOut)
 async def login(data: LoginIn, session: AsyncSession = Depends(get_session)):
-    res = await session.execute(select(User).where(User.email == data.email))
+    res = await session.execute(
+        select(User).options(undefer(User.hashed_password)).where(User.email == data.email)
+    )
     user = res.scalar_one_or_none()
-    if not user or not verify_password(data.password, user.hashed_password):
+    if not user or not await run_in_threadpool(verify_password, data.password, user.hashed_password):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
     access = create_access_token(str(user.id))
     refresh = create_refresh_token(str(user.id))
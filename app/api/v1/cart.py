@@ -1,10 +1,14 @@
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel
+from sqlalchemy import select, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.deps import get_session, get_current_user
 from app.models import MenuItem
+from app.models.restaurant import Restaurant
 from app.services.suggestion_service import suggest_items
 from app.services.pricing_service import Quote
+from app.utils.distance import haversine_km
+from app.utils.money import to_cents
 
 router = APIRouter(prefix="/cart", tags=["cart"])
 
@@ -24,30 +28,35 @@ class CartQuoteIn(BaseModel):
 
 @router.post("/quote")
 async def quote(data: CartQuoteIn, session: AsyncSession = Depends(get_session)):
-    # fetch prices & compute subtotal
-    from sqlalchemy import select
+    # fetch prices & compute subtotal; plain column rows (no ORM hydration),
+    # with the restaurant's coordinates riding along in the same round trip
     ids = [i.menu_item_id for i in data.items]
-    res = await session.execute(select(MenuItem).where(MenuItem.id.in_(ids)))
-    menu = {m.id: m for m in res.scalars()}
-    subtotal = sum(float(menu[i.menu_item_id].price) * i.quantity for i in data.items)
+    restaurant_id = data.restaurant_id
+    res = await session.execute(lambda_stmt(
+        lambda: select(MenuItem.id, MenuItem.price, Restaurant.lat, Restaurant.lon)
+        .outerjoin(Restaurant, Restaurant.id == restaurant_id)
+        .where(MenuItem.id.in_(ids))
+    ))
+    rows = res.all()
+    menu = {row.id: row.price for row in rows}
+    subtotal = sum(to_cents(menu[i.menu_item_id]) * i.quantity for i in data.items)
 
     # distance
-    from app.models.restaurant import Restaurant
-    r = await session.get(Restaurant, data.restaurant_id)
     distance_km = None
-    if data.order_type == "delivery" and r and r.lat and r.lon and data.customer_lat and data.customer_lon:
-        from app.utils.distance import haversine_km
-    distance_km = haversine_km(r.lat, r.lon, data.customer_lat, data.customer_lon)
+    if data.order_type == "delivery" and rows:
+        r_lat, r_lon = rows[0].lat, rows[0].lon
+        if r_lat and r_lon and data.customer_lat and data.customer_lon:
+            distance_km = haversine_km(r_lat, r_lon, data.customer_lat, data.customer_lon)
 
     q = Quote(subtotal=subtotal, distance_km=distance_km, order_type=data.order_type)
 
     suggestions = await suggest_items(session, data.restaurant_id, exclude_ids=ids)
 
     return {
-        "subtotal": q.subtotal,
-        "service_fee": q.service_fee,
-        "delivery_fee": q.delivery_fee,
-        "total": q.total,
+        "subtotal": q.subtotal / 100,
+        "service_fee": q.service_fee / 100,
+        "delivery_fee": q.delivery_fee / 100,
+        "total": q.total / 100,
         "distance_km": distance_km,
         "suggested_items": suggestions,
     }
@@ -10,31 +10,67 @@ This provides a centralized view for managing:
 - System statistics
 """
 from typing import Annotated, Optional
+import asyncio
+import orjson
 from fastapi import APIRouter, Depends, Query, Request
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
+from redis.asyncio import Redis
 from datetime import datetime, timedelta
 
+from app.config import settings
+from app.core.cache import get_redis, dashboard_key, cache_get, cache_set
 from app.core.deps import get_session, get_current_user
+from app.db.session import AsyncSessionLocal
 from app.core.rbac_deps import require_admin_access, get_current_user_scopes
 from app.models.user import User
 from app.models.rbac import Role, UserRole as UserRoleModel, City, ShiftLead
-from app.models.order import Order, OrderStatus
+from app.models.order import Order, OrderStatus, PENDING_STATES
 from app.models.restaurant import Restaurant
+from app.services.city_service import get_active_cities
 from app.services.rbac_service import UserScopes
 
 router = APIRouter(prefix="/dashboard", tags=["Admin Dashboard"])
 
 # Templates directory will be created
-templates = Jinja2Templates(directory="app/templates")
+# Compiled templates stay in memory; outside dev they are not re-stat()ed on
+# every render, and the bytecode cache (system temp dir) lets new workers
+# skip re-compiling them
+templates = Jinja2Templates(env=Environment(
+    loader=FileSystemLoader("app/templates"),
+    autoescape=True,
+    auto_reload=settings.ENV == "dev",
+    bytecode_cache=FileSystemBytecodeCache(),
+))
+
+
+# Columns the order tables render (templates read rows like objects); totals
+# are stored in cents
+_ORDER_LIST_COLUMNS = (
+    Order.id, Order.customer_name, Order.restaurant_id, Order.status,
+    (Order.total / 100.0).label("total"), Order.created_at,
+)
+
+
+async def _fetch_rows(stmt) -> list:
+    """
+    Run a read-only column query on its own pooled session
+
+    Lets a page's independent dropdown queries run concurrently with its main
+    query (one AsyncSession can only run one statement at a time)
+    """
+    async with AsyncSessionLocal() as s:
+        return (await s.execute(stmt)).all()
 
 
 @router.get("/", response_class=HTMLResponse)
 async def dashboard_home(
     request: Request,
     session: Annotated[AsyncSession, Depends(get_session)],
+    redis: Annotated[Redis | None, Depends(get_redis)],
     user: Annotated[User, Depends(get_current_user)],
     scopes: Annotated[UserScopes, Depends(require_admin_access)]
 ):
@@ -42,7 +78,7 @@ async def dashboard_home(
     Main dashboard page with overview statistics
     """
     # Get statistics based on user's scope
-    stats = await get_dashboard_stats(session, scopes)
+    stats = await get_dashboard_stats(session, scopes, redis)
 
     return templates.TemplateResponse(
         "dashboard/index.html",
@@ -116,21 +152,16 @@ async def user_roles_management(
     if city_id:
         query = query.where(UserRoleModel.city_id == city_id)
 
-    result = await session.execute(query.order_by(UserRoleModel.assigned_at.desc()))
+    # Assignments plus the user / role / city dropdowns, run concurrently.
+    # Dropdowns only render a few columns, so fetch just those as plain rows
+    result, all_users, all_roles, all_cities = await asyncio.gather(
+        session.execute(query.order_by(UserRoleModel.assigned_at.desc())),
+        _fetch_rows(select(User.id, User.first_name, User.last_name, User.email).limit(100)),
+        _fetch_rows(select(Role.code, Role.name).where(Role.is_active == True)),
+        get_active_cities(),
+    )
     user_roles = result.all()
 
-    # Get all users for assignment dropdown
-    users_result = await session.execute(select(User).limit(100))
-    all_users = users_result.scalars().all()
-
-    # Get all roles for assignment dropdown
-    roles_result = await session.execute(select(Role).where(Role.is_active == True))
-    all_roles = roles_result.scalars().all()
-
-    # Get cities for scope selection
-    cities_result = await session.execute(select(City).where(City.is_active == True))
-    all_cities = cities_result.scalars().all()
-
     return templates.TemplateResponse(
         "dashboard/user_roles.html",
         {
@@ -156,37 +187,29 @@ async def cities_management(
     """
     Cities management page
     """
-    # Get cities based on scope
-    query = select(City).where(City.is_active == True)
+    # Cities with their restaurant / order counts as correlated subqueries,
+    # so the page is one query however many cities are in scope
+    restaurant_count = (
+        select(func.count()).select_from(Restaurant)
+        .where(Restaurant.city_id == City.id, Restaurant.is_active == True)
+        .scalar_subquery()
+    )
+    order_count = (
+        select(func.count()).select_from(Order)
+        .where(Order.city_id == City.id)
+        .scalar_subquery()
+    )
+    query = select(City, restaurant_count, order_count).where(City.is_active == True)
 
     if not scopes.is_super_admin and scopes.has_city_scope():
         query = query.where(City.id.in_(scopes.city_ids))
 
     result = await session.execute(query.order_by(City.name))
-    cities = result.scalars().all()
-
-    # Get city statistics
+    cities = []
     city_stats = {}
-    for city in cities:
-        # Count restaurants
-        rest_count = await session.execute(
-            select(func.count()).select_from(Restaurant).where(
-                Restaurant.city_id == city.id,
-                Restaurant.is_active == True
-            )
-        )
-
-        # Count orders
-        order_count = await session.execute(
-            select(func.count()).select_from(Order).where(
-                Order.city_id == city.id
-            )
-        )
-
-        city_stats[city.id] = {
-            "restaurants": rest_count.scalar(),
-            "orders": order_count.scalar()
-        }
+    for city, restaurants, orders in result:
+        cities.append(city)
+        city_stats[city.id] = {"restaurants": restaurants, "orders": orders}
 
     return templates.TemplateResponse(
         "dashboard/cities.html",
@@ -214,7 +237,10 @@ async def restaurants_management(
     Restaurant management page - approve/manage restaurants
     """
     # Build query
-    query = select(Restaurant)
+    query = select(
+        Restaurant.id, Restaurant.name, Restaurant.address, Restaurant.city_id,
+        Restaurant.cuisine_type, Restaurant.is_active, Restaurant.is_approved,
+    )
 
     # Apply scope filters
     if not scopes.is_super_admin:
@@ -230,16 +256,14 @@ async def restaurants_management(
     if pending_only:
         query = query.where(Restaurant.is_approved == False)
 
-    result = await session.execute(query.order_by(Restaurant.created_at.desc()).limit(100))
-    restaurants = result.scalars().all()
-
     # Get cities for filter
-    cities_query = select(City).where(City.is_active == True)
-    if not scopes.is_super_admin and scopes.has_city_scope():
-        cities_query = cities_query.where(City.id.in_(scopes.city_ids))
+    city_scope = scopes.city_ids if not scopes.is_super_admin and scopes.has_city_scope() else None
 
-    cities_result = await session.execute(cities_query)
-    cities = cities_result.scalars().all()
+    result, cities = await asyncio.gather(
+        session.execute(query.order_by(Restaurant.created_at.desc()).limit(100)),
+        get_active_cities(city_scope),
+    )
+    restaurants = result.all()
 
     return templates.TemplateResponse(
         "dashboard/restaurants.html",
@@ -267,7 +291,7 @@ async def orders_management(
     Orders management page - view and manage orders
     """
     # Build query
-    query = select(Order)
+    query = select(*_ORDER_LIST_COLUMNS)
 
     # Apply scope filters
     if not scopes.is_super_admin:
@@ -283,18 +307,14 @@ async def orders_management(
     if status:
         query = query.where(Order.status == status)
 
-    result = await session.execute(
-        query.order_by(Order.created_at.desc()).limit(100)
-    )
-    orders = result.scalars().all()
-
     # Get cities for filter
-    cities_query = select(City).where(City.is_active == True)
-    if not scopes.is_super_admin and scopes.has_city_scope():
-        cities_query = cities_query.where(City.id.in_(scopes.city_ids))
+    city_scope = scopes.city_ids if not scopes.is_super_admin and scopes.has_city_scope() else None
 
-    cities_result = await session.execute(cities_query)
-    cities = cities_result.scalars().all()
+    result, cities = await asyncio.gather(
+        session.execute(query.order_by(Order.created_at.desc()).limit(100)),
+        get_active_cities(city_scope),
+    )
+    orders = result.all()
 
     return templates.TemplateResponse(
         "dashboard/orders.html",
@@ -322,7 +342,12 @@ async def shift_leads_management(
     Shift leads management page
     """
     # Build query
-    query = select(ShiftLead).where(ShiftLead.is_active == True)
+    query = select(
+        ShiftLead.user_id, ShiftLead.city_id,
+        ShiftLead.min_hours_per_shift, ShiftLead.max_hours_per_shift,
+        ShiftLead.min_hours_per_week, ShiftLead.max_hours_per_week,
+        ShiftLead.is_active,
+    ).where(ShiftLead.is_active == True)
 
     # Apply scope filters
     if not scopes.is_super_admin and scopes.has_city_scope():
@@ -332,20 +357,16 @@ async def shift_leads_management(
     if city_id:
         query = query.where(ShiftLead.city_id == city_id)
 
-    result = await session.execute(query)
-    shift_leads = result.scalars().all()
-
     # Get cities for filter and assignment
-    cities_query = select(City).where(City.is_active == True)
-    if not scopes.is_super_admin and scopes.has_city_scope():
-        cities_query = cities_query.where(City.id.in_(scopes.city_ids))
-
-    cities_result = await session.execute(cities_query)
-    cities = cities_result.scalars().all()
+    city_scope = scopes.city_ids if not scopes.is_super_admin and scopes.has_city_scope() else None
 
-    # Get users for assignment
-    users_result = await session.execute(select(User).limit(100))
-    users = users_result.scalars().all()
+    # Shift leads, cities and users (for assignment) concurrently
+    result, cities, users = await asyncio.gather(
+        session.execute(query),
+        get_active_cities(city_scope),
+        _fetch_rows(select(User.id, User.first_name, User.last_name).limit(100)),
+    )
+    shift_leads = result.all()
 
     return templates.TemplateResponse(
         "dashboard/shift_leads.html",
@@ -361,9 +382,14 @@ async def shift_leads_management(
     )
 
 
-async def get_dashboard_stats(session: AsyncSession, scopes: UserScopes):
+async def get_dashboard_stats(
+    session: AsyncSession, scopes: UserScopes, redis: Redis | None = None
+):
     """
     Get dashboard statistics based on user's scope
+
+    The counters are slow-moving and scan whole tables, so they are cached
+    per scope for DASHBOARD_CACHE_TTL_SECONDS; recent orders are always live.
     """
     stats = {
         "total_orders": 0,
@@ -377,74 +403,70 @@ async def get_dashboard_stats(session: AsyncSession, scopes: UserScopes):
         "recent_orders": []
     }
 
-    # Base queries
-    orders_query = select(Order)
-    restaurants_query = select(Restaurant).where(Restaurant.is_active == True)
-
-    # Apply scope filters
+    # Scope filters (and the matching cache key)
+    order_scope = []
+    restaurant_scope = [Restaurant.is_active == True]
+    scope_key = "all"
     if not scopes.is_super_admin:
         if scopes.has_city_scope():
-            orders_query = orders_query.where(Order.city_id.in_(scopes.city_ids))
-            restaurants_query = restaurants_query.where(Restaurant.city_id.in_(scopes.city_ids))
+            order_scope.append(Order.city_id.in_(scopes.city_ids))
+            restaurant_scope.append(Restaurant.city_id.in_(scopes.city_ids))
+            scope_key = "city:" + ",".join(map(str, sorted(scopes.city_ids)))
         elif scopes.has_restaurant_scope():
-            orders_query = orders_query.where(Order.restaurant_id.in_(scopes.restaurant_ids))
-            restaurants_query = restaurants_query.where(Restaurant.id.in_(scopes.restaurant_ids))
-
-    # Total orders
-    total_orders_result = await session.execute(
-        select(func.count()).select_from(orders_query.subquery())
-    )
-    stats["total_orders"] = total_orders_result.scalar()
-
-    # Pending orders
-    pending_query = orders_query.where(Order.status.in_([
-        OrderStatus.created, OrderStatus.confirmed, OrderStatus.preparing,
-        OrderStatus.ready, OrderStatus.assigned, OrderStatus.picked_up
-    ]))
-    pending_result = await session.execute(
-        select(func.count()).select_from(pending_query.subquery())
-    )
-    stats["pending_orders"] = pending_result.scalar()
+            order_scope.append(Order.restaurant_id.in_(scopes.restaurant_ids))
+            restaurant_scope.append(Restaurant.id.in_(scopes.restaurant_ids))
+            scope_key = "restaurant:" + ",".join(map(str, sorted(scopes.restaurant_ids)))
+
+    key = dashboard_key(scope_key)
+    cached = await cache_get(redis, key)
+    if cached:
+        stats.update(orjson.loads(cached))
+    else:
+        counters = await _dashboard_counters(session, scopes, order_scope, restaurant_scope)
+        stats.update(counters)
+        await cache_set(redis, key, orjson.dumps(counters).decode(), settings.DASHBOARD_CACHE_TTL_SECONDS)
 
-    # Completed orders
-    completed_query = orders_query.where(Order.status == OrderStatus.delivered)
-    completed_result = await session.execute(
-        select(func.count()).select_from(completed_query.subquery())
+    # Recent orders
+    recent_orders_result = await session.execute(
+        select(*_ORDER_LIST_COLUMNS).where(*order_scope).order_by(Order.created_at.desc()).limit(10)
     )
-    stats["completed_orders"] = completed_result.scalar()
-
-    # Total revenue
-    revenue_query = orders_query.where(Order.status == OrderStatus.delivered).with_only_columns(func.sum(Order.total))
-    revenue_result = await session.execute(revenue_query)
-    stats["total_revenue"] = float(revenue_result.scalar() or 0)
+    stats["recent_orders"] = recent_orders_result.all()
 
-    # Active restaurants
-    restaurants_result = await session.execute(
-        select(func.count()).select_from(restaurants_query.subquery())
-    )
-    stats["active_restaurants"] = restaurants_result.scalar()
+    return stats
 
-    # Pending approvals
-    pending_approvals_query = restaurants_query.where(Restaurant.is_approved == False)
-    pending_approvals_result = await session.execute(
-        select(func.count()).select_from(pending_approvals_query.subquery())
-    )
-    stats["pending_approvals"] = pending_approvals_result.scalar()
 
-    # Total cities (if applicable)
+async def _dashboard_counters(
+    session: AsyncSession, scopes: UserScopes, order_scope: list, restaurant_scope: list
+) -> dict:
+    """Order / restaurant / city counters for one scope"""
+    # All counters in one round trip: each table is scanned once with
+    # FILTER aggregates, and the single-row results are cross-joined
+    delivered = Order.status == OrderStatus.delivered
+    order_stats = select(
+        func.count().label("total_orders"),
+        func.count().filter(Order.status.in_(PENDING_STATES)).label("pending_orders"),
+        func.count().filter(delivered).label("completed_orders"),
+        func.coalesce(func.sum(Order.total).filter(delivered), 0).label("revenue_cents"),
+    ).where(*order_scope).subquery()
+    restaurant_stats = select(
+        func.count().label("active_restaurants"),
+        func.count().filter(Restaurant.is_approved == False).label("pending_approvals"),
+    ).where(*restaurant_scope).subquery()
+    columns = [order_stats, restaurant_stats]
     if scopes.is_super_admin:
-        cities_result = await session.execute(
+        columns.append(
             select(func.count()).select_from(City).where(City.is_active == True)
+            .scalar_subquery().label("total_cities")
         )
-        stats["total_cities"] = cities_result.scalar()
-    else:
-        stats["total_cities"] = len(scopes.city_ids)
 
-    # Recent orders
-    recent_orders_result = await session.execute(
-        orders_query.order_by(Order.created_at.desc()).limit(10)
-    )
-    stats["recent_orders"] = recent_orders_result.scalars().all()
-
-    return stats
+    row = (await session.execute(select(*columns))).one()
+    return {
+        "total_orders": row.total_orders,
+        "pending_orders": row.pending_orders,
+        "completed_orders": row.completed_orders,
+        "total_revenue": row.revenue_cents / 100,
+        "active_restaurants": row.active_restaurants,
+        "pending_approvals": row.pending_approvals,
+        "total_cities": row.total_cities if scopes.is_super_admin else len(scopes.city_ids),
+    }
 
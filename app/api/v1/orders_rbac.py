@@ -8,16 +8,23 @@ This demonstrates how to apply RBAC filtering to order endpoints:
 - Customer: See only their own orders
 - Rider: See orders assigned to them
 """
+from datetime import datetime
 from typing import Annotated, Optional
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy import select, func
+from sqlalchemy import select, update, case, exists, func, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from redis.asyncio import Redis
 
+from app.core.cache import get_redis, analytics_key, cache_delete
 from app.core.deps import get_session, get_current_user
+from app.core.pagination import Page, encode_cursor, decode_cursor
 from app.core.rbac_deps import get_current_user_scopes, ScopeValidator
+from app.db.session import AsyncSessionLocal
 from app.models.user import User
-from app.models.order import Order, OrderStatus
+from app.models.order import Order, OrderStatus, PENDING_STATES
 from app.models.rbac import RoleCode
 from app.services.rbac_service import UserScopes, apply_scope_filters
 
@@ -44,56 +51,67 @@ class OrderStatsResponse(BaseModel):
     completed_orders: int
 
 
-@router.get("/", response_model=list[OrderListItem])
-async def list_orders_scoped(
-    session: Annotated[AsyncSession, Depends(get_session)],
-    user: Annotated[User, Depends(get_current_user)],
-    scopes: Annotated[UserScopes, Depends(get_current_user_scopes)],
-    city_id: Optional[int] = Query(None),
-    restaurant_id: Optional[int] = Query(None),
-    status: Optional[OrderStatus] = Query(None),
-    limit: int = Query(50, le=100),
-    offset: int = Query(0, ge=0)
-):
+# Columns of an order list row (OrderListItem / export line)
+_ORDER_LIST_COLUMNS = (
+    Order.id,
+    Order.city_id,
+    Order.restaurant_id,
+    Order.customer_name,
+    Order.status,
+    Order.total,
+    Order.created_at,
+)
+
+
+def _order_scope_filters(
+    user: User,
+    scopes: UserScopes,
+    city_id: Optional[int],
+    restaurant_id: Optional[int],
+    status: Optional[OrderStatus]
+) -> list | None:
     """
-    List orders with automatic scope filtering
+    WHERE clauses limiting orders to the user's scope plus the explicit filters
 
-    Access control:
-    - **Super Admin**: All orders
-    - **City Admin/Dispatcher/Support**: Orders in their cities
-    - **Restaurant Admin**: Orders for their restaurants
-    - **Customer**: Their own orders only
-    - **Rider**: Orders assigned to them
+    Returns None when the scope is empty (no query needed); raises 403 for an
+    explicit city/restaurant outside the scope.
     """
-    # Start with base query
-    query = select(Order)
+    filters = []
 
     # Apply scope-based filters
     if scopes.is_super_admin:
         # Super admin sees everything - no filter
         pass
     elif scopes.has_role(RoleCode.CITY_ADMIN, RoleCode.DISPATCHER, RoleCode.SUPPORT):
-        # City-level roles see orders in their cities
-        query = query.where(Order.city_id.in_(scopes.city_ids))
+        # City-level roles see orders in their cities (none assigned: nothing to query)
+        if not scopes.city_ids:
+            return None
+        # An in-scope ?city_id= below is the narrower predicate; skip the IN
+        if city_id not in scopes.city_ids:
+            filters.append(Order.city_id.in_(scopes.city_ids))
     elif scopes.has_role(RoleCode.RESTAURANT_ADMIN):
         # Restaurant admin sees orders for their restaurants
-        query = query.where(Order.restaurant_id.in_(scopes.restaurant_ids))
+        if not scopes.restaurant_ids:
+            return None
+        # Likewise for an in-scope ?restaurant_id=
+        if restaurant_id not in scopes.restaurant_ids:
+            filters.append(Order.restaurant_id.in_(scopes.restaurant_ids))
     elif scopes.has_role(RoleCode.CUSTOMER):
         # Customers see only their orders
-        query = query.where(Order.customer_id == user.id)
+        filters.append(Order.customer_id == user.id)
     elif scopes.has_role(RoleCode.RIDER):
         # Riders see orders assigned to them
-        query = query.where(Order.rider_id == user.id)
+        filters.append(Order.rider_id == user.id)
     else:
-        # No valid role - return empty
-        return []
+        # No valid role - nothing visible
+        return None
 
     # Apply additional filters
     if city_id:
         # Verify access if city_id specified
         if not scopes.is_super_admin and city_id not in scopes.city_ids:
             raise HTTPException(status_code=403, detail=f"No access to city {city_id}")
-        query = query.where(Order.city_id == city_id)
+        filters.append(Order.city_id == city_id)
 
     if restaurant_id:
         # Verify access if restaurant_id specified
@@ -101,29 +119,126 @@ async def list_orders_scoped(
             # For city admins, check if restaurant is in their cities
             if not scopes.has_city_scope():
                 raise HTTPException(status_code=403, detail=f"No access to restaurant {restaurant_id}")
-        query = query.where(Order.restaurant_id == restaurant_id)
+        filters.append(Order.restaurant_id == restaurant_id)
 
     if status:
-        query = query.where(Order.status == status)
+        filters.append(Order.status == status)
+
+    return filters
+
+
+@router.get("/", response_model=Page[OrderListItem])
+async def list_orders_scoped(
+    session: Annotated[AsyncSession, Depends(get_session)],
+    user: Annotated[User, Depends(get_current_user)],
+    scopes: Annotated[UserScopes, Depends(get_current_user_scopes)],
+    city_id: Optional[int] = Query(None),
+    restaurant_id: Optional[int] = Query(None),
+    status: Optional[OrderStatus] = Query(None),
+    limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page")
+):
+    """
+    List orders with automatic scope filtering
 
-    # Pagination
-    query = query.order_by(Order.created_at.desc()).limit(limit).offset(offset)
+    Access control:
+    - **Super Admin**: All orders
+    - **City Admin/Dispatcher/Support**: Orders in their cities
+    - **Restaurant Admin**: Orders for their restaurants
+    - **Customer**: Their own orders only
+    - **Rider**: Orders assigned to them
+
+    Pages are keyset-paginated: pass `next_cursor` back as `cursor`
+    """
+    filters = _order_scope_filters(user, scopes, city_id, restaurant_id, status)
+    if filters is None:
+        return Page[OrderListItem](items=[])
+
+    # customer_name is a column on orders, so the projection touches no
+    # relationship (all Order relationships are lazy="raise" anyway) and
+    # needs no loader options.
+    query = select(*_ORDER_LIST_COLUMNS).where(*filters)
+
+    # Keyset pagination: (created_at, id) is a total order, so rows sharing a
+    # timestamp are neither skipped nor repeated across pages
+    if cursor:
+        c_ts, c_id = decode_cursor(cursor, datetime, int)
+        query = query.where(tuple_(Order.created_at, Order.id) < tuple_(c_ts, c_id))
+    # One extra row tells us whether another page exists, without a COUNT(*)
+    query = query.order_by(Order.created_at.desc(), Order.id.desc()).limit(limit + 1)
 
     result = await session.execute(query)
-    orders = result.scalars().all()
-
-    return [
-        OrderListItem(
-            id=order.id,
-            city_id=order.city_id,
-            restaurant_id=order.restaurant_id,
-            customer_name=order.customer_name,
-            status=order.status.value,
-            total=float(order.total),
-            created_at=order.created_at.isoformat()
-        )
-        for order in orders
-    ]
+    orders = result.all()
+    has_next = len(orders) > limit
+    orders = orders[:limit]
+
+    return Page[OrderListItem](
+        items=[
+            OrderListItem(
+                id=order.id,
+                city_id=order.city_id,
+                restaurant_id=order.restaurant_id,
+                customer_name=order.customer_name,
+                status=order.status.value,
+                total=order.total / 100,
+                created_at=order.created_at.isoformat()
+            )
+            for order in orders
+        ],
+        has_next=has_next,
+        next_cursor=encode_cursor(orders[-1].created_at, orders[-1].id) if has_next else None
+    )
+
+
+# Rows fetched per server-side cursor round trip while exporting
+_EXPORT_BATCH_SIZE = 500
+
+
+async def _stream_order_lines(query):
+    """
+    Yield one JSON line per order straight off a server-side cursor
+
+    Runs on its own pooled session: the request's session is closed before a
+    streaming body is sent. Memory stays bounded by one batch however many
+    orders match.
+    """
+    async with AsyncSessionLocal() as s:
+        result = await s.stream(query.execution_options(yield_per=_EXPORT_BATCH_SIZE))
+        async for order in result:
+            yield orjson.dumps({
+                "id": order.id,
+                "city_id": order.city_id,
+                "restaurant_id": order.restaurant_id,
+                "customer_name": order.customer_name,
+                "status": order.status,
+                "total": order.total / 100,
+                "created_at": order.created_at,
+            }) + b"\n"
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_orders_scoped(
+    user: Annotated[User, Depends(get_current_user)],
+    scopes: Annotated[UserScopes, Depends(get_current_user_scopes)],
+    city_id: Optional[int] = Query(None),
+    restaurant_id: Optional[int] = Query(None),
+    status: Optional[OrderStatus] = Query(None)
+):
+    """
+    Export every order in scope as newline-delimited JSON, newest first
+
+    Same access rules and filters as the list endpoint, without pagination
+    """
+    filters = _order_scope_filters(user, scopes, city_id, restaurant_id, status)
+    if filters is None:
+        return StreamingResponse(iter(()), media_type="application/x-ndjson")
+
+    query = (
+        select(*_ORDER_LIST_COLUMNS)
+        .where(*filters)
+        .order_by(Order.created_at.desc(), Order.id.desc())
+    )
+    return StreamingResponse(_stream_order_lines(query), media_type="application/x-ndjson")
 
 
 @router.get("/{order_id}")
@@ -136,11 +251,24 @@ async def get_order_details(
     """
     Get order details with scope validation
     """
-    order = await session.get(Order, order_id)
-    if not order:
+    # Only the columns the response and the access check need; no ORM instance
+    order = (await session.execute(
+        select(
+            Order.id,
+            Order.city_id,
+            Order.restaurant_id,
+            Order.customer_id,
+            Order.rider_id,
+            Order.status,
+            Order.total,
+            Order.created_at,
+        )
+        .where(Order.id == order_id)
+    )).one_or_none()
+    if order is None:
         raise HTTPException(status_code=404, detail="Order not found")
 
-    # Validate access using ScopeValidator
+    # Validate access using ScopeValidator (a Row has the same attributes)
     ScopeValidator.ensure_order_access(scopes, order)
 
     return {
@@ -150,8 +278,8 @@ async def get_order_details(
         "customer_id": order.customer_id,
         "rider_id": order.rider_id,
         "status": order.status.value,
-        "total": float(order.total),
-        "created_at": order.created_at.isoformat()
+        "total": order.total / 100,
+        "created_at": order.created_at
     }
 
 
@@ -175,25 +303,33 @@ async def assign_rider_to_order(
     if not scopes.is_super_admin and not scopes.has_role(RoleCode.DISPATCHER):
         raise HTTPException(status_code=403, detail="Only dispatchers can assign riders")
 
-    # Get order
-    order = await session.get(Order, order_id)
-    if not order:
-        raise HTTPException(status_code=404, detail="Order not found")
-
-    # Verify dispatcher has access to this order's city
-    if not scopes.is_super_admin and order.city_id not in scopes.city_ids:
-        raise HTTPException(status_code=403, detail="Cannot assign riders in this city")
-
-    # Verify rider exists and is in the same city (optional check)
-    rider = await session.get(User, rider_id)
-    if not rider:
+    # Assign in one guarded UPDATE: the order must be in the dispatcher's
+    # cities and the rider must exist; ready orders move to assigned
+    stmt = (
+        update(Order)
+        .where(Order.id == order_id, exists().where(User.id == rider_id))
+        .values(
+            rider_id=rider_id,
+            status=case((Order.status == OrderStatus.ready, OrderStatus.assigned), else_=Order.status)
+        )
+        .returning(Order.id, Order.status)
+    )
+    if not scopes.is_super_admin:
+        stmt = stmt.where(Order.city_id.in_(scopes.city_ids))
+
+    order = (await session.execute(stmt)).one_or_none()
+    if order is None:
+        # Nothing updated: find out which guard failed
+        found = (await session.execute(
+            select(Order.city_id, exists().where(User.id == rider_id).label("rider_exists"))
+            .where(Order.id == order_id)
+        )).one_or_none()
+        if found is None:
+            raise HTTPException(status_code=404, detail="Order not found")
+        if not scopes.is_super_admin and found.city_id not in scopes.city_ids:
+            raise HTTPException(status_code=403, detail="Cannot assign riders in this city")
         raise HTTPException(status_code=404, detail="Rider not found")
 
-    # Assign rider
-    order.rider_id = rider_id
-    if order.status == OrderStatus.ready:
-        order.status = OrderStatus.assigned
-
     await session.commit()
 
     return {
@@ -227,61 +363,46 @@ async def get_order_stats(
     ):
         raise HTTPException(status_code=403, detail="Insufficient permissions for statistics")
 
-    # Build query with scope filters
-    query = select(Order)
+    # Collect scope filters; every aggregate below shares them
+    filters = []
 
     if not scopes.is_super_admin:
         if scopes.has_city_scope():
-            query = query.where(Order.city_id.in_(scopes.city_ids))
+            filters.append(Order.city_id.in_(scopes.city_ids))
         elif scopes.has_restaurant_scope():
-            query = query.where(Order.restaurant_id.in_(scopes.restaurant_ids))
+            filters.append(Order.restaurant_id.in_(scopes.restaurant_ids))
+        else:
+            # Role without any assigned city or restaurant: no orders in scope
+            return OrderStatsResponse(
+                total_orders=0, total_revenue=0.0, pending_orders=0, completed_orders=0
+            )
 
     # Apply additional filters
     if city_id:
         ScopeValidator.ensure_city_access(scopes, city_id)
-        query = query.where(Order.city_id == city_id)
+        filters.append(Order.city_id == city_id)
 
     if restaurant_id:
         ScopeValidator.ensure_restaurant_access(scopes, restaurant_id)
-        query = query.where(Order.restaurant_id == restaurant_id)
-
-    # Get total count
-    count_result = await session.execute(
-        select(func.count()).select_from(query.subquery())
-    )
-    total_orders = count_result.scalar()
-
-    # Get total revenue
-    revenue_query = query.with_only_columns(func.sum(Order.total))
-    revenue_result = await session.execute(revenue_query)
-    total_revenue = float(revenue_result.scalar() or 0)
-
-    # Get pending orders count
-    pending_query = query.where(Order.status.in_([
-        OrderStatus.created,
-        OrderStatus.confirmed,
-        OrderStatus.preparing,
-        OrderStatus.ready,
-        OrderStatus.assigned,
-        OrderStatus.picked_up
-    ]))
-    pending_result = await session.execute(
-        select(func.count()).select_from(pending_query.subquery())
-    )
-    pending_orders = pending_result.scalar()
-
-    # Get completed orders count
-    completed_query = query.where(Order.status == OrderStatus.delivered)
-    completed_result = await session.execute(
-        select(func.count()).select_from(completed_query.subquery())
-    )
-    completed_orders = completed_result.scalar()
+        filters.append(Order.restaurant_id == restaurant_id)
+
+    # All four figures as conditional aggregates: one round trip, one scan
+    stats = (await session.execute(
+        select(
+            func.count().label("total"),
+            func.coalesce(func.sum(Order.total), 0).label("revenue"),
+            func.count().filter(Order.status.in_(PENDING_STATES)).label("pending"),
+            func.count().filter(Order.status == OrderStatus.delivered).label("completed"),
+        )
+        .select_from(Order)
+        .where(*filters)
+    )).one()
 
     return OrderStatsResponse(
-        total_orders=total_orders,
-        total_revenue=total_revenue,
-        pending_orders=pending_orders,
-        completed_orders=completed_orders
+        total_orders=stats.total,
+        total_revenue=stats.revenue / 100,
+        pending_orders=stats.pending,
+        completed_orders=stats.completed
     )
 
 
@@ -290,6 +411,7 @@ async def refund_order(
     order_id: int,
     reason: str,
     session: Annotated[AsyncSession, Depends(get_session)],
+    redis: Annotated[Redis | None, Depends(get_redis)],
     user: Annotated[User, Depends(get_current_user)],
     scopes: Annotated[UserScopes, Depends(get_current_user_scopes)]
 ):
@@ -305,34 +427,44 @@ async def refund_order(
     if not scopes.is_super_admin and not scopes.has_role(RoleCode.SUPPORT):
         raise HTTPException(status_code=403, detail="Only support staff can issue refunds")
 
-    # Get order
-    order = await session.get(Order, order_id)
-    if not order:
-        raise HTTPException(status_code=404, detail="Order not found")
-
-    # Verify support has access to this order's city
-    if not scopes.is_super_admin and order.city_id not in scopes.city_ids:
-        raise HTTPException(status_code=403, detail="Cannot refund orders in this city")
-
-    # Check if order can be refunded
-    if order.status == OrderStatus.refunded:
-        raise HTTPException(status_code=400, detail="Order already refunded")
-
-    if order.status not in [OrderStatus.delivered, OrderStatus.cancelled]:
+    # Refund in one guarded UPDATE: in the caller's cities and currently
+    # delivered or cancelled (so never twice)
+    stmt = (
+        update(Order)
+        .where(
+            Order.id == order_id,
+            Order.status.in_((OrderStatus.delivered, OrderStatus.cancelled))
+        )
+        .values(status=OrderStatus.refunded)
+        .returning(Order.id, Order.restaurant_id, Order.total)
+    )
+    if not scopes.is_super_admin:
+        stmt = stmt.where(Order.city_id.in_(scopes.city_ids))
+
+    order = (await session.execute(stmt)).one_or_none()
+    if order is None:
+        # Nothing updated: find out which guard failed
+        found = (await session.execute(
+            select(Order.city_id, Order.status).where(Order.id == order_id)
+        )).one_or_none()
+        if found is None:
+            raise HTTPException(status_code=404, detail="Order not found")
+        if not scopes.is_super_admin and found.city_id not in scopes.city_ids:
+            raise HTTPException(status_code=403, detail="Cannot refund orders in this city")
+        if found.status == OrderStatus.refunded:
+            raise HTTPException(status_code=400, detail="Order already refunded")
         raise HTTPException(status_code=400, detail="Can only refund delivered or cancelled orders")
 
-    # Process refund
-    order.status = OrderStatus.refunded
-
     # TODO: Create refund record in payments table
     # TODO: Process actual refund through payment gateway
 
     await session.commit()
+    await cache_delete(redis, analytics_key(order.restaurant_id))
 
     return {
         "message": "Refund processed successfully",
         "order_id": order.id,
-        "amount": float(order.total),
+        "amount": order.total / 100,
         "reason": reason
     }
 
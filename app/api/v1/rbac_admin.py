@@ -7,20 +7,40 @@ These endpoints allow super admins and city admins to manage user roles:
 - Manage shift leads and their constraints
 """
 from typing import Annotated, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import BaseModel, Field, TypeAdapter
+from redis.asyncio import Redis
 from datetime import datetime
-from sqlalchemy import select
+from sqlalchemy import select, update, exists, func, literal, literal_column, tuple_, any_, Integer
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
+from app.core.cache import (
+    get_redis, cache_get, cache_set, cache_delete_pattern,
+    roles_key, roles_pattern, cities_key, cities_pattern,
+)
 from app.core.deps import get_session, get_current_user
-from app.core.rbac_deps import require_super_admin, require_city_admin, ScopeValidator
+from app.core.pagination import Page, encode_cursor, decode_cursor
+from app.core.rbac_deps import get_current_user_scopes, invalidate_user_scopes, require_super_admin, require_city_admin, ScopeValidator
+from app.core.responses import prerendered
 from app.models.user import User
 from app.models.rbac import Role, UserRole as UserRoleModel, ScopeType, RoleCode, City, ShiftLead
-from app.services.rbac_service import UserScopes, get_user_scopes, can_assign_role
+from app.services.city_service import invalidate_active_cities
+from app.services.rbac_service import UserScopes, can_assign_role
+from app.services.role_service import get_active_role, invalidate_active_roles
 
 router = APIRouter(prefix="/rbac", tags=["RBAC Admin"])
 
+# ON CONFLICT target matching uq_user_roles_active_scope (an active assignment
+# of a role at a scope); literal 0s so Postgres can infer the index
+_ACTIVE_ROLE_SCOPE = [
+    UserRoleModel.user_id,
+    UserRoleModel.role_id,
+    func.coalesce(UserRoleModel.city_id, literal_column("0")),
+    func.coalesce(UserRoleModel.restaurant_id, literal_column("0")),
+]
+
 
 # ============================================================================
 # Pydantic Schemas
@@ -113,13 +133,20 @@ class ShiftLeadResponse(BaseModel):
         from_attributes = True
 
 
+_role_list = TypeAdapter(list[RoleResponse])
+_city_list = TypeAdapter(list[CityResponse])
+_shift_lead_list = TypeAdapter(list[ShiftLeadResponse])
+
+
 # ============================================================================
 # Role Management Endpoints (Super Admin Only)
 # ============================================================================
 
-@router.get("/roles", response_model=list[RoleResponse])
+# Near-static lists: served from Redis as ready-made JSON
+@router.get("/roles", **prerendered(list[RoleResponse]))
 async def list_roles(
     session: Annotated[AsyncSession, Depends(get_session)],
+    redis: Annotated[Redis | None, Depends(get_redis)],
     scopes: Annotated[UserScopes, Depends(require_super_admin)],
     include_inactive: bool = Query(False)
 ):
@@ -128,20 +155,27 @@ async def list_roles(
 
     - **Super Admin only**
     """
+    key = roles_key(include_inactive)
+    cached = await cache_get(redis, key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     query = select(Role)
     if not include_inactive:
         query = query.where(Role.is_active == True)
 
     result = await session.execute(query.order_by(Role.code))
-    roles = result.scalars().all()
+    body = _role_list.dump_json(_role_list.validate_python(result.scalars().all(), from_attributes=True))
+    await cache_set(redis, key, body.decode(), settings.RBAC_CACHE_TTL_SECONDS)
 
-    return [RoleResponse.model_validate(role) for role in roles]
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("/roles", response_model=RoleResponse, status_code=201)
 async def create_role(
     data: RoleCreate,
     session: Annotated[AsyncSession, Depends(get_session)],
+    redis: Annotated[Redis | None, Depends(get_redis)],
     scopes: Annotated[UserScopes, Depends(require_super_admin)]
 ):
     """
@@ -150,10 +184,7 @@ async def create_role(
     - **Super Admin only**
     """
     # Check if role code already exists
-    existing = await session.execute(
-        select(Role).where(Role.code == data.code)
-    )
-    if existing.scalar_one_or_none():
+    if await session.scalar(select(exists().where(Role.code == data.code))):
         raise HTTPException(status_code=400, detail="Role code already exists")
 
     role = Role(
@@ -166,7 +197,8 @@ async def create_role(
 
     session.add(role)
     await session.commit()
-    await session.refresh(role)
+    invalidate_active_roles()
+    await cache_delete_pattern(redis, roles_pattern())
 
     return RoleResponse.model_validate(role)
 
@@ -176,6 +208,7 @@ async def toggle_role_status(
     role_id: int,
     is_active: bool,
     session: Annotated[AsyncSession, Depends(get_session)],
+    redis: Annotated[Redis | None, Depends(get_redis)],
     scopes: Annotated[UserScopes, Depends(require_super_admin)]
 ):
     """
@@ -183,12 +216,16 @@ async def toggle_role_status(
 
     - **Super Admin only**
     """
-    role = await session.get(Role, role_id)
-    if not role:
+    # Presence check and write in one statement; no Role instance is loaded
+    if await session.scalar(
+        update(Role).where(Role.id == role_id).values(is_active=is_active).returning(Role.id)
+    ) is None:
         raise HTTPException(status_code=404, detail="Role not found")
 
-    role.is_active = is_active
     await session.commit()
+    invalidate_active_roles()
+    await invalidate_user_scopes(redis)
+    await cache_delete_pattern(redis, roles_pattern())
 
     return {"message": "Role status updated", "is_active": is_active}
 
@@ -197,10 +234,56 @@ async def toggle_role_status(
 # User Role Assignment Endpoints
 # ============================================================================
 
+def _user_roles_query(
+    user: User,
+    scopes: UserScopes,
+    user_id: Optional[int],
+    city_id: Optional[int],
+    include_inactive: bool
+):
+    """Scoped, filtered user-role rows shared by the list and page endpoints"""
+    # Flat column rows: no UserRole/Role instances or identity-map bookkeeping
+    query = select(
+        UserRoleModel.id,
+        UserRoleModel.user_id,
+        Role.code.label("role_code"),
+        Role.name.label("role_name"),
+        UserRoleModel.city_id,
+        UserRoleModel.restaurant_id,
+        UserRoleModel.is_active,
+        UserRoleModel.assigned_at,
+        UserRoleModel.assigned_by,
+        UserRoleModel.notes,
+    ).join(Role, UserRoleModel.role_id == Role.id)
+
+    # Apply filters based on permissions (scopes come from the cached
+    # get_current_user_scopes dependency, so this costs no query)
+    if not scopes.is_super_admin:
+        if scopes.has_role(RoleCode.CITY_ADMIN):
+            # City admins can only see roles in their cities
+            query = query.where(UserRoleModel.city_id.in_(scopes.city_ids))
+        else:
+            # Others can only see their own roles
+            query = query.where(UserRoleModel.user_id == user.id)
+
+    # Apply additional filters
+    if user_id:
+        query = query.where(UserRoleModel.user_id == user_id)
+
+    if city_id:
+        query = query.where(UserRoleModel.city_id == city_id)
+
+    if not include_inactive:
+        query = query.where(UserRoleModel.is_active == True)
+
+    return query
+
+
 @router.get("/user-roles", response_model=list[UserRoleResponse])
 async def list_user_roles(
     session: Annotated[AsyncSession, Depends(get_session)],
     user: Annotated[User, Depends(get_current_user)],
+    scopes: Annotated[UserScopes, Depends(get_current_user_scopes)],
     user_id: Optional[int] = Query(None),
     city_id: Optional[int] = Query(None),
     include_inactive: bool = Query(False)
@@ -212,54 +295,58 @@ async def list_user_roles(
     - **City Admin**: Can see roles in their cities
     - **Others**: Can see only their own roles
     """
-    scopes = await get_user_scopes(session, user.id)
+    query = _user_roles_query(user, scopes, user_id, city_id, include_inactive)
+    result = await session.execute(
+        query.order_by(UserRoleModel.assigned_at.desc(), UserRoleModel.id.desc())
+    )
 
-    query = select(UserRoleModel, Role).join(Role, UserRoleModel.role_id == Role.id)
+    return [UserRoleResponse(**row._mapping) for row in result]
 
-    # Apply filters based on permissions
-    if not scopes.is_super_admin:
-        if scopes.has_role(RoleCode.CITY_ADMIN):
-            # City admins can only see roles in their cities
-            query = query.where(UserRoleModel.city_id.in_(scopes.city_ids))
-        else:
-            # Others can only see their own roles
-            query = query.where(UserRoleModel.user_id == user.id)
 
-    # Apply additional filters
-    if user_id:
-        query = query.where(UserRoleModel.user_id == user_id)
+@router.get("/user-roles/page", response_model=Page[UserRoleResponse])
+async def list_user_roles_page(
+    session: Annotated[AsyncSession, Depends(get_session)],
+    user: Annotated[User, Depends(get_current_user)],
+    scopes: Annotated[UserScopes, Depends(get_current_user_scopes)],
+    user_id: Optional[int] = Query(None),
+    city_id: Optional[int] = Query(None),
+    include_inactive: bool = Query(False),
+    limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page")
+):
+    """
+    List user role assignments, keyset-paginated
 
-    if city_id:
-        query = query.where(UserRoleModel.city_id == city_id)
+    Same access rules and filters as `GET /user-roles`; pass `next_cursor`
+    back as `cursor`
+    """
+    query = _user_roles_query(user, scopes, user_id, city_id, include_inactive)
 
-    if not include_inactive:
-        query = query.where(UserRoleModel.is_active == True)
+    # Newest assignments first; limit + 1 rows tell us whether there is a next page
+    if cursor:
+        c_ts, c_id = decode_cursor(cursor, datetime, int)
+        query = query.where(tuple_(UserRoleModel.assigned_at, UserRoleModel.id) < tuple_(c_ts, c_id))
+    query = query.order_by(UserRoleModel.assigned_at.desc(), UserRoleModel.id.desc()).limit(limit + 1)
 
     result = await session.execute(query)
-    user_roles = result.all()
-
-    return [
-        UserRoleResponse(
-            id=ur.id,
-            user_id=ur.user_id,
-            role_code=role.code,
-            role_name=role.name,
-            city_id=ur.city_id,
-            restaurant_id=ur.restaurant_id,
-            is_active=ur.is_active,
-            assigned_at=ur.assigned_at,
-            assigned_by=ur.assigned_by,
-            notes=ur.notes
-        )
-        for ur, role in user_roles
-    ]
+    rows = result.all()
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+
+    return Page[UserRoleResponse](
+        items=[UserRoleResponse(**row._mapping) for row in rows],
+        has_next=has_next,
+        next_cursor=encode_cursor(rows[-1].assigned_at, rows[-1].id) if has_next else None
+    )
 
 
 @router.post("/user-roles", status_code=201)
 async def assign_user_role(
     data: UserRoleAssign,
     session: Annotated[AsyncSession, Depends(get_session)],
-    user: Annotated[User, Depends(get_current_user)]
+    redis: Annotated[Redis | None, Depends(get_redis)],
+    user: Annotated[User, Depends(get_current_user)],
+    scopes: Annotated[UserScopes, Depends(get_current_user_scopes)]
 ):
     """
     Assign a role to a user
@@ -270,7 +357,7 @@ async def assign_user_role(
     # Check if assigner has permission
     allowed = await can_assign_role(
         session,
-        user.id,
+        scopes,
         data.role_code,
         data.city_id,
         data.restaurant_id
@@ -282,18 +369,13 @@ async def assign_user_role(
             detail="You don't have permission to assign this role"
         )
 
-    # Get the role
-    result = await session.execute(
-        select(Role).where(Role.code == data.role_code).where(Role.is_active == True)
-    )
-    role = result.scalar_one_or_none()
-
+    # Role code -> id comes from the in-process role map, no query
+    role = await get_active_role(data.role_code)
     if not role:
         raise HTTPException(status_code=404, detail="Role not found")
 
     # Verify target user exists
-    target_user = await session.get(User, data.user_id)
-    if not target_user:
+    if not await session.scalar(select(exists().where(User.id == data.user_id))):
         raise HTTPException(status_code=404, detail="User not found")
 
     # Validate scope constraints
@@ -309,37 +391,34 @@ async def assign_user_role(
     if role.scope_type == ScopeType.RESTAURANT and not data.restaurant_id:
         raise HTTPException(status_code=400, detail="Restaurant ID required for restaurant-scoped role")
 
-    # Check if assignment already exists
-    existing = await session.execute(
-        select(UserRoleModel).where(
-            UserRoleModel.user_id == data.user_id,
-            UserRoleModel.role_id == role.id,
-            UserRoleModel.city_id == data.city_id,
-            UserRoleModel.restaurant_id == data.restaurant_id,
-            UserRoleModel.is_active == True
+    # Create assignment; an active duplicate hits uq_user_roles_active_scope and
+    # inserts nothing, so the duplicate check is the insert itself
+    user_role_id = await session.scalar(
+        pg_insert(UserRoleModel)
+        .values(
+            user_id=data.user_id,
+            role_id=role.id,
+            city_id=data.city_id,
+            restaurant_id=data.restaurant_id,
+            is_active=True,
+            assigned_by=user.id,
+            notes=data.notes
+        )
+        .on_conflict_do_nothing(
+            index_elements=_ACTIVE_ROLE_SCOPE,
+            index_where=UserRoleModel.is_active
         )
+        .returning(UserRoleModel.id)
     )
-    if existing.scalar_one_or_none():
+    if user_role_id is None:
         raise HTTPException(status_code=400, detail="Role already assigned with this scope")
 
-    # Create assignment
-    user_role = UserRoleModel(
-        user_id=data.user_id,
-        role_id=role.id,
-        city_id=data.city_id,
-        restaurant_id=data.restaurant_id,
-        is_active=True,
-        assigned_by=user.id,
-        notes=data.notes
-    )
-
-    session.add(user_role)
     await session.commit()
-    await session.refresh(user_role)
+    await invalidate_user_scopes(redis, data.user_id)
 
     return {
         "message": "Role assigned successfully",
-        "user_role_id": user_role.id
+        "user_role_id": user_role_id
     }
 
 
@@ -347,7 +426,8 @@ async def assign_user_role(
 async def revoke_user_role(
     user_role_id: int,
     session: Annotated[AsyncSession, Depends(get_session)],
-    user: Annotated[User, Depends(get_current_user)]
+    redis: Annotated[Redis | None, Depends(get_redis)],
+    scopes: Annotated[UserScopes, Depends(get_current_user_scopes)]
 ):
     """
     Revoke a user's role assignment
@@ -355,24 +435,30 @@ async def revoke_user_role(
     - **Super Admin**: Can revoke any role
     - **City Admin**: Can revoke city-scoped roles in their cities
     """
-    user_role = await session.get(UserRoleModel, user_role_id)
-    if not user_role:
-        raise HTTPException(status_code=404, detail="User role assignment not found")
-
-    scopes = await get_user_scopes(session, user.id)
-
     # Check permission
+    if not scopes.is_super_admin and not scopes.has_role(RoleCode.CITY_ADMIN):
+        raise HTTPException(status_code=403, detail="Insufficient permissions")
+
+    # Revoke in one guarded UPDATE (no load-modify-flush); a city admin can
+    # only revoke roles in their cities. Postgres stamps revoked_at
+    stmt = (
+        update(UserRoleModel)
+        .where(UserRoleModel.id == user_role_id)
+        .values(is_active=False, revoked_at=func.timezone("UTC", func.now()))
+        .returning(UserRoleModel.user_id)
+    )
     if not scopes.is_super_admin:
-        if scopes.has_role(RoleCode.CITY_ADMIN):
-            # City admin can only revoke roles in their cities
-            if user_role.city_id not in scopes.city_ids:
-                raise HTTPException(status_code=403, detail="Cannot revoke roles outside your cities")
-        else:
-            raise HTTPException(status_code=403, detail="Insufficient permissions")
+        stmt = stmt.where(UserRoleModel.city_id.in_(scopes.city_ids))
+
+    revoked_user_id = await session.scalar(stmt)
+    if revoked_user_id is None:
+        # Nothing updated: tell "missing" apart from "outside your cities"
+        if not await session.scalar(select(exists().where(UserRoleModel.id == user_role_id))):
+            raise HTTPException(status_code=404, detail="User role assignment not found")
+        raise HTTPException(status_code=403, detail="Cannot revoke roles outside your cities")
 
-    user_role.is_active = False
-    user_role.revoked_at = datetime.utcnow()
     await session.commit()
+    await invalidate_user_scopes(redis, revoked_user_id)
 
     return {"message": "Role revoked successfully"}
 
@@ -381,10 +467,42 @@ async def revoke_user_role(
 # City Management Endpoints
 # ============================================================================
 
-@router.get("/cities", response_model=list[CityResponse])
+def _cities_query(scopes: UserScopes, include_inactive: bool):
+    """Scoped city rows in name order, shared by the list and page endpoints"""
+    query = select(City)
+
+    # Filter by scope: one int[] parameter however many cities the admin
+    # covers, so a wide scope is neither a long IN list nor a new prepared
+    # statement per distinct scope size
+    if not scopes.is_super_admin and scopes.city_ids:
+        query = query.where(City.id == any_(literal(sorted(scopes.city_ids), ARRAY(Integer))))
+
+    if not include_inactive:
+        query = query.where(City.is_active == True)
+
+    return query.order_by(City.name)
+
+
+def _cities_cache_key(
+    scopes: UserScopes,
+    include_inactive: bool,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None
+) -> str:
+    scoped = not scopes.is_super_admin and scopes.city_ids
+    return cities_key(
+        include_inactive,
+        ",".join(map(str, sorted(scopes.city_ids))) if scoped else "all",
+        limit,
+        cursor
+    )
+
+
+@router.get("/cities", **prerendered(list[CityResponse]))
 async def list_cities(
     session: Annotated[AsyncSession, Depends(get_session)],
-    user: Annotated[User, Depends(get_current_user)],
+    redis: Annotated[Redis | None, Depends(get_redis)],
+    scopes: Annotated[UserScopes, Depends(get_current_user_scopes)],
     include_inactive: bool = Query(False)
 ):
     """
@@ -393,27 +511,66 @@ async def list_cities(
     - **Super Admin**: Can see all cities
     - **City Admin/Others**: Can see cities they have access to
     """
-    scopes = await get_user_scopes(session, user.id)
+    key = _cities_cache_key(scopes, include_inactive)
+    cached = await cache_get(redis, key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
 
-    query = select(City)
+    result = await session.execute(_cities_query(scopes, include_inactive))
+    body = _city_list.dump_json(
+        _city_list.validate_python(result.scalars().all(), from_attributes=True)
+    ).decode()
+    await cache_set(redis, key, body, settings.RBAC_CACHE_TTL_SECONDS)
 
-    # Filter by scope
-    if not scopes.is_super_admin and scopes.city_ids:
-        query = query.where(City.id.in_(scopes.city_ids))
+    return Response(content=body, media_type="application/json")
 
-    if not include_inactive:
-        query = query.where(City.is_active == True)
 
-    result = await session.execute(query.order_by(City.name))
+@router.get("/cities/page", **prerendered(Page[CityResponse]))
+async def list_cities_page(
+    session: Annotated[AsyncSession, Depends(get_session)],
+    redis: Annotated[Redis | None, Depends(get_redis)],
+    scopes: Annotated[UserScopes, Depends(get_current_user_scopes)],
+    include_inactive: bool = Query(False),
+    limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page")
+):
+    """
+    List cities, keyset-paginated
+
+    Same access rules as `GET /cities`; pass `next_cursor` back as `cursor`
+    """
+    key = _cities_cache_key(scopes, include_inactive, limit, cursor)
+    cached = await cache_get(redis, key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    query = _cities_query(scopes, include_inactive)
+
+    # Alphabetical; name is unique, so it alone is a stable keyset
+    if cursor:
+        (c_name,) = decode_cursor(cursor, str)
+        query = query.where(City.name > c_name)
+
+    result = await session.execute(query.limit(limit + 1))
     cities = result.scalars().all()
+    has_next = len(cities) > limit
+    cities = cities[:limit]
+
+    body = Page[CityResponse](
+        items=_city_list.validate_python(cities, from_attributes=True),
+        has_next=has_next,
+        next_cursor=encode_cursor(cities[-1].name) if has_next else None
+    ).model_dump_json()
+    await cache_set(redis, key, body, settings.RBAC_CACHE_TTL_SECONDS)
 
-    return [CityResponse.model_validate(city) for city in cities]
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("/cities", response_model=CityResponse, status_code=201)
 async def create_city(
     data: CityCreate,
     session: Annotated[AsyncSession, Depends(get_session)],
+    redis: Annotated[Redis | None, Depends(get_redis)],
     scopes: Annotated[UserScopes, Depends(require_super_admin)]
 ):
     """
@@ -422,10 +579,7 @@ async def create_city(
     - **Super Admin only**
     """
     # Check if code already exists
-    existing = await session.execute(
-        select(City).where(City.code == data.code)
-    )
-    if existing.scalar_one_or_none():
+    if await session.scalar(select(exists().where(City.code == data.code))):
         raise HTTPException(status_code=400, detail="City code already exists")
 
     city = City(
@@ -438,7 +592,8 @@ async def create_city(
 
     session.add(city)
     await session.commit()
-    await session.refresh(city)
+    invalidate_active_cities()
+    await cache_delete_pattern(redis, cities_pattern())
 
     return CityResponse.model_validate(city)
 
@@ -451,7 +606,9 @@ async def create_city(
 async def create_shift_lead(
     data: ShiftLeadCreate,
     session: Annotated[AsyncSession, Depends(get_session)],
-    user: Annotated[User, Depends(get_current_user)]
+    redis: Annotated[Redis | None, Depends(get_redis)],
+    user: Annotated[User, Depends(get_current_user)],
+    scopes: Annotated[UserScopes, Depends(get_current_user_scopes)]
 ):
     """
     Create a shift lead for a city
@@ -459,32 +616,32 @@ async def create_shift_lead(
     - **Super Admin**: Can create for any city
     - **City Admin**: Can create only for their cities
     """
-    scopes = await get_user_scopes(session, user.id)
-
     # Check permission
     if not scopes.is_super_admin:
         if not scopes.has_role(RoleCode.CITY_ADMIN) or data.city_id not in scopes.city_ids:
             raise HTTPException(status_code=403, detail="Cannot create shift lead for this city")
 
+    # All three existence checks in one round trip
+    checks = (await session.execute(select(
+        exists().where(User.id == data.user_id).label("user_exists"),
+        exists().where(City.id == data.city_id).label("city_exists"),
+        exists().where(
+            ShiftLead.user_id == data.user_id,
+            ShiftLead.city_id == data.city_id,
+            ShiftLead.is_active == True
+        ).label("lead_exists"),
+    ))).one()
+
     # Verify user exists
-    target_user = await session.get(User, data.user_id)
-    if not target_user:
+    if not checks.user_exists:
         raise HTTPException(status_code=404, detail="User not found")
 
     # Verify city exists
-    city = await session.get(City, data.city_id)
-    if not city:
+    if not checks.city_exists:
         raise HTTPException(status_code=404, detail="City not found")
 
     # Check if already exists
-    existing = await session.execute(
-        select(ShiftLead).where(
-            ShiftLead.user_id == data.user_id,
-            ShiftLead.city_id == data.city_id,
-            ShiftLead.is_active == True
-        )
-    )
-    if existing.scalar_one_or_none():
+    if checks.lead_exists:
         raise HTTPException(status_code=400, detail="Shift lead already exists for this user and city")
 
     # Validate constraints
@@ -506,42 +663,51 @@ async def create_shift_lead(
 
     session.add(shift_lead)
 
-    # Also assign shift_lead role if not already assigned
-    role_result = await session.execute(
-        select(Role).where(Role.code == RoleCode.SHIFT_LEAD)
-    )
-    role = role_result.scalar_one_or_none()
-
-    if role:
-        # Check if role already assigned
-        existing_role = await session.execute(
-            select(UserRoleModel).where(
-                UserRoleModel.user_id == data.user_id,
-                UserRoleModel.role_id == role.id,
-                UserRoleModel.city_id == data.city_id,
-                UserRoleModel.is_active == True
-            )
-        )
-        if not existing_role.scalar_one_or_none():
-            user_role = UserRoleModel(
+    # Also assign shift_lead role if not already assigned (a no-op on conflict)
+    role = await get_active_role(RoleCode.SHIFT_LEAD)
+    if role is not None:
+        await session.execute(
+            pg_insert(UserRoleModel)
+            .values(
                 user_id=data.user_id,
                 role_id=role.id,
                 city_id=data.city_id,
                 assigned_by=user.id,
                 is_active=True
             )
-            session.add(user_role)
+            .on_conflict_do_nothing(
+                index_elements=_ACTIVE_ROLE_SCOPE,
+                index_where=UserRoleModel.is_active
+            )
+        )
 
     await session.commit()
-    await session.refresh(shift_lead)
+    await invalidate_user_scopes(redis, data.user_id)
 
     return ShiftLeadResponse.model_validate(shift_lead)
 
 
+def _shift_leads_query(scopes: UserScopes, city_id: Optional[int]):
+    """Scoped active shift leads, shared by the list and page endpoints"""
+    query = select(ShiftLead).where(ShiftLead.is_active == True)
+
+    # Apply scope filters
+    if not scopes.is_super_admin:
+        if scopes.has_role(RoleCode.CITY_ADMIN):
+            query = query.where(ShiftLead.city_id.in_(scopes.city_ids))
+        else:
+            raise HTTPException(status_code=403, detail="Insufficient permissions")
+
+    if city_id:
+        query = query.where(ShiftLead.city_id == city_id)
+
+    return query.order_by(ShiftLead.id)
+
+
 @router.get("/shift-leads", response_model=list[ShiftLeadResponse])
 async def list_shift_leads(
     session: Annotated[AsyncSession, Depends(get_session)],
-    user: Annotated[User, Depends(get_current_user)],
+    scopes: Annotated[UserScopes, Depends(get_current_user_scopes)],
     city_id: Optional[int] = Query(None)
 ):
     """
@@ -550,22 +716,39 @@ async def list_shift_leads(
     - **Super Admin**: Can see all
     - **City Admin**: Can see shift leads in their cities
     """
-    scopes = await get_user_scopes(session, user.id)
+    result = await session.execute(_shift_leads_query(scopes, city_id))
 
-    query = select(ShiftLead).where(ShiftLead.is_active == True)
+    return _shift_lead_list.validate_python(result.scalars().all(), from_attributes=True)
 
-    # Apply scope filters
-    if not scopes.is_super_admin:
-        if scopes.has_role(RoleCode.CITY_ADMIN):
-            query = query.where(ShiftLead.city_id.in_(scopes.city_ids))
-        else:
-            raise HTTPException(status_code=403, detail="Insufficient permissions")
 
-    if city_id:
-        query = query.where(ShiftLead.city_id == city_id)
+@router.get("/shift-leads/page", response_model=Page[ShiftLeadResponse])
+async def list_shift_leads_page(
+    session: Annotated[AsyncSession, Depends(get_session)],
+    scopes: Annotated[UserScopes, Depends(get_current_user_scopes)],
+    city_id: Optional[int] = Query(None),
+    limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page")
+):
+    """
+    List shift leads, keyset-paginated
 
-    result = await session.execute(query)
+    Same access rules and filters as `GET /shift-leads`; pass `next_cursor`
+    back as `cursor`
+    """
+    query = _shift_leads_query(scopes, city_id)
+
+    if cursor:
+        (c_id,) = decode_cursor(cursor, int)
+        query = query.where(ShiftLead.id > c_id)
+
+    result = await session.execute(query.limit(limit + 1))
     shift_leads = result.scalars().all()
+    has_next = len(shift_leads) > limit
+    shift_leads = shift_leads[:limit]
 
-    return [ShiftLeadResponse.model_validate(sl) for sl in shift_leads]
+    return Page[ShiftLeadResponse](
+        items=_shift_lead_list.validate_python(shift_leads, from_attributes=True),
+        has_next=has_next,
+        next_cursor=encode_cursor(shift_leads[-1].id) if has_next else None
+    )
 
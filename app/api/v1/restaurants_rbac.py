@@ -8,13 +8,15 @@ This demonstrates restaurant admin functionality:
 """
 from typing import Annotated, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from datetime import datetime
-from sqlalchemy import select
+from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.deps import get_session, get_current_user
 from app.core.rbac_deps import get_current_user_scopes, ScopeValidator
+from app.core.responses import prerendered
 from app.models.user import User
 from app.models.restaurant import Restaurant
 from app.models.rbac import RoleCode
@@ -40,12 +42,28 @@ class RestaurantResponse(BaseModel):
         from_attributes = True
 
 
+# Columns of a RestaurantResponse row
+_RESTAURANT_COLUMNS = (
+    Restaurant.id,
+    Restaurant.city_id,
+    Restaurant.owner_id,
+    Restaurant.name,
+    Restaurant.address,
+    Restaurant.phone,
+    Restaurant.is_approved,
+    Restaurant.is_active,
+    Restaurant.approved_by,
+    Restaurant.approved_at,
+    Restaurant.created_at,
+)
+
+
 class RestaurantApprovalRequest(BaseModel):
     approve: bool
     notes: Optional[str] = None
 
 
-@router.get("/", response_model=list[RestaurantResponse])
+@router.get("/", **prerendered(list[RestaurantResponse]))
 async def list_restaurants_scoped(
     session: Annotated[AsyncSession, Depends(get_session)],
     user: Annotated[User, Depends(get_current_user)],
@@ -64,7 +82,8 @@ async def list_restaurants_scoped(
     - **Restaurant Admin**: Their own restaurants
     - **Customer/Rider**: Only approved and active restaurants
     """
-    query = select(Restaurant)
+    # Read-only list: select the response columns, no Restaurant instances
+    query = select(*_RESTAURANT_COLUMNS)
 
     # Apply scope-based filters
     if scopes.is_super_admin:
@@ -99,9 +118,8 @@ async def list_restaurants_scoped(
     query = query.order_by(Restaurant.created_at.desc()).limit(limit).offset(offset)
 
     result = await session.execute(query)
-    restaurants = result.scalars().all()
 
-    return [RestaurantResponse.model_validate(r) for r in restaurants]
+    return ORJSONResponse([dict(row) for row in result.mappings()])
 
 
 @router.get("/{restaurant_id}", response_model=RestaurantResponse)
@@ -118,20 +136,13 @@ async def get_restaurant_details(
     if not restaurant:
         raise HTTPException(status_code=404, detail="Restaurant not found")
 
-    # Validate access
-    if not scopes.is_super_admin:
-        # City admin can access restaurants in their cities
-        if scopes.has_role(RoleCode.CITY_ADMIN) and restaurant.city_id in scopes.city_ids:
-            pass
-        # Restaurant admin can access their restaurants
-        elif scopes.has_role(RoleCode.RESTAURANT_ADMIN) and restaurant_id in scopes.restaurant_ids:
-            pass
-        # Owner can access their restaurant
-        elif restaurant.owner_id == user.id:
-            pass
-        # Others can only access approved restaurants
-        elif not restaurant.is_approved or not restaurant.is_active:
-            raise HTTPException(status_code=403, detail="Restaurant not accessible")
+    # Admins in scope and the owner see any state; others only live restaurants
+    if not (
+        scopes.can("restaurant.view", city_id=restaurant.city_id, restaurant_id=restaurant_id)
+        or restaurant.owner_id == user.id
+        or (restaurant.is_approved and restaurant.is_active)
+    ):
+        raise HTTPException(status_code=403, detail="Restaurant not accessible")
 
     return RestaurantResponse.model_validate(restaurant)
 
@@ -156,50 +167,36 @@ async def approve_restaurant(
     This is the key feature requested: Restaurant Admin approves restaurants
     so they can show their food to customers.
     """
-    # Check permission
-    if not scopes.is_super_admin:
-        # Restaurant Admin can approve if they have restaurant scope access
-        if scopes.has_role(RoleCode.RESTAURANT_ADMIN):
-            if restaurant_id not in scopes.restaurant_ids:
-                # City Admin can approve restaurants in their cities
-                if not scopes.has_role(RoleCode.CITY_ADMIN):
-                    raise HTTPException(
-                        status_code=403,
-                        detail="You don't have permission to approve this restaurant"
-                    )
-        elif scopes.has_role(RoleCode.CITY_ADMIN):
-            # City admin can approve restaurants in their cities
-            pass
-        else:
-            raise HTTPException(
-                status_code=403,
-                detail="Only restaurant admins or city admins can approve restaurants"
-            )
+    # Reject roles without the capability before touching the database
+    if not scopes.can("restaurant.approve"):
+        raise HTTPException(
+            status_code=403,
+            detail="Only restaurant admins or city admins can approve restaurants"
+        )
 
     # Get restaurant
     restaurant = await session.get(Restaurant, restaurant_id)
     if not restaurant:
         raise HTTPException(status_code=404, detail="Restaurant not found")
 
-    # Verify city admin has access to this restaurant's city
-    if not scopes.is_super_admin and scopes.has_role(RoleCode.CITY_ADMIN):
-        if restaurant.city_id not in scopes.city_ids:
-            raise HTTPException(
-                status_code=403,
-                detail="Cannot approve restaurants outside your cities"
-            )
+    # The restaurant must be in one of the approver's restaurant or city scopes
+    if not scopes.can("restaurant.approve", city_id=restaurant.city_id, restaurant_id=restaurant_id):
+        raise HTTPException(
+            status_code=403,
+            detail="You don't have permission to approve this restaurant"
+        )
 
     # Update approval status
     restaurant.is_approved = data.approve
     restaurant.approved_by = user.id if data.approve else None
-    restaurant.approved_at = datetime.utcnow() if data.approve else None
+    # Stamped by Postgres at flush (naive UTC, like the column)
+    restaurant.approved_at = func.timezone("UTC", func.now()) if data.approve else None
 
     # Make active if approved
     if data.approve:
         restaurant.is_active = True
 
     await session.commit()
-    await session.refresh(restaurant)
 
     return {
         "message": f"Restaurant {'approved' if data.approve else 'rejected'} successfully",
@@ -230,20 +227,15 @@ async def toggle_restaurant_active(
     if not restaurant:
         raise HTTPException(status_code=404, detail="Restaurant not found")
 
-    # Check permission
-    if not scopes.is_super_admin:
-        if scopes.has_role(RoleCode.CITY_ADMIN):
-            if restaurant.city_id not in scopes.city_ids:
-                raise HTTPException(status_code=403, detail="No access to this restaurant")
-        elif restaurant.owner_id == user.id:
-            # Owner can only deactivate if approved
-            if not restaurant.is_approved:
-                raise HTTPException(
-                    status_code=403,
-                    detail="Cannot activate restaurant before approval"
-                )
-        else:
+    # Check permission: city admins in scope, otherwise the owner once approved
+    if not scopes.can("restaurant.toggle_active", city_id=restaurant.city_id):
+        if restaurant.owner_id != user.id:
             raise HTTPException(status_code=403, detail="Insufficient permissions")
+        if not restaurant.is_approved:
+            raise HTTPException(
+                status_code=403,
+                detail="Cannot activate restaurant before approval"
+            )
 
     restaurant.is_active = is_active
     await session.commit()
@@ -268,7 +260,12 @@ async def get_pending_approval_count(
     - **Super Admin**: Count across all cities
     - **City Admin/Restaurant Admin**: Count in their scope
     """
-    query = select(Restaurant).where(Restaurant.is_approved == False)
+    # Postgres counts per city; only one (city_id, count) row per city comes back
+    query = (
+        select(Restaurant.city_id, func.count())
+        .where(Restaurant.is_approved == False)
+        .group_by(Restaurant.city_id)
+    )
 
     # Apply scope filters
     if not scopes.is_super_admin:
@@ -280,19 +277,10 @@ async def get_pending_approval_count(
             # No admin access
             raise HTTPException(status_code=403, detail="Insufficient permissions")
 
-    result = await session.execute(query)
-    pending_restaurants = result.scalars().all()
-
-    # Group by city
-    by_city = {}
-    for restaurant in pending_restaurants:
-        city_id = restaurant.city_id
-        if city_id not in by_city:
-            by_city[city_id] = 0
-        by_city[city_id] += 1
+    by_city = dict((await session.execute(query)).all())
 
     return {
-        "total_pending": len(pending_restaurants),
+        "total_pending": sum(by_city.values()),
         "by_city": by_city
     }
 
@@ -13,10 +13,39 @@ class Settings(BaseSettings):
 
     # --- database ---
     DATABASE_URL: str
+    # Each worker process has its own pool: keep
+    # WEB_CONCURRENCY * (DB_POOL_SIZE + DB_MAX_OVERFLOW) well under Postgres
+    # max_connections (100 by default), leaving room for migrations and admin
+    # sessions. 4 workers * (10 + 5) = 60.
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 5
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    DB_PGBOUNCER: bool = False  # transaction-mode PgBouncer in front of Postgres
+    DB_NULL_POOL: bool = False  # no app-side pool; leave pooling to PgBouncer
+    DB_POOL_WARMUP: int = 5  # connections opened per worker at startup (<= DB_POOL_SIZE)
+    DB_STATEMENT_CACHE_SIZE: int = 1024  # per-connection prepared statements (ignored with PgBouncer)
+    DB_QUERY_CACHE_SIZE: int = 1200  # SQLAlchemy compiled-SQL cache
+
+    # --- cache ---
+    REDIS_URL: str | None = None
+    ANALYTICS_CACHE_TTL_SECONDS: int = 60 * 60  # 1 hour
+    DASHBOARD_CACHE_TTL_SECONDS: int = 30  # admin dashboard counters
+    MENU_CACHE_TTL_SECONDS: int = 5 * 60
+    USER_CACHE_TTL_SECONDS: int = 5 * 60  # authenticated user lookups
+    DRIVER_CACHE_TTL_SECONDS: int = 60 * 60  # driver rows; every write invalidates
+    OWNER_CACHE_TTL_SECONDS: int = 30  # in-process restaurant_id -> owner_id
+    SCOPES_CACHE_TTL_SECONDS: int = 30  # user_id -> RBAC scopes (Redis, else per process)
+    CITY_CACHE_TTL_SECONDS: int = 60  # in-process active-city dropdown
+    ROLE_CACHE_TTL_SECONDS: int = 60  # in-process role code -> id map
+    RBAC_CACHE_TTL_SECONDS: int = 10 * 60  # role / city lists; writes invalidate
+    HTTP_CACHE_MAX_AGE_SECONDS: int = 30  # Cache-Control on ETag'd reads
+    HTTP_CACHE_SWR_SECONDS: int = 60
 
     # --- auth/security ---
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24  # 24 hours
     REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    BCRYPT_ROUNDS: int = 12  # cost factor for new hashes; existing hashes keep theirs
 
     # --- uploads/static ---
     MEDIA_DIR: str = "app/media"
@@ -0,0 +1,123 @@
+# app/core/cache.py
+"""
+Redis-backed read-through cache helpers
+
+The cache is optional: when REDIS_URL is not configured (or Redis is
+unreachable) every helper degrades to a no-op / miss so endpoints fall back
+to the database.
+"""
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.config import settings
+
+
+redis_client: Redis | None = (
+    Redis.from_url(settings.REDIS_URL, decode_responses=True)
+    if settings.REDIS_URL
+    else None
+)
+
+
+# FastAPI dependency
+async def get_redis() -> Redis | None:
+    return redis_client
+
+
+# --- cache keys ---
+
+def analytics_key(restaurant_id: int) -> str:
+    return f"analytics:{restaurant_id}:dashboard"
+
+
+def dashboard_key(scope: str) -> str:
+    return f"dashboard:{scope}"
+
+
+def menu_key(restaurant_id: int, category: str | None, available_only: bool) -> str:
+    return f"menu:{restaurant_id}:{category or 'all'}:{int(available_only)}"
+
+
+def menu_pattern(restaurant_id: int) -> str:
+    """Matches every cached menu variant of a restaurant"""
+    return f"menu:{restaurant_id}:*"
+
+
+def roles_key(include_inactive: bool) -> str:
+    return f"roles:{int(include_inactive)}"
+
+
+def roles_pattern() -> str:
+    """Matches every cached role list"""
+    return "roles:*"
+
+
+def cities_key(include_inactive: bool, city_ids: str, limit: int | None, cursor: str | None) -> str:
+    """limit None is the unpaginated list"""
+    return f"cities:{int(include_inactive)}:{city_ids}:{limit or 'all'}:{cursor or ''}"
+
+
+def cities_pattern() -> str:
+    """Matches every cached city list page"""
+    return "cities:*"
+
+
+def user_key(user_id: int) -> str:
+    return f"session:{user_id}"
+
+
+def driver_key(user_id: int) -> str:
+    return f"session:{user_id}:driver"
+
+
+def scopes_key(user_id: int) -> str:
+    return f"scopes:{user_id}"
+
+
+def scopes_pattern() -> str:
+    """Matches every user's cached RBAC scopes"""
+    return "scopes:*"
+
+
+# --- helpers ---
+
+async def cache_get(redis: Redis | None, key: str) -> str | None:
+    """Return the cached value for key, or None on miss / cache unavailable"""
+    if redis is None:
+        return None
+    try:
+        return await redis.get(key)
+    except RedisError:
+        return None
+
+
+async def cache_set(redis: Redis | None, key: str, value: str, ttl: int) -> None:
+    """Store value under key with a TTL in seconds"""
+    if redis is None:
+        return
+    try:
+        await redis.set(key, value, ex=ttl)
+    except RedisError:
+        pass
+
+
+async def cache_delete(redis: Redis | None, *keys: str) -> None:
+    """Invalidate one or more keys"""
+    if redis is None or not keys:
+        return
+    try:
+        await redis.delete(*keys)
+    except RedisError:
+        pass
+
+
+async def cache_delete_pattern(redis: Redis | None, pattern: str) -> None:
+    """Invalidate every key matching a glob pattern (SCAN-based, non-blocking)"""
+    if redis is None:
+        return
+    try:
+        keys = [key async for key in redis.scan_iter(match=pattern, count=100)]
+        if keys:
+            await redis.delete(*keys)
+    except RedisError:
+        pass
@@ -1,18 +1,62 @@
-from typing import Annotated
+from datetime import date
+import time
+from typing import Annotated, TypeVar
+import orjson
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import select, lambda_stmt, inspect as sa_inspect
 
+from app.config import settings
 from app.db.session import get_session
 from app.models.user import User, UserRole
+from app.models.driver import Driver
+from app.models.restaurant import Restaurant
+from app.core.cache import get_redis, user_key, driver_key, cache_get, cache_set
 from app.core.security import decode_token
 
 AuthBearer = HTTPBearer(auto_error=False)
 
+T = TypeVar("T")
+
+
+def _dump_row(obj, exclude: tuple[str, ...] = ()) -> str:
+    """Serialize an ORM row's column attributes for the cache"""
+    return orjson.dumps(
+        {
+            attr.key: getattr(obj, attr.key)
+            for attr in sa_inspect(type(obj)).column_attrs
+            if attr.key not in exclude
+        },
+        default=str,  # Decimal
+    ).decode()
+
+
+async def _load_row(session: AsyncSession, model: type[T], raw: str) -> T:
+    """Rebuild a cached row and attach it to the session without a SELECT"""
+    data = orjson.loads(raw)
+    columns = sa_inspect(model).columns
+    for key, value in data.items():
+        if value is None:
+            continue
+        py_type = columns[key].type.python_type
+        if not isinstance(value, py_type):
+            # dates/datetimes come back as ISO strings; enums and Decimals as raw values
+            data[key] = py_type.fromisoformat(value) if issubclass(py_type, date) else py_type(value)
+    obj = model(**data)
+    # Mark it persistent-but-detached so later changes flush as an UPDATE;
+    # attributes left out of the cache are simply expired
+    make_transient_to_detached(obj)
+    return await session.merge(obj, load=False)
+
+
 async def get_current_user(
     creds: Annotated[HTTPAuthorizationCredentials | None, Depends(AuthBearer)],
     session: Annotated[AsyncSession, Depends(get_session)],
+    redis: Annotated[Redis | None, Depends(get_redis)],
 ) -> User:
     if not creds or not creds.credentials:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
@@ -25,8 +69,30 @@ async def get_current_user(
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token type")
 
     user_id = int(payload.get("sub", 0))
-    res = await session.execute(select(User).where(User.id == user_id))
-    user = res.scalar_one_or_none()
+    key = user_key(user_id)
+    cached = await cache_get(redis, key)
+    if cached:
+        # is_active / role gate every request and can change without going
+        # through this app, so they are always read from Postgres (a narrow
+        # PK lookup); the cached row only spares hydrating the rest
+        access = (await session.execute(lambda_stmt(
+            lambda: select(User.is_active, User.role).where(User.id == user_id)
+        ))).first()
+        user = None
+        if access is not None:
+            user = await _load_row(session, User, cached)
+            set_committed_value(user, "is_active", access.is_active)
+            set_committed_value(user, "role", access.role)
+    else:
+        # lambda_stmt: the statement is built/compiled once, only user_id is rebound
+        res = await session.execute(lambda_stmt(lambda: select(User).where(User.id == user_id)))
+        user = res.scalar_one_or_none()
+        if user and user.is_active:
+            # hashed_password is deliberately left out of the cache
+            await cache_set(
+                redis, key, _dump_row(user, exclude=("hashed_password",)),
+                settings.USER_CACHE_TTL_SECONDS
+            )
     if not user or not user.is_active:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Inactive user")
     return user
@@ -57,6 +123,30 @@ async def get_current_driver(
     return user
 
 
+async def get_current_driver_profile(
+    user: Annotated[User, Depends(get_current_driver)],
+    session: Annotated[AsyncSession, Depends(get_session)],
+    redis: Annotated[Redis | None, Depends(get_redis)],
+) -> Driver:
+    """Resolve the current driver's Driver row (Redis-cached alongside the user)"""
+    key = driver_key(user.id)
+    cached = await cache_get(redis, key)
+    if cached:
+        return await _load_row(session, Driver, cached)
+
+    user_id = user.id
+    driver = await session.scalar(
+        lambda_stmt(lambda: select(Driver).where(Driver.user_id == user_id))
+    )
+    if not driver:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Driver profile not found"
+        )
+    await cache_set(redis, key, _dump_row(driver), settings.DRIVER_CACHE_TTL_SECONDS)
+    return driver
+
+
 async def get_current_restaurant_owner(
     user: Annotated[User, Depends(get_current_user)]
 ) -> User:
@@ -80,3 +170,32 @@ async def get_current_admin(
         )
     return user
 
+
+# restaurant_id -> (owner_id, expires_at), per worker process. Ownership is
+# never reassigned through the API, so only found rows are cached
+_OWNER_CACHE_MAX = 10_000
+_owner_cache: dict[int, tuple[int, float]] = {}
+
+
+async def assert_restaurant_owner(
+    session: AsyncSession,
+    restaurant_id: int,
+    user_id: int,
+    status_code: int = status.HTTP_404_NOT_FOUND,
+    detail: str = "Restaurant not found",
+) -> None:
+    """Raise unless the restaurant exists and is owned by user_id (fetches owner_id only)"""
+    now = time.monotonic()
+    hit = _owner_cache.get(restaurant_id)
+    if hit is not None and hit[1] > now:
+        owner_id = hit[0]
+    else:
+        owner_id = await session.scalar(
+            select(Restaurant.owner_id).where(Restaurant.id == restaurant_id)
+        )
+        if owner_id is not None:
+            if len(_owner_cache) >= _OWNER_CACHE_MAX:
+                _owner_cache.clear()
+            _owner_cache[restaurant_id] = (owner_id, now + settings.OWNER_CACHE_TTL_SECONDS)
+    if owner_id is None or owner_id != user_id:
+        raise HTTPException(status_code=status_code, detail=detail)
@@ -0,0 +1,47 @@
+# app/core/http_cache.py
+"""
+Conditional GET helpers (ETag / If-None-Match)
+
+The ETag is a hash of the exact response body, so it changes whenever the
+data does and needs no per-resource version bookkeeping.
+"""
+from hashlib import blake2b
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from app.config import settings
+
+
+def body_etag(body: bytes) -> str:
+    return f'"{blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def _matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison: W/"x" matches "x"
+    return any(
+        tag.strip().removeprefix("W/") == etag
+        for tag in if_none_match.split(",")
+    )
+
+
+def etag_json_response(request: Request, body: bytes) -> Response:
+    """
+    JSON response carrying ETag / Cache-Control; 304 with no body when the
+    client's If-None-Match already names this representation
+    """
+    etag = body_etag(body)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": (
+            f"private, max-age={settings.HTTP_CACHE_MAX_AGE_SECONDS}, "
+            f"stale-while-revalidate={settings.HTTP_CACHE_SWR_SECONDS}"
+        ),
+    }
+    if _matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,46 @@
+# app/core/pagination.py
+"""
+Keyset (cursor) pagination helpers
+
+A cursor is the opaque, URL-safe encoding of the sort key of the last row on
+a page, e.g. (created_at, id). The next page filters on key < cursor, so
+every page costs the same index range scan instead of scanning and
+discarding OFFSET rows.
+
+List endpoints fetch limit + 1 rows and report has_next from the extra row;
+they never run a COUNT(*) over the filtered set.
+"""
+import base64
+from datetime import datetime
+from typing import Generic, TypeVar
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+_PARSERS = {datetime: datetime.fromisoformat}
+
+
+class Page(BaseModel, Generic[T]):
+    items: list[T]
+    has_next: bool = False
+    next_cursor: str | None = None
+
+
+def encode_cursor(*key) -> str:
+    raw = "|".join(v.isoformat() if isinstance(v, datetime) else str(v) for v in key)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: type) -> tuple:
+    """Parse a cursor back into its key parts (one type per part), or 400"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        # Only the leading part may contain "|" (e.g. a name), so split from the right
+        parts = raw.rsplit("|", len(types) - 1)
+        if len(parts) != len(types):
+            raise ValueError(cursor)
+        return tuple(_PARSERS.get(t, t)(p) for t, p in zip(types, parts))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
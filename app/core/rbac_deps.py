@@ -8,10 +8,19 @@ These dependencies are used in route handlers to enforce permissions:
 - require_restaurant_admin: Restaurant admin only
 - And more...
 """
+import time
 from typing import Annotated, Optional
+
+import orjson
 from fastapi import Depends, HTTPException, status
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
+from app.core.cache import (
+    get_redis, cache_get, cache_set, cache_delete, cache_delete_pattern,
+    scopes_key, scopes_pattern,
+)
 from app.core.deps import get_current_user, get_session
 from app.models.user import User
 from app.models.rbac import RoleCode
@@ -22,16 +31,83 @@ from app.services.rbac_service import (
 )
 
 
+# With Redis the scopes are cached there, shared by all workers, and role /
+# assignment writes delete the key, so a revoke takes effect on the next
+# request everywhere. Without Redis they fall back to this per-process
+# user_id -> (scopes, expires_at) map: writes invalidate only the worker that
+# served them, and other workers keep stale scopes for up to
+# SCOPES_CACHE_TTL_SECONDS.
+_SCOPES_CACHE_MAX = 10_000
+_scopes_cache: dict[int, tuple[UserScopes, float]] = {}
+
+
+def _dump_scopes(scopes: UserScopes) -> str:
+    return orjson.dumps({
+        "user_id": scopes.user_id,
+        "is_super_admin": scopes.is_super_admin,
+        "is_self_only": scopes.is_self_only,
+        "city_ids": sorted(scopes.city_ids),
+        "restaurant_ids": sorted(scopes.restaurant_ids),
+        "role_codes": sorted(scopes.role_codes),
+        "role_scope_ids": {code: sorted(ids) for code, ids in scopes.role_scope_ids.items()},
+    }).decode()
+
+
+def _load_scopes(raw: str) -> UserScopes:
+    data = orjson.loads(raw)
+    return UserScopes(
+        user_id=data["user_id"],
+        is_super_admin=data["is_super_admin"],
+        is_self_only=data["is_self_only"],
+        city_ids=frozenset(data["city_ids"]),
+        restaurant_ids=frozenset(data["restaurant_ids"]),
+        role_codes=frozenset(data["role_codes"]),
+        role_scope_ids={code: frozenset(ids) for code, ids in data["role_scope_ids"].items()},
+    )
+
+
+async def invalidate_user_scopes(redis: Redis | None, user_id: Optional[int] = None) -> None:
+    """Drop one user's cached scopes, or everyone's when user_id is None"""
+    if user_id is None:
+        _scopes_cache.clear()
+        await cache_delete_pattern(redis, scopes_pattern())
+    else:
+        _scopes_cache.pop(user_id, None)
+        await cache_delete(redis, scopes_key(user_id))
+
+
 async def get_current_user_scopes(
     user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[AsyncSession, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_session)],
+    redis: Annotated[Redis | None, Depends(get_redis)],
 ) -> UserScopes:
     """
     Get the current user's RBAC scopes
 
-    This dependency is used to check what permissions the user has
+    This dependency is used to check what permissions the user has. FastAPI
+    caches it per request, so every role check below depends on it rather
+    than loading the scopes again; across requests they come from Redis, or
+    a short in-process TTL cache when Redis is not configured.
     """
-    return await get_user_scopes(session, user.id)
+    if redis is not None:
+        key = scopes_key(user.id)
+        cached = await cache_get(redis, key)
+        if cached:
+            return _load_scopes(cached)
+        scopes = await get_user_scopes(session, user.id)
+        await cache_set(redis, key, _dump_scopes(scopes), settings.SCOPES_CACHE_TTL_SECONDS)
+        return scopes
+
+    now = time.monotonic()
+    hit = _scopes_cache.get(user.id)
+    if hit is not None and hit[1] > now:
+        return hit[0]
+
+    scopes = await get_user_scopes(session, user.id)
+    if len(_scopes_cache) >= _SCOPES_CACHE_MAX:
+        _scopes_cache.clear()
+    _scopes_cache[user.id] = (scopes, now + settings.SCOPES_CACHE_TTL_SECONDS)
+    return scopes
 
 
 def require_roles(*role_codes: str):
@@ -54,11 +130,8 @@ def require_roles(*role_codes: str):
         FastAPI dependency function
     """
     async def check_roles(
-        user: Annotated[User, Depends(get_current_user)],
-        session: Annotated[AsyncSession, Depends(get_session)]
+        scopes: Annotated[UserScopes, Depends(get_current_user_scopes)]
     ) -> UserScopes:
-        scopes = await get_user_scopes(session, user.id)
-
         # Super admin bypasses all checks
         if scopes.is_super_admin:
             return scopes
@@ -97,11 +170,8 @@ def require_city_access(city_id: Optional[int] = None):
         FastAPI dependency function
     """
     async def check_city_access(
-        user: Annotated[User, Depends(get_current_user)],
-        session: Annotated[AsyncSession, Depends(get_session)]
+        scopes: Annotated[UserScopes, Depends(get_current_user_scopes)]
     ) -> UserScopes:
-        scopes = await get_user_scopes(session, user.id)
-
         # Super admin bypasses checks
         if scopes.is_super_admin:
             return scopes
@@ -140,11 +210,8 @@ def require_restaurant_access(restaurant_id: Optional[int] = None):
             ...
     """
     async def check_restaurant_access(
-        user: Annotated[User, Depends(get_current_user)],
-        session: Annotated[AsyncSession, Depends(get_session)]
+        scopes: Annotated[UserScopes, Depends(get_current_user_scopes)]
     ) -> UserScopes:
-        scopes = await get_user_scopes(session, user.id)
-
         # Super admin bypasses checks
         if scopes.is_super_admin:
             return scopes
@@ -171,11 +238,9 @@ def require_restaurant_access(restaurant_id: Optional[int] = None):
 # Predefined role dependencies for common use cases
 
 async def require_super_admin(
-    user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[AsyncSession, Depends(get_session)]
+    scopes: Annotated[UserScopes, Depends(get_current_user_scopes)]
 ) -> UserScopes:
     """Require super admin role"""
-    scopes = await get_user_scopes(session, user.id)
 
     if not scopes.is_super_admin:
         raise HTTPException(
@@ -187,48 +252,42 @@ async def require_super_admin(
 
 
 async def require_city_admin(
-    user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[AsyncSession, Depends(get_session)]
+    scopes: Annotated[UserScopes, Depends(get_current_user_scopes)]
 ) -> UserScopes:
     """Require city admin role"""
-    return await require_roles(RoleCode.CITY_ADMIN, RoleCode.SUPER_ADMIN)(user, session)
+    return await require_roles(RoleCode.CITY_ADMIN, RoleCode.SUPER_ADMIN)(scopes)
 
 
 async def require_shift_lead(
-    user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[AsyncSession, Depends(get_session)]
+    scopes: Annotated[UserScopes, Depends(get_current_user_scopes)]
 ) -> UserScopes:
     """Require shift lead role"""
-    return await require_roles(RoleCode.SHIFT_LEAD, RoleCode.CITY_ADMIN, RoleCode.SUPER_ADMIN)(user, session)
+    return await require_roles(RoleCode.SHIFT_LEAD, RoleCode.CITY_ADMIN, RoleCode.SUPER_ADMIN)(scopes)
 
 
 async def require_dispatcher(
-    user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[AsyncSession, Depends(get_session)]
+    scopes: Annotated[UserScopes, Depends(get_current_user_scopes)]
 ) -> UserScopes:
     """Require dispatcher role"""
-    return await require_roles(RoleCode.DISPATCHER, RoleCode.CITY_ADMIN, RoleCode.SUPER_ADMIN)(user, session)
+    return await require_roles(RoleCode.DISPATCHER, RoleCode.CITY_ADMIN, RoleCode.SUPER_ADMIN)(scopes)
 
 
 async def require_support(
-    user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[AsyncSession, Depends(get_session)]
+    scopes: Annotated[UserScopes, Depends(get_current_user_scopes)]
 ) -> UserScopes:
     """Require support role"""
-    return await require_roles(RoleCode.SUPPORT, RoleCode.CITY_ADMIN, RoleCode.SUPER_ADMIN)(user, session)
+    return await require_roles(RoleCode.SUPPORT, RoleCode.CITY_ADMIN, RoleCode.SUPER_ADMIN)(scopes)
 
 
 async def require_restaurant_admin_role(
-    user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[AsyncSession, Depends(get_session)]
+    scopes: Annotated[UserScopes, Depends(get_current_user_scopes)]
 ) -> UserScopes:
     """Require restaurant admin role"""
-    return await require_roles(RoleCode.RESTAURANT_ADMIN, RoleCode.SUPER_ADMIN)(user, session)
+    return await require_roles(RoleCode.RESTAURANT_ADMIN, RoleCode.SUPER_ADMIN)(scopes)
 
 
 async def require_admin_access(
-    user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[AsyncSession, Depends(get_session)]
+    scopes: Annotated[UserScopes, Depends(get_current_user_scopes)]
 ) -> UserScopes:
     """
     Require any admin-level access (super admin, city admin, or restaurant admin)
@@ -237,7 +296,7 @@ async def require_admin_access(
         RoleCode.SUPER_ADMIN,
         RoleCode.CITY_ADMIN,
         RoleCode.RESTAURANT_ADMIN
-    )(user, session)
+    )(scopes)
 
 
 class ScopeValidator:
@@ -290,7 +349,7 @@ class ScopeValidator:
 
         Args:
             scopes: User's scopes
-            order: Order model instance with city_id, restaurant_id, customer_id
+            order: Order instance or row with city_id, restaurant_id, customer_id, rider_id
         """
         if scopes.is_super_admin:
             return
@@ -0,0 +1,17 @@
+# app/core/responses.py
+"""
+Route options for endpoints that return ready-made JSON
+
+Hot and cached read endpoints build the response body themselves (orjson
+rows, pydantic-core dump_json, Redis-cached strings, ETag'd bodies) and
+return a Response. Declaring a response_model would make FastAPI validate
+and encode the value again, so these routes set response_model=None and
+publish the model in the OpenAPI schema through `responses` instead.
+"""
+from typing import Any
+
+
+def prerendered(model: Any) -> dict[str, Any]:
+    """Route kwargs documenting `model` as the 200 body without validating it:
+    @router.get(path, **prerendered(Model))"""
+    return {"response_model": None, "responses": {200: {"model": model}}}
@@ -1,19 +1,31 @@
 # app/core/security.py
 from datetime import datetime, timedelta, timezone
+import time
+import bcrypt
 import jwt  # PyJWT
-from passlib.context import CryptContext
 from app.config import settings
 
 ALGORITHM = "HS256"
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
+# bcrypt only uses the first 72 bytes of a password (bcrypt 5 rejects longer
+# ones), so signup schemas cap new passwords at this length
+BCRYPT_MAX_PASSWORD_BYTES = 72
+
+
+# bcrypt is deliberately slow CPU work: async callers must run these two in a
+# worker thread (run_in_threadpool) so a login doesn't stall the event loop.
+# The bcrypt C extension is called directly; hashes written earlier through
+# passlib are plain $2b$ strings and verify unchanged
 def hash_password(plain: str) -> str:
-    return pwd_context.hash(plain)
+    return bcrypt.hashpw(plain.encode(), bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)).decode()
 
 
 def verify_password(plain: str, hashed: str) -> bool:
-    return pwd_context.verify(plain, hashed)
+    try:
+        return bcrypt.checkpw(plain.encode(), hashed.encode())
+    except ValueError:  # malformed / non-bcrypt hash
+        return False
 
 
 def create_access_token(subject: str, expires_minutes: int | None = None) -> str:
@@ -36,10 +48,31 @@ def create_refresh_token(subject: str, expires_days: int | None = None) -> str:
     return jwt.encode(payload, settings.SECRET_KEY, algorithm=ALGORITHM)
 
 
+# token -> verified payload, per worker process. A client sends the same
+# access token on every request until it expires, so verification (HMAC +
+# base64 + JSON + claim checks) only runs once per token; "exp" is still
+# enforced on every hit
+_TOKEN_CACHE_MAX = 10_000
+_token_cache: dict[str, dict] = {}
+
+
 def decode_token(token: str) -> dict:
+    payload = _token_cache.get(token)
+    if payload is not None:
+        if payload["exp"] > time.time():
+            return payload
+        _token_cache.pop(token, None)
+        raise ValueError("Token expired")
+
     try:
-        return jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
     except jwt.ExpiredSignatureError:
         raise ValueError("Token expired")
     except jwt.InvalidTokenError:
         raise ValueError("Invalid token")
+
+    if "exp" in payload:
+        if len(_token_cache) >= _TOKEN_CACHE_MAX:
+            _token_cache.clear()
+        _token_cache[token] = payload
+    return payload
@@ -4,4 +4,8 @@ from sqlalchemy.orm import DeclarativeBase
 
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
-    pass
+
+    # Server-generated columns (created_at, starts_at, ...) come back in the
+    # INSERT's RETURNING clause. Sessions use expire_on_commit=False, so
+    # reading them after commit needs no refresh SELECT.
+    __mapper_args__ = {"eager_defaults": True}
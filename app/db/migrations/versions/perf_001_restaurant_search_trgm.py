@@ -0,0 +1,37 @@
+"""Add trigram indexes for restaurant search
+
+Revision ID: perf_001
+Revises: rbac_001
+Create Date: 2026-10-15
+
+Customer restaurant search matches name / cuisine_type with the pg_trgm
+word-similarity operator; these GIN indexes let Postgres answer it with a
+bitmap index scan instead of a sequential scan.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'perf_001'
+down_revision: Union[str, None] = 'rbac_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.create_index(
+        'idx_restaurants_name_trgm', 'restaurants', ['name'],
+        postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}
+    )
+    op.create_index(
+        'idx_restaurants_cuisine_trgm', 'restaurants', ['cuisine_type'],
+        postgresql_using='gin', postgresql_ops={'cuisine_type': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_restaurants_cuisine_trgm', table_name='restaurants')
+    op.drop_index('idx_restaurants_name_trgm', table_name='restaurants')
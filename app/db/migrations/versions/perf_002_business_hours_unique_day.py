@@ -0,0 +1,30 @@
+"""Add unique (restaurant_id, weekday) constraint on business_hours
+
+Revision ID: perf_002
+Revises: perf_001
+Create Date: 2026-10-15
+
+Lets create_business_hour insert with ON CONFLICT DO NOTHING instead of a
+separate existence check.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'perf_002'
+down_revision: Union[str, None] = 'perf_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_unique_constraint(
+        'uq_business_hours_restaurant_weekday',
+        'business_hours',
+        ['restaurant_id', 'weekday']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_business_hours_restaurant_weekday', 'business_hours', type_='unique')
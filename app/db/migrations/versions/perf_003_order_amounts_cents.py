@@ -0,0 +1,41 @@
+"""Store order money columns as integer cents
+
+Revision ID: perf_003
+Revises: perf_002
+Create Date: 2026-10-15
+
+subtotal / service_fee / delivery_fee / tip / total move from NUMERIC(10, 2)
+to BIGINT cents, so order reads no longer materialize Decimal objects.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'perf_003'
+down_revision: Union[str, None] = 'perf_002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONEY_COLUMNS = ('subtotal', 'service_fee', 'delivery_fee', 'tip', 'total')
+
+
+def upgrade() -> None:
+    for column in MONEY_COLUMNS:
+        op.alter_column(
+            'orders', column,
+            type_=sa.BigInteger(),
+            existing_type=sa.Numeric(10, 2),
+            postgresql_using=f'round({column} * 100)::bigint'
+        )
+
+
+def downgrade() -> None:
+    for column in MONEY_COLUMNS:
+        op.alter_column(
+            'orders', column,
+            type_=sa.Numeric(10, 2),
+            existing_type=sa.BigInteger(),
+            postgresql_using=f'({column} / 100.0)::numeric(10, 2)'
+        )
@@ -0,0 +1,31 @@
+"""Add partial index on ready orders
+
+Revision ID: perf_004
+Revises: perf_003
+Create Date: 2026-10-15
+
+The rider "available deliveries" feed only ever looks at orders in the
+'ready' state; a partial index keeps that lookup proportional to the
+handful of ready orders rather than the whole order history.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'perf_004'
+down_revision: Union[str, None] = 'perf_003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_orders_ready', 'orders', ['id'],
+        postgresql_where=sa.text("status = 'ready'")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_orders_ready', table_name='orders')
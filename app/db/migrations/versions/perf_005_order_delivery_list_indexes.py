@@ -0,0 +1,47 @@
+"""Add composite indexes for restaurant order lists and delivery history
+
+Revision ID: perf_005
+Revises: perf_004
+Create Date: 2026-10-15
+
+The restaurant order list filters on restaurant_id (and optionally status)
+and sorts by created_at DESC; the rider history filters on driver_id and
+sorts by delivered_at DESC. Composite indexes in that order let Postgres
+walk the index instead of sorting. (restaurant_id, status, created_at)
+supersedes the old (restaurant_id, status) index. menu_items.restaurant_id
+and restaurants.owner_id are already indexed.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'perf_005'
+down_revision: Union[str, None] = 'perf_004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_orders_restaurant_status_created', 'orders',
+        ['restaurant_id', 'status', sa.text('created_at DESC')]
+    )
+    op.create_index(
+        'idx_orders_restaurant_created', 'orders',
+        ['restaurant_id', sa.text('created_at DESC')]
+    )
+    op.drop_index('idx_orders_restaurant_status', table_name='orders')
+    op.create_index(
+        'idx_deliveries_driver_delivered', 'deliveries',
+        ['driver_id', sa.text('delivered_at DESC')],
+        postgresql_where=sa.text("delivered_at IS NOT NULL")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_deliveries_driver_delivered', table_name='deliveries')
+    op.create_index('idx_orders_restaurant_status', 'orders', ['restaurant_id', 'status'])
+    op.drop_index('idx_orders_restaurant_created', table_name='orders')
+    op.drop_index('idx_orders_restaurant_status_created', table_name='orders')
@@ -0,0 +1,33 @@
+"""Add partial unique index on open shifts
+
+Revision ID: perf_006
+Revises: perf_005
+Create Date: 2026-10-15
+
+Starting, ending and reading the active shift all look up the driver's
+single open shift (ends_at IS NULL). A partial unique index makes that an
+index probe regardless of shift history, and lets the database reject a
+second concurrent "start shift" instead of relying on a check-then-insert.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'perf_006'
+down_revision: Union[str, None] = 'perf_005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'uq_shifts_driver_open', 'shifts', ['driver_id'],
+        unique=True,
+        postgresql_where=sa.text("ends_at IS NULL")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_shifts_driver_open', table_name='shifts')
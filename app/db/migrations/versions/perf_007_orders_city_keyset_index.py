@@ -0,0 +1,32 @@
+"""Add keyset pagination index for the scoped order list
+
+Revision ID: perf_007
+Revises: perf_006
+Create Date: 2026-10-15
+
+The RBAC order list pages by (created_at, id) < cursor instead of OFFSET.
+(city_id, created_at DESC, id DESC) serves the city-scoped filter, the
+order and the cursor comparison from one index range scan, so a deep page
+costs the same as the first.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'perf_007'
+down_revision: Union[str, None] = 'perf_006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_orders_city_created_id', 'orders',
+        ['city_id', sa.text('created_at DESC'), sa.text('id DESC')]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_orders_city_created_id', table_name='orders')
@@ -0,0 +1,42 @@
+"""Replace the user-role scope constraint with a partial unique index
+
+Revision ID: perf_008
+Revises: perf_007
+Create Date: 2026-10-15
+
+Role assignment is a single INSERT ... ON CONFLICT DO NOTHING against
+(user_id, role_id, COALESCE(city_id, 0), COALESCE(restaurant_id, 0))
+WHERE is_active, replacing the separate "already assigned?" query.
+
+The old uq_user_role_scope constraint treated NULL scopes as distinct (so it
+never deduplicated global roles) and covered revoked rows (so a revoked role
+could not be assigned again). The partial index fixes both.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'perf_008'
+down_revision: Union[str, None] = 'perf_007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'uq_user_roles_active_scope', 'user_roles',
+        ['user_id', 'role_id', sa.text('COALESCE(city_id, 0)'), sa.text('COALESCE(restaurant_id, 0)')],
+        unique=True,
+        postgresql_where=sa.text('is_active')
+    )
+    op.drop_constraint('uq_user_role_scope', 'user_roles', type_='unique')
+
+
+def downgrade() -> None:
+    op.create_unique_constraint(
+        'uq_user_role_scope', 'user_roles',
+        ['user_id', 'role_id', 'city_id', 'restaurant_id']
+    )
+    op.drop_index('uq_user_roles_active_scope', table_name='user_roles')
@@ -0,0 +1,49 @@
+"""Add indexes backing the RBAC restaurant list and approval queue
+
+Revision ID: perf_009
+Revises: perf_008
+Create Date: 2026-10-15
+
+The scoped restaurant list filters by city_id / owner_id and orders by
+created_at DESC; (city_id, created_at DESC) and (owner_id, created_at DESC)
+serve both from one index range scan. The owner index supersedes
+idx_restaurants_owner, which is dropped.
+
+The approval queue only ever touches unapproved rows, so it gets a partial
+(city_id, created_at DESC) WHERE is_approved = false index: small, and the
+per-city pending count is an index-only scan over it.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'perf_009'
+down_revision: Union[str, None] = 'perf_008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_restaurants_city_created', 'restaurants',
+        ['city_id', sa.text('created_at DESC')]
+    )
+    op.create_index(
+        'ix_restaurants_owner_created', 'restaurants',
+        ['owner_id', sa.text('created_at DESC')]
+    )
+    op.drop_index('idx_restaurants_owner', table_name='restaurants')
+    op.create_index(
+        'ix_restaurants_pending_city_created', 'restaurants',
+        ['city_id', sa.text('created_at DESC')],
+        postgresql_where=sa.text('is_approved = false')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_restaurants_pending_city_created', table_name='restaurants')
+    op.create_index('idx_restaurants_owner', 'restaurants', ['owner_id'])
+    op.drop_index('ix_restaurants_owner_created', table_name='restaurants')
+    op.drop_index('ix_restaurants_city_created', table_name='restaurants')
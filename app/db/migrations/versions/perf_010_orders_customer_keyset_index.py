@@ -0,0 +1,34 @@
+"""Add keyset pagination index for the customer order history
+
+Revision ID: perf_010
+Revises: perf_009
+Create Date: 2026-10-15
+
+The customer order list pages by (created_at, id) < cursor, so rows sharing
+a timestamp are not skipped at a page boundary. (customer_id, created_at
+DESC, id DESC) serves the filter, the order and the cursor comparison from
+one index range scan; it supersedes idx_orders_customer, which is dropped.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'perf_010'
+down_revision: Union[str, None] = 'perf_009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_orders_customer_created_id', 'orders',
+        ['customer_id', sa.text('created_at DESC'), sa.text('id DESC')]
+    )
+    op.drop_index('idx_orders_customer', table_name='orders')
+
+
+def downgrade() -> None:
+    op.create_index('idx_orders_customer', 'orders', ['customer_id', 'created_at'])
+    op.drop_index('ix_orders_customer_created_id', table_name='orders')
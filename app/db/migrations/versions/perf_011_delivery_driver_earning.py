@@ -0,0 +1,37 @@
+"""Store the driver earning on each delivery
+
+Revision ID: perf_011
+Revises: perf_010
+Create Date: 2026-10-16
+
+deliveries.driver_earning holds the driver pay in integer cents, written by
+the rider "deliver" endpoint, so the earnings summary sums a stored value
+instead of recomputing it from distance_km. Completed deliveries are
+backfilled at the current BIKE_PAY_PER_KM rate.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.config import settings
+
+# revision identifiers, used by Alembic.
+revision: str = 'perf_011'
+down_revision: Union[str, None] = 'perf_010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('deliveries', sa.Column('driver_earning', sa.BigInteger(), nullable=True))
+    op.execute(
+        sa.text(
+            "UPDATE deliveries SET driver_earning = round(distance_km * :rate * 100)::bigint "
+            "WHERE delivered_at IS NOT NULL"
+        ).bindparams(rate=settings.BIKE_PAY_PER_KM)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('deliveries', 'driver_earning')
@@ -0,0 +1,31 @@
+"""Add a bounding-box index for the nearby-restaurant search
+
+Revision ID: perf_012
+Revises: perf_011
+Create Date: 2026-10-16
+
+The customer "nearby" endpoint prefilters active restaurants with
+lat BETWEEN ... AND lon BETWEEN ... before the exact haversine distance;
+a partial (lat, lon) index on active rows serves that range scan.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'perf_012'
+down_revision: Union[str, None] = 'perf_011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_restaurants_active_lat_lon', 'restaurants', ['lat', 'lon'],
+        postgresql_where=sa.text('is_active = true')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_restaurants_active_lat_lon', table_name='restaurants')
@@ -4,12 +4,13 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from pathlib import Path
 
 from app.config import settings
 from app.api.router import api_router
-from app.db.session import engine
+from app.db.session import engine, warm_pool
+from app.services.role_service import get_active_roles
 
 
 @asynccontextmanager
@@ -17,6 +18,8 @@ async def lifespan(app: FastAPI):
     try:
         async with engine.begin() as conn:
             await conn.run_sync(lambda _: None)
+        await warm_pool()
+        await get_active_roles()  # role code -> id map for role assignment
         print(f"[startup] ✓ Connected to DB: {settings.DATABASE_URL}")
     except Exception as e:
         print(f"[startup] ⚠ DB connection failed: {e}")
@@ -28,7 +31,11 @@ async def lifespan(app: FastAPI):
 Path(settings.MEDIA_DIR).mkdir(parents=True, exist_ok=True)
 Path("app/templates").mkdir(parents=True, exist_ok=True)
 
-app = FastAPI(title=settings.APP_NAME, lifespan=lifespan)
+app = FastAPI(
+    title=settings.APP_NAME,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
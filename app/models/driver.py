@@ -1,7 +1,7 @@
 from __future__ import annotations
 from datetime import datetime
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import Enum, DateTime, Numeric, Boolean, ForeignKey, text as sa_text
+from sqlalchemy import Enum, DateTime, Numeric, Boolean, BigInteger, ForeignKey, text as sa_text, Index
 from app.db.base import Base
 import enum
 
@@ -37,6 +37,14 @@ class Shift(Base):
     ends_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     geofence_id: Mapped[int | None] = mapped_column(ForeignKey("geofences.id"), nullable=True)
 
+    __table_args__ = (
+        # At most one open shift per driver; also the active-shift lookup
+        Index(
+            'uq_shifts_driver_open', 'driver_id', unique=True,
+            postgresql_where=sa_text("ends_at IS NULL")
+        ),
+    )
+
 
 class Delivery(Base):
     __tablename__ = "deliveries"
@@ -53,3 +61,13 @@ class Delivery(Base):
     picked_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     delivered_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     distance_km: Mapped[float]
+    # Driver pay for this delivery in cents, fixed when it is marked delivered
+    driver_earning: Mapped[int | None] = mapped_column(BigInteger)
+
+    __table_args__ = (
+        # Driver delivery history, newest first
+        Index(
+            'idx_deliveries_driver_delivered', 'driver_id', sa_text('delivered_at DESC'),
+            postgresql_where=sa_text("delivered_at IS NOT NULL")
+        ),
+    )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from datetime import datetime
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, Integer, Numeric, Enum, DateTime, ForeignKey, text as sa_text, Index
+from sqlalchemy import String, Integer, BigInteger, Numeric, Enum, DateTime, ForeignKey, text as sa_text, Index
 from app.db.base import Base
 import enum
 
@@ -23,6 +23,17 @@ class OrderStatus(str, enum.Enum):
     refunded = "refunded"
 
 
+# Orders still in flight (placed, not yet delivered or cancelled)
+PENDING_STATES = (
+    OrderStatus.created,
+    OrderStatus.confirmed,
+    OrderStatus.preparing,
+    OrderStatus.ready,
+    OrderStatus.assigned,
+    OrderStatus.picked_up,
+)
+
+
 class Order(Base):
     __tablename__ = "orders"
 
@@ -42,11 +53,12 @@ class Order(Base):
     customer_lon: Mapped[float | None]
     delivery_note: Mapped[str | None] = mapped_column(String(500))
 
-    subtotal: Mapped[float] = mapped_column(Numeric(10, 2))
-    service_fee: Mapped[float] = mapped_column(Numeric(10, 2))
-    delivery_fee: Mapped[float] = mapped_column(Numeric(10, 2))
-    tip: Mapped[float] = mapped_column(Numeric(10, 2), default=0)
-    total: Mapped[float] = mapped_column(Numeric(10, 2))
+    # Money amounts in integer cents (see app.utils.money)
+    subtotal: Mapped[int] = mapped_column(BigInteger)
+    service_fee: Mapped[int] = mapped_column(BigInteger)
+    delivery_fee: Mapped[int] = mapped_column(BigInteger)
+    tip: Mapped[int] = mapped_column(BigInteger, default=0)
+    total: Mapped[int] = mapped_column(BigInteger)
 
     distance_km: Mapped[float | None]
 
@@ -56,19 +68,33 @@ class Order(Base):
     )
 
     # Relationships
-    city: Mapped["City"] = relationship("City", foreign_keys=[city_id])
-    customer: Mapped["User"] = relationship("User", foreign_keys=[customer_id])
-    restaurant: Mapped["Restaurant"] = relationship("Restaurant", foreign_keys=[restaurant_id])
-    rider: Mapped["User | None"] = relationship("User", foreign_keys=[rider_id])
+    city: Mapped["City"] = relationship("City", foreign_keys=[city_id], lazy="raise")
+    customer: Mapped["User"] = relationship("User", foreign_keys=[customer_id], lazy="raise")
+    restaurant: Mapped["Restaurant"] = relationship("Restaurant", foreign_keys=[restaurant_id], lazy="raise")
+    rider: Mapped["User | None"] = relationship("User", foreign_keys=[rider_id], lazy="raise")
     items: Mapped[list["OrderItem"]] = relationship(
-        back_populates="order", cascade="all, delete-orphan"
+        back_populates="order", cascade="all, delete-orphan",
+        lazy="raise", passive_deletes=True
     )
 
     __table_args__ = (
         Index('idx_orders_city_status', 'city_id', 'status'),
-        Index('idx_orders_restaurant_status', 'restaurant_id', 'status'),
+        # Scoped order list: keyset pages on (created_at, id) within a city
+        Index('ix_orders_city_created_id', 'city_id', sa_text('created_at DESC'), sa_text('id DESC')),
+        # Restaurant order list: newest first, optionally filtered by status
+        Index('idx_orders_restaurant_status_created', 'restaurant_id', 'status', sa_text('created_at DESC')),
+        Index('idx_orders_restaurant_created', 'restaurant_id', sa_text('created_at DESC')),
         Index('idx_orders_rider_status', 'rider_id', 'status'),
-        Index('idx_orders_customer', 'customer_id', 'created_at'),
+        # Customer order history: keyset pages on (created_at, id)
+        Index(
+            'ix_orders_customer_created_id',
+            'customer_id', sa_text('created_at DESC'), sa_text('id DESC')
+        ),
+        # Rider feed: the small set of orders waiting for pickup
+        Index(
+            'idx_orders_ready', 'id',
+            postgresql_where=sa_text("status = 'ready'")
+        ),
     )
 
 
@@ -85,4 +111,4 @@ class OrderItem(Base):
     unit_price: Mapped[float] = mapped_column(Numeric(10, 2))
     line_total: Mapped[float] = mapped_column(Numeric(10, 2))
 
-    order: Mapped["Order"] = relationship(back_populates="items")
+    order: Mapped["Order"] = relationship(back_populates="items", lazy="raise")
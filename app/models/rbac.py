@@ -10,7 +10,7 @@ This module defines the core RBAC models for the system with support for:
 from __future__ import annotations
 from datetime import datetime
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, Enum, ForeignKey, Boolean, DateTime, Index, CheckConstraint, UniqueConstraint
+from sqlalchemy import String, Enum, ForeignKey, Boolean, DateTime, Index, CheckConstraint, UniqueConstraint, text as sa_text
 from app.db.base import Base
 import enum
 
@@ -59,7 +59,7 @@ class Role(Base):
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
-    user_roles: Mapped[list["UserRole"]] = relationship("UserRole", back_populates="role")
+    user_roles: Mapped[list["UserRole"]] = relationship("UserRole", back_populates="role", lazy="raise")
 
     def __repr__(self):
         return f"<Role {self.code} ({self.scope_type})>"
@@ -98,15 +98,22 @@ class UserRole(Base):
     notes: Mapped[str | None] = mapped_column(String(500))
 
     # Relationships
-    user: Mapped["User"] = relationship("User", foreign_keys=[user_id], back_populates="user_roles")
-    role: Mapped["Role"] = relationship("Role", back_populates="user_roles")
-    city: Mapped["City | None"] = relationship("City", foreign_keys=[city_id])
-    restaurant: Mapped["Restaurant | None"] = relationship("Restaurant", foreign_keys=[restaurant_id])
-    assigner: Mapped["User | None"] = relationship("User", foreign_keys=[assigned_by])
+    user: Mapped["User"] = relationship("User", foreign_keys=[user_id], back_populates="user_roles", lazy="raise")
+    role: Mapped["Role"] = relationship("Role", back_populates="user_roles", lazy="raise")
+    city: Mapped["City | None"] = relationship("City", foreign_keys=[city_id], lazy="raise")
+    restaurant: Mapped["Restaurant | None"] = relationship("Restaurant", foreign_keys=[restaurant_id], lazy="raise")
+    assigner: Mapped["User | None"] = relationship("User", foreign_keys=[assigned_by], lazy="raise")
 
     __table_args__ = (
-        # Unique constraint: user can't have the same role+scope combination twice
-        UniqueConstraint('user_id', 'role_id', 'city_id', 'restaurant_id', name='uq_user_role_scope'),
+        # A user can't hold the same role+scope combination twice while active.
+        # COALESCE makes NULL scopes (global roles) compare equal; revoked rows
+        # are kept as history. Also the ON CONFLICT target of role assignment.
+        Index(
+            'uq_user_roles_active_scope', 'user_id', 'role_id',
+            sa_text('COALESCE(city_id, 0)'), sa_text('COALESCE(restaurant_id, 0)'),
+            unique=True,
+            postgresql_where=sa_text('is_active')
+        ),
 
         # Check constraints for scope validation
         CheckConstraint(
@@ -179,8 +186,8 @@ class ShiftLead(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
     # Relationships
-    user: Mapped["User"] = relationship("User", foreign_keys=[user_id])
-    city: Mapped["City"] = relationship("City", foreign_keys=[city_id])
+    user: Mapped["User"] = relationship("User", foreign_keys=[user_id], lazy="raise")
+    city: Mapped["City"] = relationship("City", foreign_keys=[city_id], lazy="raise")
 
     __table_args__ = (
         UniqueConstraint('user_id', 'city_id', name='uq_shift_lead_user_city'),
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from datetime import datetime
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, Numeric, Boolean, ForeignKey, Integer, DateTime, Index
+from sqlalchemy import String, Numeric, Boolean, ForeignKey, Integer, DateTime, Index, UniqueConstraint, text as sa_text
 from app.db.base import Base
 
 
@@ -37,17 +37,39 @@ class Restaurant(Base):
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
-    city: Mapped["City"] = relationship("City", foreign_keys=[city_id])
-    owner: Mapped["User"] = relationship("User", foreign_keys=[owner_id])
-    approver: Mapped["User | None"] = relationship("User", foreign_keys=[approved_by])
+    city: Mapped["City"] = relationship("City", foreign_keys=[city_id], lazy="raise")
+    owner: Mapped["User"] = relationship("User", foreign_keys=[owner_id], lazy="raise")
+    approver: Mapped["User | None"] = relationship("User", foreign_keys=[approved_by], lazy="raise")
     hours: Mapped[list["BusinessHour"]] = relationship(
-        back_populates="restaurant", cascade="all, delete-orphan"
+        back_populates="restaurant", cascade="all, delete-orphan",
+        lazy="raise", passive_deletes=True
     )
 
     __table_args__ = (
         Index('idx_restaurants_city_active', 'city_id', 'is_active'),
-        Index('idx_restaurants_owner', 'owner_id'),
         Index('idx_restaurants_approved', 'is_approved', 'is_active'),
+        # RBAC restaurant list: scope filter + newest-first from one range scan
+        Index('ix_restaurants_city_created', 'city_id', sa_text('created_at DESC')),
+        Index('ix_restaurants_owner_created', 'owner_id', sa_text('created_at DESC')),
+        # Approval queue: pending list per city and the per-city pending count
+        Index(
+            'ix_restaurants_pending_city_created', 'city_id', sa_text('created_at DESC'),
+            postgresql_where=sa_text('is_approved = false')
+        ),
+        # Nearby search: bounding-box prefilter on active restaurants
+        Index(
+            'ix_restaurants_active_lat_lon', 'lat', 'lon',
+            postgresql_where=sa_text('is_active = true')
+        ),
+        # Trigram indexes for customer search (requires pg_trgm)
+        Index(
+            'idx_restaurants_name_trgm', 'name',
+            postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}
+        ),
+        Index(
+            'idx_restaurants_cuisine_trgm', 'cuisine_type',
+            postgresql_using='gin', postgresql_ops={'cuisine_type': 'gin_trgm_ops'}
+        ),
     )
 
 
@@ -62,4 +84,8 @@ class BusinessHour(Base):
     open_time: Mapped[str] = mapped_column(String(5))    # "09:00"
     close_time: Mapped[str] = mapped_column(String(5))   # "21:00"
 
-    restaurant: Mapped["Restaurant"] = relationship(back_populates="hours")
+    restaurant: Mapped["Restaurant"] = relationship(back_populates="hours", lazy="raise")
+
+    __table_args__ = (
+        UniqueConstraint('restaurant_id', 'weekday', name='uq_business_hours_restaurant_weekday'),
+    )
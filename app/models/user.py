@@ -24,11 +24,13 @@ class User(Base):
     last_name: Mapped[str] = mapped_column(String(80))
     date_of_birth: Mapped[date | None] = mapped_column(Date, nullable=True)
     role: Mapped[UserRole] = mapped_column(Enum(UserRole), default=UserRole.customer)
-    hashed_password: Mapped[str] = mapped_column(String(255))
+    # Only login reads it (undefer); elsewhere, including Redis-cached users,
+    # touching it raises instead of lazy-loading in async context
+    hashed_password: Mapped[str] = mapped_column(String(255), deferred=True, deferred_raiseload=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
 
     # Relationships for RBAC
     user_roles: Mapped[list["UserRole"]] = relationship(
-        "UserRole", foreign_keys="UserRole.user_id", back_populates="user"
+        "UserRole", foreign_keys="UserRole.user_id", back_populates="user", lazy="raise"
     )
 
@@ -1,9 +1,24 @@
-from pydantic import BaseModel, EmailStr, field_validator
+from typing import Annotated
+
+from pydantic import AfterValidator, BaseModel, EmailStr, field_validator
+
+from app.core.security import BCRYPT_MAX_PASSWORD_BYTES
+
+
+def _fits_bcrypt(v: str) -> str:
+    if len(v.encode()) > BCRYPT_MAX_PASSWORD_BYTES:
+        raise ValueError(f"Password must be at most {BCRYPT_MAX_PASSWORD_BYTES} bytes")
+    return v
+
+
+# Password chosen at signup; must be hashable by bcrypt without truncation
+NewPassword = Annotated[str, AfterValidator(_fits_bcrypt)]
+
 
 class SignupIn(BaseModel):
     email: EmailStr | None = None
     phone: str | None = None
-    password: str
+    password: NewPassword
     first_name: str
     last_name: str
     date_of_birth: str | None = None  # ISO date
@@ -0,0 +1,41 @@
+# app/services/city_service.py
+import time
+
+from sqlalchemy import select
+
+from app.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.rbac import City
+
+# (expires_at, rows) of active cities as (id, name) rows, per worker process.
+# Cities change rarely and every admin page renders them as a dropdown; a
+# new city shows up on other workers within CITY_CACHE_TTL_SECONDS
+_active_cities: tuple[float, list] | None = None
+
+
+async def get_active_cities(city_ids: set[int] | None = None) -> list:
+    """
+    Active cities as (id, name) rows, optionally restricted to city_ids
+
+    Served from an in-process TTL cache; a miss queries on its own session so
+    callers can run it concurrently with their own queries.
+    """
+    global _active_cities
+    now = time.monotonic()
+    if _active_cities is None or _active_cities[0] <= now:
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(City.id, City.name).where(City.is_active == True)
+            )
+            _active_cities = (now + settings.CITY_CACHE_TTL_SECONDS, result.all())
+
+    rows = _active_cities[1]
+    if city_ids is None:
+        return rows
+    return [row for row in rows if row.id in city_ids]
+
+
+def invalidate_active_cities() -> None:
+    """Drop the cached city list (call after creating / changing a city)"""
+    global _active_cities
+    _active_cities = None
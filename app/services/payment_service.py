@@ -1,6 +1,5 @@
 from app.models.payment import PaymentProvider, PaymentStatus, Payment
 from sqlalchemy.ext.asyncio import AsyncSession
-from datetime import datetime
 
 
 class PaymentService:
@@ -8,7 +7,7 @@ class PaymentService:
         self.session = session
 
     async def create_intent(self, order_id: int, amount: float, provider: PaymentProvider) -> Payment:
-        p = Payment(order_id=order_id, provider=provider, status=PaymentStatus.pending, amount=amount, currency="EUR", created_at=datetime.utcnow())
+        p = Payment(order_id=order_id, provider=provider, status=PaymentStatus.pending, amount=amount, currency="EUR")
         self.session.add(p)
         await self.session.commit()
         return p
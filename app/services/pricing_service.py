@@ -3,13 +3,15 @@ from app.utils.distance import haversine_km
 
 
 class Quote:
-    def __init__(self, subtotal: float, distance_km: float | None, order_type: str):
-        self.subtotal = round(subtotal, 2)
-        self.service_fee = round(subtotal * settings.SERVICE_FEE_RATE, 2)
-        self.delivery_fee = 0.0
+    """Order pricing; every amount is in integer cents"""
+
+    def __init__(self, subtotal: int, distance_km: float | None, order_type: str):
+        self.subtotal = subtotal
+        self.service_fee = round(subtotal * settings.SERVICE_FEE_RATE)
+        self.delivery_fee = 0
         if order_type == "delivery" and distance_km is not None:
-            self.delivery_fee = round(settings.DELIVERY_BASE_FEE + distance_km * settings.DELIVERY_PER_KM_FEE, 2)
-        self.total = round(self.subtotal + self.service_fee + self.delivery_fee, 2)
+            self.delivery_fee = round((settings.DELIVERY_BASE_FEE + distance_km * settings.DELIVERY_PER_KM_FEE) * 100)
+        self.total = self.subtotal + self.service_fee + self.delivery_fee
 
 
 def driver_eligible(vehicle: str, distance_km: float) -> bool:
@@ -13,31 +13,80 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Query
 
 from app.models.rbac import UserRole, Role, ScopeType, RoleCode
+from app.services.role_service import get_active_role
+
+
+# Capability matrix: which actions a role grants and at which scope level.
+# A capability only applies to objects inside that role's own assignments,
+# checked by UserScopes.can
+CAPABILITIES: dict[RoleCode, tuple[ScopeType, frozenset[str]]] = {
+    RoleCode.CITY_ADMIN: (ScopeType.CITY, frozenset({
+        "restaurant.view", "restaurant.approve", "restaurant.toggle_active",
+    })),
+    RoleCode.RESTAURANT_ADMIN: (ScopeType.RESTAURANT, frozenset({
+        "restaurant.view", "restaurant.approve",
+    })),
+}
 
 
 @dataclass
 class UserScopes:
     """
     Represents a user's access scopes across the system
+
+    The id/code sets are frozensets: built once in get_user_scopes, then
+    shared read-only (per request and through the scopes TTL cache).
+    role_scope_ids keeps the city / restaurant ids per role code, so a
+    capability is never applied through another role's assignments.
     """
     user_id: int
     is_super_admin: bool = False
-    city_ids: set[int] = None
-    restaurant_ids: set[int] = None
+    city_ids: frozenset[int] = None
+    restaurant_ids: frozenset[int] = None
     is_self_only: bool = False
-    role_codes: set[str] = None
+    role_codes: frozenset[str] = None
+    role_scope_ids: dict[str, frozenset[int]] = None
 
     def __post_init__(self):
         if self.city_ids is None:
-            self.city_ids = set()
+            self.city_ids = frozenset()
         if self.restaurant_ids is None:
-            self.restaurant_ids = set()
+            self.restaurant_ids = frozenset()
         if self.role_codes is None:
-            self.role_codes = set()
+            self.role_codes = frozenset()
+        if self.role_scope_ids is None:
+            self.role_scope_ids = {}
 
     def has_role(self, *role_codes: str) -> bool:
         """Check if user has any of the specified roles"""
-        return bool(self.role_codes & set(role_codes))
+        return not self.role_codes.isdisjoint(role_codes)
+
+    def can(
+        self,
+        capability: str,
+        *,
+        city_id: Optional[int] = None,
+        restaurant_id: Optional[int] = None
+    ) -> bool:
+        """
+        Check a capability, optionally on an object in scope
+
+        Without city_id / restaurant_id only the capability itself is checked.
+        With them, some role granting the capability must be assigned to the
+        object: a city-level role to city_id, a restaurant-level role to
+        restaurant_id.
+        """
+        if self.is_super_admin:
+            return True
+        for code, (scope_type, capabilities) in CAPABILITIES.items():
+            if capability not in capabilities or code not in self.role_codes:
+                continue
+            if city_id is None and restaurant_id is None:
+                return True
+            object_id = city_id if scope_type == ScopeType.CITY else restaurant_id
+            if object_id in self.role_scope_ids.get(code, ()):
+                return True
+        return False
 
     def can_access_city(self, city_id: int) -> bool:
         """Check if user can access a specific city"""
@@ -67,40 +116,53 @@ async def get_user_scopes(session: AsyncSession, user_id: int) -> UserScopes:
     Returns:
         UserScopes object containing all permissions and scope information
     """
-    # Query all active user roles with their role definitions
+    # One JOIN over the four columns the scopes are built from; no UserRole /
+    # Role instances are hydrated
     result = await session.execute(
-        select(UserRole, Role)
+        select(Role.code, Role.scope_type, UserRole.city_id, UserRole.restaurant_id)
         .join(Role, UserRole.role_id == Role.id)
         .where(UserRole.user_id == user_id)
         .where(UserRole.is_active == True)
         .where(Role.is_active == True)
     )
 
-    user_roles = result.all()
-
-    scopes = UserScopes(user_id=user_id)
+    role_codes: set[str] = set()
+    city_ids: set[int] = set()
+    restaurant_ids: set[int] = set()
+    role_scope_ids: dict[str, set[int]] = {}
+    is_super_admin = is_self_only = False
 
-    for user_role, role in user_roles:
-        scopes.role_codes.add(role.code)
+    for code, scope_type, city_id, restaurant_id in result:
+        role_codes.add(code)
 
         # Check for super admin
-        if role.code == RoleCode.SUPER_ADMIN:
-            scopes.is_super_admin = True
+        if code == RoleCode.SUPER_ADMIN:
+            is_super_admin = True
             continue
 
         # Handle city-scoped roles
-        if role.scope_type == ScopeType.CITY and user_role.city_id:
-            scopes.city_ids.add(user_role.city_id)
+        if scope_type == ScopeType.CITY and city_id:
+            city_ids.add(city_id)
+            role_scope_ids.setdefault(code, set()).add(city_id)
 
         # Handle restaurant-scoped roles
-        if role.scope_type == ScopeType.RESTAURANT and user_role.restaurant_id:
-            scopes.restaurant_ids.add(user_role.restaurant_id)
+        if scope_type == ScopeType.RESTAURANT and restaurant_id:
+            restaurant_ids.add(restaurant_id)
+            role_scope_ids.setdefault(code, set()).add(restaurant_id)
 
         # Handle self-scoped roles
-        if role.scope_type == ScopeType.SELF:
-            scopes.is_self_only = True
-
-    return scopes
+        if scope_type == ScopeType.SELF:
+            is_self_only = True
+
+    return UserScopes(
+        user_id=user_id,
+        is_super_admin=is_super_admin,
+        city_ids=frozenset(city_ids),
+        restaurant_ids=frozenset(restaurant_ids),
+        is_self_only=is_self_only,
+        role_codes=frozenset(role_codes),
+        role_scope_ids={code: frozenset(ids) for code, ids in role_scope_ids.items()},
+    )
 
 
 def apply_scope_filters(query, model, scopes: UserScopes, user_id_field: str = None):
@@ -183,7 +245,7 @@ async def check_role_permission(
 
 async def can_assign_role(
     session: AsyncSession,
-    assigner_user_id: int,
+    assigner_scopes: UserScopes,
     role_code: str,
     target_city_id: Optional[int] = None,
     target_restaurant_id: Optional[int] = None
@@ -199,7 +261,7 @@ async def can_assign_role(
 
     Args:
         session: Database session
-        assigner_user_id: User attempting to assign the role
+        assigner_scopes: Scopes of the user attempting to assign the role
         role_code: Role being assigned
         target_city_id: City scope of the assignment (if city-scoped)
         target_restaurant_id: Restaurant scope of the assignment (if restaurant-scoped)
@@ -207,19 +269,14 @@ async def can_assign_role(
     Returns:
         True if assignment is allowed, False otherwise
     """
-    assigner_scopes = await get_user_scopes(session, assigner_user_id)
-
     # Super admin can assign anything
     if assigner_scopes.is_super_admin:
         return True
 
     # City Admin can assign city-scoped roles within their cities
     if assigner_scopes.has_role(RoleCode.CITY_ADMIN):
-        # Get the role being assigned
-        result = await session.execute(
-            select(Role).where(Role.code == role_code)
-        )
-        role = result.scalar_one_or_none()
+        # Get the role being assigned (in-process role map, no query)
+        role = await get_active_role(role_code)
 
         if not role:
             return False
@@ -0,0 +1,46 @@
+# app/services/role_service.py
+import time
+
+from sqlalchemy import select
+
+from app.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.rbac import Role
+
+# (expires_at, {code: (id, code, scope_type) row}) of active roles, per worker
+# process. Roles are runtime configuration that almost never changes, and
+# every role assignment needs the code -> id translation. A role toggle
+# invalidates only the worker that served it; others catch up within
+# ROLE_CACHE_TTL_SECONDS (the scopes that authorize requests are invalidated
+# for every worker through Redis, see app.core.rbac_deps)
+_active_roles: tuple[float, dict] | None = None
+
+
+async def get_active_roles() -> dict:
+    """
+    Active roles as {code: (id, code, scope_type) row}
+
+    Served from an in-process TTL cache (warmed at startup); a miss queries on
+    its own session so callers can use it mid-transaction.
+    """
+    global _active_roles
+    now = time.monotonic()
+    if _active_roles is None or _active_roles[0] <= now:
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(Role.id, Role.code, Role.scope_type).where(Role.is_active == True)
+            )
+            _active_roles = (now + settings.ROLE_CACHE_TTL_SECONDS, {row.code: row for row in result})
+
+    return _active_roles[1]
+
+
+async def get_active_role(code: str):
+    """The active role with this code as an (id, code, scope_type) row, or None"""
+    return (await get_active_roles()).get(code)
+
+
+def invalidate_active_roles() -> None:
+    """Drop the cached roles (call after creating / toggling a role)"""
+    global _active_roles
+    _active_roles = None
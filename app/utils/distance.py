@@ -1,10 +1,52 @@
-from math import radians, sin, cos, sqrt, atan2
+from math import radians, degrees, sin, cos, asin, sqrt, atan2
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0
 
 
 def haversine_km(lat1, lon1, lat2, lon2) -> float:
-    R = 6371.0
+    """Scalar distance in km; pure math, no numpy dispatch overhead for a single pair"""
+    R = EARTH_RADIUS_KM
     dlat = radians(lat2-lat1)
     dlon = radians(lon2-lon1)
     a = sin(dlat/2)**2 + cos(radians(lat1))*cos(radians(lat2))*sin(dlon/2)**2
     c = 2*atan2(sqrt(a), sqrt(1-a))
-    return R*c
\ No newline at end of file
+    return R*c
+
+
+def haversine_km_vec(lat0: float, lon0: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """
+    Distance in km from one point to many points at once.
+
+    Use for N >> 1 (e.g. nearby-restaurant search); for a single pair the
+    scalar haversine_km is faster.
+    """
+    lat0_r, lon0_r = np.radians(lat0), np.radians(lon0)
+    lats_r, lons_r = np.radians(lats), np.radians(lons)
+    a = (
+        np.sin((lats_r - lat0_r) / 2) ** 2
+        + np.cos(lat0_r) * np.cos(lats_r) * np.sin((lons_r - lon0_r) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+def bounding_box(
+    lat: float, lon: float, radius_km: float
+) -> tuple[float, float, float | None, float | None]:
+    """
+    (min_lat, max_lat, min_lon, max_lon) enclosing every point within
+    radius_km of (lat, lon), for a cheap indexed prefilter before the exact
+    haversine check. The lon bounds are None when the circle reaches a pole
+    or crosses the antimeridian.
+    """
+    angle = radius_km / EARTH_RADIUS_KM
+    dlat = degrees(angle)
+    min_lat, max_lat = lat - dlat, lat + dlat
+    if min_lat <= -90 or max_lat >= 90:
+        return max(min_lat, -90.0), min(max_lat, 90.0), None, None
+    dlon = degrees(asin(sin(angle) / cos(radians(lat))))
+    min_lon, max_lon = lon - dlon, lon + dlon
+    if min_lon < -180 or max_lon > 180:
+        return min_lat, max_lat, None, None
+    return min_lat, max_lat, min_lon, max_lon
@@ -0,0 +1,7 @@
+from decimal import Decimal, ROUND_HALF_UP
+
+
+def to_cents(amount) -> int:
+    """Convert a currency amount (Decimal, float or str) to integer cents, rounding half up"""
+    return int((Decimal(str(amount)) * 100).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
@@ -0,0 +1,48 @@
+"""
+Tests for customer order history
+Run with: TEST_DATABASE_URL=... pytest tests/apps/test_customer/test_my_orders.py
+"""
+from datetime import datetime, timezone
+
+import pytest
+
+from app.core.deps import get_current_customer
+
+pytestmark = [pytest.mark.anyio, pytest.mark.db]
+
+URL = "/api/v1/customer/orders/"
+
+
+class TestListMyOrders:
+    """Test keyset pages of GET /orders/"""
+
+    async def test_tied_timestamps_across_page_boundaries(self, make, override, walk_pages):
+        customer = await make.user()
+        restaurant = await make.restaurant(await make.city(), await make.user())
+        tied = datetime(2026, 5, 1, 12, 0, tzinfo=timezone.utc)
+        orders = [await make.order(restaurant, customer, created_at=tied) for _ in range(5)]
+        await make.order(restaurant, await make.user(), created_at=tied)  # someone else's
+        override(get_current_customer, customer)
+
+        pages = await walk_pages(URL, limit=2)
+
+        ids = [item["id"] for page in pages for item in page["items"]]
+        assert ids == sorted((o.id for o in orders), reverse=True)
+        assert [len(page["items"]) for page in pages] == [2, 2, 1]
+
+    async def test_amounts_in_currency_units(self, make, override, client):
+        customer = await make.user()
+        restaurant = await make.restaurant(await make.city(), await make.user())
+        await make.order(restaurant, customer, subtotal=1250, total=1605)
+        override(get_current_customer, customer)
+
+        item = (await client.get(URL)).json()["items"][0]
+
+        assert (item["subtotal"], item["total"]) == (12.5, 16.05)
+
+    async def test_invalid_cursor(self, make, override, client):
+        override(get_current_customer, await make.user())
+
+        response = await client.get(URL, params={"cursor": "garbage!"})
+
+        assert response.status_code == 400
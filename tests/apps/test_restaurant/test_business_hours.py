@@ -0,0 +1,67 @@
+"""
+Tests for restaurant business hours
+Run with: TEST_DATABASE_URL=... pytest tests/apps/test_restaurant/test_business_hours.py
+"""
+import pytest
+from sqlalchemy import func, select
+
+from app.core.deps import get_current_restaurant_owner
+from app.models.restaurant import BusinessHour
+
+pytestmark = [pytest.mark.anyio, pytest.mark.db]
+
+MONDAY = {"day_of_week": 0, "open_time": "09:00", "close_time": "21:00"}
+TUESDAY = {"day_of_week": 1, "open_time": "10:00", "close_time": "22:00"}
+
+URL = "/api/v1/restaurant/business-hours"
+
+
+@pytest.fixture
+async def restaurant(make, override):
+    owner = await make.user()
+    override(get_current_restaurant_owner, owner)
+    return await make.restaurant(await make.city(), owner)
+
+
+class TestBusinessHourConflicts:
+    """Test the (restaurant_id, weekday) uniqueness guards"""
+
+    async def test_create(self, client, restaurant):
+        response = await client.post(f"{URL}/restaurant/{restaurant.id}", json=MONDAY)
+
+        assert response.status_code == 201
+        assert response.json() | {"id": 0} == {
+            "id": 0, "restaurant_id": restaurant.id, "day_of_week": 0,
+            "open_time": "09:00:00", "close_time": "21:00:00"
+        }
+
+    async def test_duplicate_day_is_rejected(self, client, restaurant, db_session):
+        url = f"{URL}/restaurant/{restaurant.id}"
+        await client.post(url, json=MONDAY)
+
+        response = await client.post(url, json=MONDAY | {"open_time": "08:00"})
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Business hours already exist for this day"
+        count = await db_session.scalar(
+            select(func.count()).where(BusinessHour.restaurant_id == restaurant.id)
+        )
+        assert count == 1
+
+    async def test_update_onto_taken_day_is_rejected(self, client, restaurant):
+        url = f"{URL}/restaurant/{restaurant.id}"
+        await client.post(url, json=MONDAY)
+        tuesday_id = (await client.post(url, json=TUESDAY)).json()["id"]
+
+        response = await client.patch(f"{URL}/{tuesday_id}", json=MONDAY)
+
+        assert response.status_code == 400
+        days = [h["day_of_week"] for h in (await client.get(url)).json()]
+        assert days == [0, 1]
+
+    async def test_other_owners_restaurant(self, client, make):
+        other = await make.restaurant(await make.city(), await make.user())
+
+        response = await client.post(f"{URL}/restaurant/{other.id}", json=MONDAY)
+
+        assert response.status_code == 403
@@ -0,0 +1,118 @@
+"""
+Tests for restaurant order endpoints
+Run with: pytest tests/apps/test_restaurant/test_orders.py
+"""
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+from app.api.apps.restaurant.orders import OrderResponse, _render_orders
+from app.core.deps import get_current_restaurant_owner
+from app.models.order import OrderStatus, OrderType
+
+
+def _order(**kwargs):
+    values = dict(
+        id=1, customer_name="Ann", customer_phone="+490001", customer_address=None,
+        order_type=OrderType.delivery, status=OrderStatus.created,
+        subtotal=1250, total=1605, created_at=datetime(2026, 1, 2, tzinfo=timezone.utc)
+    )
+    return SimpleNamespace(**(values | kwargs))
+
+
+class TestOrderMoneyOutput:
+    """Stored cents are rendered as currency units"""
+
+    def test_list_renders_euros(self):
+        body = orjson.loads(_render_orders([_order()]))
+        assert body[0]["subtotal"] == 12.5
+        assert body[0]["total"] == 16.05
+
+    def test_revalidation_does_not_rescale(self):
+        """response_model validates the returned model again; cents stay cents"""
+        order = OrderResponse.model_validate(_order())
+        again = OrderResponse.model_validate(order.model_dump())
+        assert again.total == 1605
+        assert orjson.loads(again.model_dump_json())["total"] == 16.05
+
+
+@pytest.mark.anyio
+@pytest.mark.db
+class TestOrderEndpointsMoney:
+    """Test restaurant order endpoints return currency units"""
+
+    async def test_list_and_detail_in_euros(self, client, make, override):
+        owner = await make.user()
+        restaurant = await make.restaurant(await make.city(), owner)
+        order = await make.order(restaurant, await make.user(), subtotal=1250, total=1605)
+        override(get_current_restaurant_owner, owner)
+
+        listed = await client.get(f"/api/v1/restaurant/orders/restaurant/{restaurant.id}")
+        detail = await client.get(f"/api/v1/restaurant/orders/{order.id}")
+
+        assert listed.status_code == 200
+        assert [(o["subtotal"], o["total"]) for o in listed.json()] == [(12.5, 16.05)]
+        assert detail.status_code == 200
+        assert (detail.json()["subtotal"], detail.json()["total"]) == (12.5, 16.05)
+
+
+@pytest.mark.anyio
+@pytest.mark.db
+class TestOrderTransitions:
+    """Test the guarded UPDATE ... RETURNING status transitions"""
+
+    @pytest.fixture
+    async def owned(self, make, override):
+        owner = await make.user()
+        override(get_current_restaurant_owner, owner)
+        restaurant = await make.restaurant(await make.city(), owner)
+
+        async def _order(status):
+            return await make.order(restaurant, await make.user(), status=status)
+
+        return _order
+
+    async def test_confirm(self, client, owned, db_session):
+        order = await owned(OrderStatus.created)
+
+        response = await client.post(f"/api/v1/restaurant/orders/{order.id}/confirm")
+
+        assert response.status_code == 200
+        await db_session.refresh(order)
+        assert order.status == OrderStatus.confirmed
+
+    @pytest.mark.parametrize("action, status, detail", [
+        ("confirm", OrderStatus.confirmed, "Order cannot be confirmed"),
+        ("preparing", OrderStatus.created, "Order must be confirmed first"),
+        ("ready", OrderStatus.confirmed, "Order must be preparing first"),
+        ("cancel", OrderStatus.delivered, "Order cannot be cancelled"),
+        ("cancel", OrderStatus.cancelled, "Order cannot be cancelled"),
+    ])
+    async def test_wrong_status_is_rejected_unchanged(
+        self, client, owned, db_session, action, status, detail
+    ):
+        order = await owned(status)
+
+        response = await client.post(f"/api/v1/restaurant/orders/{order.id}/{action}")
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == detail
+        await db_session.refresh(order)
+        assert order.status == status
+
+    async def test_other_owners_order(self, client, owned, make, db_session):
+        foreign = await make.order(
+            await make.restaurant(await make.city(), await make.user()), await make.user()
+        )
+
+        response = await client.post(f"/api/v1/restaurant/orders/{foreign.id}/confirm")
+
+        assert response.status_code == 403
+        await db_session.refresh(foreign)
+        assert foreign.status == OrderStatus.created
+
+    async def test_missing_order(self, client, owned):
+        response = await client.post("/api/v1/restaurant/orders/999999999/confirm")
+        assert response.status_code == 404
@@ -0,0 +1,55 @@
+"""
+Tests for rider delivery endpoints
+Run with: TEST_DATABASE_URL=... pytest tests/apps/test_rider/test_deliveries.py
+"""
+import pytest
+
+from app.core.deps import get_current_driver_profile
+from app.models.driver import Shift
+from app.models.order import OrderStatus
+
+pytestmark = [pytest.mark.anyio, pytest.mark.db]
+
+
+async def _ready_order(make):
+    restaurant = await make.restaurant(await make.city(), await make.user())
+    return await make.order(restaurant, await make.user(), status=OrderStatus.ready, distance_km=2.5)
+
+
+class TestAcceptDelivery:
+    """Test POST /deliveries/accept/{order_id}"""
+
+    async def test_accept_on_shift(self, client, make, override, db_session):
+        driver = await make.driver()
+        await make.add(Shift(driver_id=driver.id))
+        order = await _ready_order(make)
+        override(get_current_driver_profile, driver)
+
+        response = await client.post(f"/api/v1/rider/deliveries/accept/{order.id}")
+
+        assert response.status_code == 201
+        await db_session.refresh(order)
+        assert order.status == OrderStatus.assigned
+
+    async def test_rejects_driver_without_open_shift(self, client, make, override, db_session):
+        driver = await make.driver()
+        order = await _ready_order(make)
+        override(get_current_driver_profile, driver)
+
+        response = await client.post(f"/api/v1/rider/deliveries/accept/{order.id}")
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Driver not available"
+        await db_session.refresh(order)
+        assert order.status == OrderStatus.ready
+
+    async def test_rejects_inactive_driver(self, client, make, override):
+        driver = await make.driver(is_active=False)
+        await make.add(Shift(driver_id=driver.id))
+        order = await _ready_order(make)
+        override(get_current_driver_profile, driver)
+
+        response = await client.post(f"/api/v1/rider/deliveries/accept/{order.id}")
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Driver not available"
@@ -0,0 +1,70 @@
+"""
+Tests for the rider earnings summary
+Run with: TEST_DATABASE_URL=... pytest tests/apps/test_rider/test_earnings.py
+"""
+from datetime import datetime, timezone
+
+import pytest
+
+from app.config import settings
+from app.core.deps import get_current_driver_profile
+from app.models.driver import Delivery
+from app.models.order import OrderStatus
+
+pytestmark = [pytest.mark.anyio, pytest.mark.db]
+
+
+async def _delivery(make, driver, *, delivered: bool, earning: int | None = None, distance_km=2.0):
+    owner = await make.user()
+    restaurant = await make.restaurant(await make.city(), owner)
+    order = await make.order(restaurant, await make.user(), status=OrderStatus.picked_up)
+    now = datetime.now(timezone.utc)
+    return await make.add(Delivery(
+        order_id=order.id, driver_id=driver.id, distance_km=distance_km, picked_at=now,
+        delivered_at=now if delivered else None, driver_earning=earning
+    ))
+
+
+class TestEarningsSummary:
+    """Test GET /earnings/summary"""
+
+    async def test_sums_completed_deliveries_only(self, client, make, override):
+        driver = await make.driver()
+        other = await make.driver()
+        await _delivery(make, driver, delivered=True, earning=30)
+        await _delivery(make, driver, delivered=True, earning=50)
+        await _delivery(make, driver, delivered=False)
+        await _delivery(make, other, delivered=True, earning=1000)
+        override(get_current_driver_profile, driver)
+
+        response = await client.get("/api/v1/rider/earnings/summary")
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "total_deliveries": 2,
+            "total_earnings": 0.8,
+            "average_per_delivery": 0.4
+        }
+
+    async def test_no_deliveries(self, client, make, override):
+        override(get_current_driver_profile, await make.driver())
+
+        response = await client.get("/api/v1/rider/earnings/summary")
+
+        assert response.json() == {
+            "total_deliveries": 0, "total_earnings": 0.0, "average_per_delivery": 0.0
+        }
+
+    async def test_matches_earning_reported_on_delivery(self, client, make, override):
+        """The summary aggregates what the deliver endpoint stored and returned"""
+        driver = await make.driver()
+        delivery = await _delivery(make, driver, delivered=False, distance_km=3.0)
+        override(get_current_driver_profile, driver)
+
+        delivered = await client.post(f"/api/v1/rider/deliveries/{delivery.id}/deliver")
+        summary = await client.get("/api/v1/rider/earnings/summary")
+
+        assert delivered.status_code == 200
+        earning = delivered.json()["earning"]
+        assert earning == round(3.0 * settings.BIKE_PAY_PER_KM, 2)
+        assert summary.json()["total_earnings"] == earning
@@ -0,0 +1,158 @@
+"""
+Tests for scoped order endpoints
+Run with: TEST_DATABASE_URL=... pytest tests/test_api/test_orders_rbac.py
+"""
+from datetime import datetime, timezone
+
+import pytest
+
+from app.core.deps import get_current_user
+from app.core.rbac_deps import get_current_user_scopes
+from app.models.order import OrderStatus
+from app.services.rbac_service import UserScopes
+
+pytestmark = [pytest.mark.anyio, pytest.mark.db]
+
+URL = "/api/v1/orders-rbac/"
+
+
+@pytest.fixture
+async def city_orders(make, override):
+    """Five orders in one city sharing a timestamp, plus a newer one; viewer is super admin"""
+    admin = await make.user()
+    override(get_current_user, admin)
+    override(get_current_user_scopes, UserScopes(user_id=admin.id, is_super_admin=True))
+
+    restaurant = await make.restaurant(await make.city(), await make.user())
+    customer = await make.user()
+    tied = datetime(2026, 5, 1, 12, 0, tzinfo=timezone.utc)
+    orders = [await make.order(restaurant, customer, created_at=tied) for _ in range(5)]
+    orders.append(await make.order(restaurant, customer, created_at=datetime(2026, 5, 2, tzinfo=timezone.utc)))
+    return restaurant, orders
+
+
+class TestListOrdersScopedPages:
+    """Test keyset pages of GET /orders-rbac/"""
+
+    async def test_tied_timestamps_across_page_boundaries(self, city_orders, walk_pages):
+        restaurant, orders = city_orders
+
+        pages = await walk_pages(URL, city_id=restaurant.city_id, limit=2)
+
+        ids = [item["id"] for page in pages for item in page["items"]]
+        newest = orders[-1].id
+        tied_desc = sorted((o.id for o in orders[:-1]), reverse=True)
+        assert ids == [newest, *tied_desc]
+        assert [len(page["items"]) for page in pages] == [2, 2, 2]
+        assert pages[-1]["next_cursor"] is None
+
+    async def test_invalid_cursor(self, city_orders, client):
+        response = await client.get(URL, params={"cursor": "garbage!"})
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid cursor"
+
+
+@pytest.fixture
+async def staff(make, override):
+    """Act as a user with one role in one city: staff(role_code) -> (user, city)"""
+    async def _staff(role_code: str):
+        user, city = await make.user(), await make.city()
+        override(get_current_user, user)
+        override(get_current_user_scopes, UserScopes(
+            user_id=user.id,
+            role_codes=frozenset({role_code}),
+            city_ids=frozenset({city.id}),
+            role_scope_ids={role_code: frozenset({city.id})},
+        ))
+        return user, city
+
+    return _staff
+
+
+async def _order_in(make, city, **kwargs):
+    restaurant = await make.restaurant(city, await make.user())
+    return await make.order(restaurant, await make.user(), **kwargs)
+
+
+class TestAssignRider:
+    """Test the guarded UPDATE of PATCH /orders-rbac/{id}/assign-rider"""
+
+    async def test_assigns_ready_order(self, staff, make, client, db_session):
+        _, city = await staff("dispatcher")
+        order = await _order_in(make, city, status=OrderStatus.ready)
+        rider = await make.user()
+
+        response = await client.patch(f"{URL}{order.id}/assign-rider", params={"rider_id": rider.id})
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "assigned"
+        await db_session.refresh(order)
+        assert (order.rider_id, order.status) == (rider.id, OrderStatus.assigned)
+
+    async def test_order_outside_cities(self, staff, make, client, db_session):
+        await staff("dispatcher")
+        order = await _order_in(make, await make.city(), status=OrderStatus.ready)
+        rider = await make.user()
+
+        response = await client.patch(f"{URL}{order.id}/assign-rider", params={"rider_id": rider.id})
+
+        assert response.status_code == 403
+        await db_session.refresh(order)
+        assert (order.rider_id, order.status) == (None, OrderStatus.ready)
+
+    async def test_missing_rider(self, staff, make, client, db_session):
+        _, city = await staff("dispatcher")
+        order = await _order_in(make, city, status=OrderStatus.ready)
+
+        response = await client.patch(f"{URL}{order.id}/assign-rider", params={"rider_id": 999999999})
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Rider not found"
+        await db_session.refresh(order)
+        assert order.status == OrderStatus.ready
+
+    async def test_missing_order(self, staff, make, client):
+        await staff("dispatcher")
+        rider = await make.user()
+
+        response = await client.patch(f"{URL}999999999/assign-rider", params={"rider_id": rider.id})
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Order not found"
+
+
+class TestRefund:
+    """Test the guarded UPDATE of POST /orders-rbac/{id}/refund"""
+
+    async def test_refunds_once(self, staff, make, client):
+        _, city = await staff("support")
+        order = await _order_in(make, city, status=OrderStatus.delivered, total=1605)
+
+        first = await client.post(f"{URL}{order.id}/refund", params={"reason": "cold"})
+        second = await client.post(f"{URL}{order.id}/refund", params={"reason": "cold"})
+
+        assert first.status_code == 200
+        assert first.json()["amount"] == 16.05
+        assert second.status_code == 400
+        assert second.json()["detail"] == "Order already refunded"
+
+    async def test_order_not_finished(self, staff, make, client, db_session):
+        _, city = await staff("support")
+        order = await _order_in(make, city, status=OrderStatus.preparing)
+
+        response = await client.post(f"{URL}{order.id}/refund", params={"reason": "late"})
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Can only refund delivered or cancelled orders"
+        await db_session.refresh(order)
+        assert order.status == OrderStatus.preparing
+
+    async def test_order_outside_cities(self, staff, make, client, db_session):
+        await staff("support")
+        order = await _order_in(make, await make.city(), status=OrderStatus.delivered)
+
+        response = await client.post(f"{URL}{order.id}/refund", params={"reason": "cold"})
+
+        assert response.status_code == 403
+        await db_session.refresh(order)
+        assert order.status == OrderStatus.delivered
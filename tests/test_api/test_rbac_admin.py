@@ -0,0 +1,117 @@
+"""
+Tests for RBAC admin endpoints
+Run with: TEST_DATABASE_URL=... pytest tests/test_api/test_rbac_admin.py
+"""
+from datetime import datetime
+
+import pytest
+from sqlalchemy import func, select
+
+from app.core.deps import get_current_user
+from app.core.rbac_deps import get_current_user_scopes
+from app.models.rbac import ShiftLead, UserRole as UserRoleModel
+from app.services import role_service
+from app.services.rbac_service import UserScopes
+
+pytestmark = [pytest.mark.anyio, pytest.mark.db]
+
+
+@pytest.fixture
+async def admin(make, override):
+    """A super admin as the current user"""
+    user = await make.user()
+    override(get_current_user, user)
+    override(get_current_user_scopes, UserScopes(user_id=user.id, is_super_admin=True))
+    return user
+
+
+@pytest.fixture
+async def city_role(make, monkeypatch):
+    """A city-scoped role, visible to the in-process active-role map"""
+    role = await make.role()
+    monkeypatch.setattr(role_service, "_active_roles", (float("inf"), {role.code: role}))
+    return role
+
+
+class TestAssignUserRole:
+    """Test POST /user-roles and its ON CONFLICT guard"""
+
+    async def test_duplicate_active_assignment_is_rejected(
+        self, make, admin, city_role, client, db_session
+    ):
+        target, city = await make.user(), await make.city()
+        body = {"user_id": target.id, "role_code": city_role.code, "city_id": city.id}
+
+        first = await client.post("/api/v1/rbac/user-roles", json=body)
+        second = await client.post("/api/v1/rbac/user-roles", json=body)
+
+        assert first.status_code == 201
+        assert second.status_code == 400
+        assert second.json()["detail"] == "Role already assigned with this scope"
+        active = await db_session.scalar(
+            select(func.count())
+            .where(UserRoleModel.user_id == target.id, UserRoleModel.is_active)
+        )
+        assert active == 1
+
+    async def test_other_scope_and_reassign_after_revoke(self, make, admin, city_role, client):
+        target, city, other_city = await make.user(), await make.city(), await make.city()
+        body = {"user_id": target.id, "role_code": city_role.code, "city_id": city.id}
+
+        first = await client.post("/api/v1/rbac/user-roles", json=body)
+        other = await client.post("/api/v1/rbac/user-roles", json=body | {"city_id": other_city.id})
+        revoked = await client.delete(f"/api/v1/rbac/user-roles/{first.json()['user_role_id']}")
+        again = await client.post("/api/v1/rbac/user-roles", json=body)
+
+        assert (first.status_code, other.status_code) == (201, 201)
+        assert revoked.status_code == 200
+        assert again.status_code == 201
+
+
+class TestPageEndpoints:
+    """Test the keyset-paginated /page variants"""
+
+    async def test_user_roles_tied_assigned_at(self, make, admin, walk_pages):
+        role = await make.role()
+        city = await make.city()
+        tied = datetime(2026, 5, 1, 12, 0)
+        assignments = [
+            await make.add(UserRoleModel(
+                user_id=(await make.user()).id, role_id=role.id, city_id=city.id,
+                assigned_by=admin.id, assigned_at=tied, is_active=True
+            ))
+            for _ in range(5)
+        ]
+
+        pages = await walk_pages("/api/v1/rbac/user-roles/page", city_id=city.id, limit=2)
+
+        ids = [item["id"] for page in pages for item in page["items"]]
+        assert ids == sorted((a.id for a in assignments), reverse=True)
+        assert [len(page["items"]) for page in pages] == [2, 2, 1]
+
+    async def test_cities_by_name_with_separator(self, make, admin, walk_pages):
+        names = ["Aa|1", "Aa|2", "Ab", "Ac|", "Ad"]
+        for i, name in enumerate(names):
+            await make.city(name=name, code=f"PG{i}")
+
+        pages = await walk_pages("/api/v1/rbac/cities/page", limit=2)
+
+        listed = [item["name"] for page in pages for item in page["items"]]
+        assert [n for n in listed if n in names] == sorted(names)
+
+    async def test_shift_leads(self, make, admin, walk_pages):
+        city = await make.city()
+        leads = [
+            await make.add(ShiftLead(user_id=(await make.user()).id, city_id=city.id, is_active=True))
+            for _ in range(3)
+        ]
+
+        pages = await walk_pages("/api/v1/rbac/shift-leads/page", city_id=city.id, limit=2)
+
+        ids = [item["id"] for page in pages for item in page["items"]]
+        assert ids == [lead.id for lead in leads]
+
+    @pytest.mark.parametrize("path", ["user-roles/page", "cities/page", "shift-leads/page"])
+    async def test_invalid_cursor(self, admin, client, path):
+        response = await client.get(f"/api/v1/rbac/{path}", params={"cursor": "garbage!"})
+        assert response.status_code == 400
@@ -0,0 +1,47 @@
+"""
+Tests for keyset pagination cursors
+Run with: pytest tests/test_core/test_pagination.py
+"""
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.pagination import encode_cursor, decode_cursor
+
+
+class TestCursorRoundTrip:
+    """Test encode_cursor / decode_cursor"""
+
+    def test_timestamp_and_id(self):
+        ts = datetime(2026, 3, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+        assert decode_cursor(encode_cursor(ts, 42), datetime, int) == (ts, 42)
+
+    def test_single_int(self):
+        assert decode_cursor(encode_cursor(7), int) == (7,)
+
+    def test_cursor_is_url_safe(self):
+        cursor = encode_cursor("??>>~~", 1)
+        assert set(cursor) <= set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_")
+
+    @pytest.mark.parametrize("name", ["Foo|Bar", "|", "a||b|", "Zürich"])
+    def test_name_with_separator(self, name):
+        assert decode_cursor(encode_cursor(name), str) == (name,)
+        assert decode_cursor(encode_cursor(name, 3), str, int) == (name, 3)
+
+
+class TestInvalidCursor:
+    """Malformed cursors are a 400, never a 500"""
+
+    @pytest.mark.parametrize("cursor", [
+        "not base64!",
+        encode_cursor("abc", 1),             # timestamp part is not a datetime
+        encode_cursor(datetime(2026, 1, 1), "x"),  # id part is not an int
+        encode_cursor(5),                    # too few parts
+        "//8",                               # not UTF-8
+    ])
+    def test_rejected(self, cursor):
+        with pytest.raises(HTTPException) as exc:
+            decode_cursor(cursor, datetime, int)
+        assert exc.value.status_code == 400
+        assert exc.value.detail == "Invalid cursor"
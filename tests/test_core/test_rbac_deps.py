@@ -0,0 +1,71 @@
+"""
+Tests for the RBAC scopes cache
+Run with: pytest tests/test_core/test_rbac_deps.py
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from app.core import rbac_deps
+from app.services.rbac_service import UserScopes
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    """Count get_user_scopes calls; each returns fresh scopes"""
+    calls = []
+
+    async def fake_get_user_scopes(session, user_id):
+        calls.append(user_id)
+        return UserScopes(user_id=user_id, role_codes=frozenset({"dispatcher"}))
+
+    monkeypatch.setattr(rbac_deps, "get_user_scopes", fake_get_user_scopes)
+    rbac_deps._scopes_cache.clear()
+    yield calls
+    rbac_deps._scopes_cache.clear()
+
+
+async def _scopes_for(user_id: int) -> UserScopes:
+    return await rbac_deps.get_current_user_scopes(SimpleNamespace(id=user_id), None, None)
+
+
+class TestLocalScopesCache:
+    """Test the in-process fallback used without Redis"""
+
+    async def test_hit_skips_reload(self, loads):
+        await _scopes_for(1)
+        await _scopes_for(1)
+        assert loads == [1]
+
+    async def test_revoke_invalidates_user(self, loads):
+        await _scopes_for(1)
+        await _scopes_for(2)
+
+        await rbac_deps.invalidate_user_scopes(None, 1)
+        await _scopes_for(1)
+        await _scopes_for(2)
+
+        assert loads == [1, 2, 1]
+
+    async def test_invalidate_everyone(self, loads):
+        await _scopes_for(1)
+        await _scopes_for(2)
+
+        await rbac_deps.invalidate_user_scopes(None)
+        await _scopes_for(1)
+        await _scopes_for(2)
+
+        assert loads == [1, 2, 1, 2]
+
+
+def test_scopes_round_trip_through_cache_payload():
+    scopes = UserScopes(
+        user_id=7,
+        city_ids=frozenset({3, 1}),
+        restaurant_ids=frozenset({9}),
+        role_codes=frozenset({"city_admin", "restaurant_admin"}),
+        role_scope_ids={"city_admin": frozenset({3, 1}), "restaurant_admin": frozenset({9})},
+    )
+    assert rbac_deps._load_scopes(rbac_deps._dump_scopes(scopes)) == scopes
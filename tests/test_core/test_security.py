@@ -0,0 +1,46 @@
+"""
+Tests for password hashing limits
+Run with: pytest tests/test_core/test_security.py
+"""
+import pytest
+from pydantic import ValidationError
+
+from app.config import settings
+from app.core.security import BCRYPT_MAX_PASSWORD_BYTES, hash_password, verify_password
+from app.schemas.auth import SignupIn
+
+
+def _signup(password: str) -> SignupIn:
+    return SignupIn(email="a@example.com", password=password, first_name="A", last_name="B")
+
+
+class TestSignupPasswordLength:
+    """New passwords must fit bcrypt's 72-byte input"""
+
+    def test_limit_is_accepted(self):
+        assert _signup("x" * BCRYPT_MAX_PASSWORD_BYTES).password == "x" * 72
+
+    def test_longer_is_rejected(self):
+        with pytest.raises(ValidationError, match="at most 72 bytes"):
+            _signup("x" * (BCRYPT_MAX_PASSWORD_BYTES + 1))
+
+    def test_counts_bytes_not_characters(self):
+        with pytest.raises(ValidationError):
+            _signup("é" * 37)  # 37 characters, 74 bytes
+
+
+class TestPasswordHash:
+    """Test hash_password / verify_password"""
+
+    @pytest.fixture(autouse=True)
+    def fast_rounds(self, monkeypatch):
+        monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 4)
+
+    def test_round_trip_at_limit(self):
+        password = "p" * BCRYPT_MAX_PASSWORD_BYTES
+        hashed = hash_password(password)
+        assert verify_password(password, hashed)
+        assert not verify_password("p" * 71, hashed)
+
+    def test_malformed_hash(self):
+        assert not verify_password("secret", "not-a-bcrypt-hash")
@@ -0,0 +1,41 @@
+"""
+Tests for order pricing
+Run with: pytest tests/test_services/test_pricing_service.py
+"""
+import pytest
+
+from app.config import settings
+from app.services.pricing_service import Quote
+
+
+@pytest.fixture(autouse=True)
+def fees(monkeypatch):
+    monkeypatch.setattr(settings, "SERVICE_FEE_RATE", 0.10)
+    monkeypatch.setattr(settings, "DELIVERY_BASE_FEE", 2.00)
+    monkeypatch.setattr(settings, "DELIVERY_PER_KM_FEE", 0.60)
+
+
+class TestQuote:
+    """Test Quote amounts, all in integer cents"""
+
+    def test_delivery(self):
+        quote = Quote(subtotal=1999, distance_km=3.5, order_type="delivery")
+        assert quote.subtotal == 1999
+        assert quote.service_fee == 200
+        assert quote.delivery_fee == 410
+        assert quote.total == 1999 + 200 + 410
+
+    def test_pickup_has_no_delivery_fee(self):
+        quote = Quote(subtotal=1000, distance_km=3.5, order_type="pickup")
+        assert quote.delivery_fee == 0
+        assert quote.total == 1100
+
+    def test_delivery_without_distance_has_no_delivery_fee(self):
+        quote = Quote(subtotal=1000, distance_km=None, order_type="delivery")
+        assert quote.delivery_fee == 0
+        assert quote.total == 1100
+
+    def test_amounts_are_ints(self):
+        quote = Quote(subtotal=1234, distance_km=1.37, order_type="delivery")
+        amounts = (quote.subtotal, quote.service_fee, quote.delivery_fee, quote.total)
+        assert all(type(amount) is int for amount in amounts)
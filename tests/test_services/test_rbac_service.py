@@ -0,0 +1,47 @@
+"""
+Tests for UserScopes capability checks
+Run with: pytest tests/test_services/test_rbac_service.py
+"""
+from app.models.rbac import RoleCode
+from app.services.rbac_service import UserScopes
+
+
+def _scopes(**role_scope_ids: set[int]) -> UserScopes:
+    """Build scopes the way get_user_scopes does, from role code -> ids"""
+    city_roles = {RoleCode.CITY_ADMIN, RoleCode.DISPATCHER, RoleCode.SUPPORT, RoleCode.SHIFT_LEAD}
+    return UserScopes(
+        user_id=1,
+        role_codes=frozenset(role_scope_ids),
+        city_ids=frozenset().union(*(ids for code, ids in role_scope_ids.items() if code in city_roles)),
+        restaurant_ids=frozenset().union(*(ids for code, ids in role_scope_ids.items() if code not in city_roles)),
+        role_scope_ids={code: frozenset(ids) for code, ids in role_scope_ids.items()},
+    )
+
+
+class TestUserScopesCan:
+    """Test UserScopes.can capability + scope checks"""
+
+    def test_restaurant_admin_with_city_role_cannot_approve_other_restaurants(self):
+        """A city role without the capability does not widen a restaurant admin's reach"""
+        scopes = _scopes(restaurant_admin={9}, dispatcher={5})
+        assert scopes.can("restaurant.approve", city_id=5, restaurant_id=9)
+        assert not scopes.can("restaurant.approve", city_id=5, restaurant_id=42)
+        assert not scopes.can("restaurant.view", city_id=5, restaurant_id=42)
+
+    def test_restaurant_admin_and_city_admin_use_each_roles_scope(self):
+        """Each role grants its capabilities only on its own assignments"""
+        scopes = _scopes(restaurant_admin={9}, city_admin={5})
+        assert scopes.can("restaurant.approve", city_id=7, restaurant_id=9)
+        assert scopes.can("restaurant.approve", city_id=5, restaurant_id=42)
+        assert not scopes.can("restaurant.approve", city_id=7, restaurant_id=42)
+        assert scopes.can("restaurant.toggle_active", city_id=5)
+        assert not scopes.can("restaurant.toggle_active", city_id=7)
+
+    def test_capability_without_object(self):
+        """Without an object only the capability itself is checked"""
+        assert _scopes(restaurant_admin={9}).can("restaurant.approve")
+        assert not _scopes(dispatcher={5}).can("restaurant.approve")
+
+    def test_super_admin_can_everything(self):
+        scopes = UserScopes(user_id=1, is_super_admin=True)
+        assert scopes.can("restaurant.approve", city_id=1, restaurant_id=1)
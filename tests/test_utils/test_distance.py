@@ -0,0 +1,41 @@
+"""
+Tests for distance helpers
+Run with: pytest tests/test_utils/test_distance.py
+"""
+from math import cos, radians, sin, asin, degrees
+
+import pytest
+
+from app.utils.distance import EARTH_RADIUS_KM, bounding_box, haversine_km
+
+
+def _destination(lat, lon, bearing_deg, distance_km):
+    """Point distance_km from (lat, lon) along a bearing (great circle)"""
+    angle = distance_km / EARTH_RADIUS_KM
+    lat_r, lon_r, b = radians(lat), radians(lon), radians(bearing_deg)
+    lat2 = asin(sin(lat_r) * cos(angle) + cos(lat_r) * sin(angle) * cos(b))
+    lon2 = lon_r + asin(sin(b) * sin(angle) / cos(lat2))
+    return degrees(lat2), degrees(lon2)
+
+
+class TestBoundingBox:
+    """Test bounding_box against points on the radius"""
+
+    @pytest.mark.parametrize("lat, lon", [(52.52, 13.405), (-33.87, 151.21), (64.1, -21.9)])
+    def test_contains_every_point_on_the_circle(self, lat, lon):
+        radius = 25.0
+        min_lat, max_lat, min_lon, max_lon = bounding_box(lat, lon, radius)
+        for bearing in range(0, 360, 5):
+            plat, plon = _destination(lat, lon, bearing, radius * 0.999)
+            assert haversine_km(lat, lon, plat, plon) < radius
+            assert min_lat <= plat <= max_lat
+            assert min_lon <= plon <= max_lon
+
+    def test_box_is_tight(self):
+        min_lat, max_lat, min_lon, max_lon = bounding_box(52.52, 13.405, 5.0)
+        assert max_lat - min_lat == pytest.approx(2 * 5.0 / 111.19, rel=1e-3)
+        assert max_lon - min_lon < 0.2
+
+    def test_no_lon_bounds_near_pole_or_antimeridian(self):
+        assert bounding_box(89.99, 0.0, 10.0)[2:] == (None, None)
+        assert bounding_box(0.0, 179.99, 10.0)[2:] == (None, None)
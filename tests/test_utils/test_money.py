@@ -0,0 +1,36 @@
+"""
+Tests for money helpers
+Run with: pytest tests/test_utils/test_money.py
+"""
+from decimal import Decimal
+
+import pytest
+
+from app.utils.money import to_cents
+
+
+class TestToCents:
+    """Test to_cents conversion and rounding"""
+
+    @pytest.mark.parametrize("amount, cents", [
+        (Decimal("12.34"), 1234),
+        ("12.34", 1234),
+        (12.34, 1234),
+        (7, 700),
+        (0, 0),
+    ])
+    def test_converts_amounts(self, amount, cents):
+        assert to_cents(amount) == cents
+
+    @pytest.mark.parametrize("amount, cents", [
+        (Decimal("1.005"), 101),
+        ("0.125", 13),
+        (2.675, 268),  # binary float is 2.67499..., rounded from its repr
+        (Decimal("1.004"), 100),
+        (Decimal("-1.005"), -101),
+    ])
+    def test_rounds_half_up(self, amount, cents):
+        assert to_cents(amount) == cents
+
+    def test_returns_int(self):
+        assert type(to_cents("9.99")) is int